@@ -0,0 +1,291 @@
+"""
+Headless benchmark runner
+
+Drives the real GameManager loop through the scripted scenarios and reports
+frame time percentiles, allocation counts and sprite counts as JSON.
+
+Run from the repository root:
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --baseline results.json
+"""
+import os
+import sys
+import gc
+import json
+import math
+import time
+import random
+import logging
+import argparse
+import platform
+import subprocess
+import contextlib
+import tracemalloc
+
+# Render to an off-screen display unless a window was explicitly requested
+if '--windowed' not in sys.argv:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.utils.constants import FPS
+from src.utils.config import parse_args as parse_game_args
+from src.game.game_manager import GameManager
+from src.utils import diagnostics
+from benchmarks.scenarios import SCENARIOS, SCENARIOS_BY_NAME
+
+logger = logging.getLogger('bee_shooter.benchmarks')
+
+# Sprite groups sampled every frame
+SPRITE_GROUPS = ['all_sprites', 'bees', 'bullets', 'missiles_group', 'powerups', 'explosions']
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, int(math.ceil(pct / 100.0 * len(ordered))) - 1)
+    return ordered[index]
+
+
+def summarize(values):
+    """Mean, median, tail percentiles and maximum of a list of samples"""
+    if not values:
+        return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+    return {
+        'mean': sum(values) / len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': max(values),
+    }
+
+
+class BenchmarkClock:
+    """Stand-in for pygame.time.Clock that measures and scripts the game loop
+
+    GameManager.run calls tick() once at the top of every frame, so the time
+    between two ticks is exactly one frame of game work. Before handing control
+    back, the clock feeds the scenario's scripted input for the next frame and,
+    after the last measured frame, posts QUIT so run() returns.
+
+    Args:
+        game: GameManager being measured
+        scenario: Scenario providing the scripted input
+        frames: Number of measured frames
+        warmup: Number of unmeasured frames run first
+        paced: Sleep to the game's frame rate like a real session
+    """
+    def __init__(self, game, scenario, frames, warmup, paced=True):
+        self.game = game
+        self.scenario = scenario
+        self.frames = frames
+        self.warmup = warmup
+        self.paced = paced
+        self.clock = pygame.time.Clock()
+        self.frame = -1
+        self.last_time = None
+        self.last_blocks = 0
+        self.gc_start = None
+        self.frame_times = []
+        self.alloc_blocks = []
+        self.sprite_counts = {name: [] for name in SPRITE_GROUPS}
+
+    def tick(self, framerate=0):
+        """Record the frame that just finished and script the next one"""
+        now = time.perf_counter()
+        blocks = sys.getallocatedblocks()
+
+        if self.last_time is not None and self.frame >= self.warmup:
+            self.frame_times.append((now - self.last_time) * 1000.0)
+            self.alloc_blocks.append(blocks - self.last_blocks)
+            for name in SPRITE_GROUPS:
+                self.sprite_counts[name].append(len(getattr(self.game, name)))
+
+        self.frame += 1
+        if self.frame == self.warmup:
+            self.gc_start = [stats['collections'] for stats in gc.get_stats()]
+            diagnostics.reset()
+
+        if self.frame >= self.warmup + self.frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        else:
+            self.scenario.before_frame(self.game, self.frame)
+
+        if self.paced:
+            self.clock.tick(framerate)
+
+        self.last_blocks = sys.getallocatedblocks()
+        self.last_time = time.perf_counter()
+        return 0
+
+    def get_fps(self):
+        return self.clock.get_fps()
+
+    def gc_collections(self):
+        """Collections per generation during the measured frames"""
+        if self.gc_start is None:
+            return [0, 0, 0]
+        return [stats['collections'] - start
+                for stats, start in zip(gc.get_stats(), self.gc_start)]
+
+
+def run_scenario(scenario, options):
+    """Run one scenario in a fresh, seeded game and return its report"""
+    frames = options.frames or scenario.frames
+
+    game_argv = list(scenario.game_args)
+    if options.no_sound:
+        game_argv.append('--no-sound')
+    if options.precise_collisions:
+        game_argv.append('--precise-collisions')
+    random.seed(options.seed)
+    game = GameManager(parse_game_args(game_argv))
+    game.finish_loading()
+    scenario.prepare(game)
+
+    clock = BenchmarkClock(game, scenario, frames, options.warmup, paced=not options.uncapped)
+    game.clock = clock
+
+    if options.tracemalloc:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    game.run()
+    wall_time = time.perf_counter() - started
+
+    report = {
+        'description': scenario.description,
+        'frames': len(clock.frame_times),
+        'wall_time_s': wall_time,
+        'frame_time_ms': summarize(clock.frame_times),
+        'allocations': {
+            'blocks_per_frame': summarize(clock.alloc_blocks),
+            'gc_collections': clock.gc_collections(),
+        },
+        'sprites': {name: {'mean': sum(counts) / len(counts) if counts else 0,
+                           'max': max(counts) if counts else 0}
+                    for name, counts in clock.sprite_counts.items()},
+        'diagnostics': diagnostics.snapshot(),
+    }
+
+    if options.tracemalloc:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report['allocations']['tracemalloc_peak_kb'] = peak / 1024.0
+
+    pygame.quit()
+    return report
+
+
+def build_info():
+    """Describe the build and machine the numbers were taken on"""
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                         stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    try:
+        with open('VERSION') as f:
+            version = f.read().strip()
+    except OSError:
+        version = None
+
+    return {
+        'version': version,
+        'commit': commit,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'video_driver': os.environ.get('SDL_VIDEODRIVER', 'default'),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages against a baseline report"""
+    regressions = []
+    for name, report in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        for metric in ('mean', 'p95', 'p99'):
+            old = previous['frame_time_ms'][metric]
+            new = report['frame_time_ms'][metric]
+            if old > 0 and new > old * (1.0 + tolerance):
+                regressions.append("%s: %s frame time %.2fms -> %.2fms (+%.0f%%)"
+                                   % (name, metric, old, new, (new / old - 1.0) * 100))
+    return regressions
+
+
+def parse_args(argv=None):
+    """Parse benchmark runner arguments"""
+    parser = argparse.ArgumentParser(description='Bee Shooter benchmark runner')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS_BY_NAME),
+                        help='Scenario to run (repeatable, default: all)')
+    parser.add_argument('--list', action='store_true', help='List scenarios and exit')
+    parser.add_argument('--frames', type=int, help='Measured frames per scenario')
+    parser.add_argument('--warmup', type=int, default=30, help='Unmeasured frames per scenario')
+    parser.add_argument('--seed', type=int, default=1234, help='Random seed for every scenario')
+    parser.add_argument('--uncapped', action='store_true',
+                        help='Do not sleep to the game frame rate between frames')
+    parser.add_argument('--no-sound', action='store_true', help='Run with the sound system disabled')
+    parser.add_argument('--precise-collisions', action='store_true',
+                        help='Run with pixel-accurate collisions')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='Also report tracemalloc peak (slows every frame down)')
+    parser.add_argument('--windowed', action='store_true', help='Open a real window')
+    parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+    parser.add_argument('--baseline', help='Earlier JSON report to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Allowed frame time increase over the baseline (default 0.10)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the selected scenarios and report the results"""
+    options = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr,
+                        format='%(name)s - %(levelname)s - %(message)s')
+
+    if options.list:
+        for scenario in SCENARIOS:
+            print("%-22s %4d frames  %s" % (scenario.name, scenario.frames, scenario.description))
+        return 0
+
+    names = options.scenario or [scenario.name for scenario in SCENARIOS]
+    results = {'build': build_info(), 'fps_target': FPS, 'seed': options.seed,
+               'paced': not options.uncapped, 'scenarios': {}}
+
+    # The game prints to stdout, keep it free for the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        for name in names:
+            logger.warning("Running scenario %s", name)
+            report = run_scenario(SCENARIOS_BY_NAME[name], options)
+            results['scenarios'][name] = report
+            timing = report['frame_time_ms']
+            sys.stderr.write("%-22s mean %6.2fms  p95 %6.2fms  p99 %6.2fms  sprites max %d\n"
+                             % (name, timing['mean'], timing['p95'], timing['p99'],
+                                report['sprites']['all_sprites']['max']))
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, options.tolerance)
+        for message in regressions:
+            sys.stderr.write("REGRESSION %s\n" % message)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Scripted benchmark scenarios
+
+Each scenario puts a freshly created GameManager into a fixed state and then
+feeds it the same input every run, so frame times can be compared between builds.
+The game's cooldowns are measured in milliseconds; scenarios that depend on
+them expire them on a fixed frame cadence instead, so paced and --uncapped
+runs launch, attack and bomb on the same frames.
+"""
+import pygame
+from src.utils.constants import WEAPON_LEVEL_5, MISSILE_LEVEL_4
+from src.utils.definitions import LEVEL_THRESHOLDS
+from src.effects.victory_effect import VictoryEffect
+from src.game.input_state import ACTION_BOMB
+from src.game.timers import frames_for
+
+
+def post_key(key):
+    """Queue a KEYDOWN event as if the key had just been pressed"""
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+
+
+def cooldown_stamp(frame, delay):
+    """Return a last-use time that lets a delay-ms cooldown expire only every frames_for(delay) frames
+
+    Assigned before every frame, the cooldown has expired on frames 0, n, 2n...
+    and is running on all the others, however fast the frames actually are.
+    """
+    now = pygame.time.get_ticks()
+    if frame % frames_for(delay) == 0:
+        return now - delay - 1
+    return now
+
+
+class Scenario:
+    """A named, scripted benchmark run
+
+    Args:
+        name: Scenario name used in reports
+        description: One-line description of what is exercised
+        frames: Default number of measured frames
+        setup: Callable(game) run once before the first frame
+        frame_hook: Callable(game, frame) run before every frame
+        game_args: Extra game command line arguments, e.g. ['--stress', ...]
+    """
+    def __init__(self, name, description, frames=600, setup=None, frame_hook=None, game_args=None):
+        self.name = name
+        self.description = description
+        self.frames = frames
+        self.game_args = game_args or []
+        self.setup = setup
+        self.frame_hook = frame_hook
+
+    def prepare(self, game):
+        """Apply the scenario's starting state to a new game"""
+        # Scripted runs must never end early on a bee collision
+        game.invulnerable = True
+        if self.setup:
+            self.setup(game)
+
+    def before_frame(self, game, frame):
+        """Feed the scripted input for the upcoming frame"""
+        if self.frame_hook:
+            self.frame_hook(game, frame)
+
+
+def _setup_weapon_level_5(game):
+    game.player.weapon_level = WEAPON_LEVEL_5
+    game.player.shoot_delay = 150
+
+
+def _fire(game, frame):
+    post_key(pygame.K_SPACE)
+
+
+def _setup_missile_barrage(game):
+    game.player.missile_level = MISSILE_LEVEL_4
+    game.player.missiles = 10 ** 6
+
+
+def _launch_missiles(game, frame):
+    game.player.last_missile = cooldown_stamp(frame, game.player.missile_delay)
+    post_key(pygame.K_m)
+
+
+def _setup_bomb_clear(game):
+    game.player.bombs = 10 ** 6
+
+
+def _drop_bomb(game, frame):
+    # Every 31 frames, just past the 500ms bomb debounce and cooldown at 60 FPS
+    if frame % 31 == 0:
+        game.input.last_press.pop(ACTION_BOMB, None)
+        game.player.last_bomb = pygame.time.get_ticks() - game.player.bomb_delay
+        post_key(pygame.K_b)
+
+
+def _setup_boss_swarm(game):
+    game.current_level = 3
+    game.spawn_bees_for_level(game.current_level)
+    # Crossing the threshold spawns the level 3 boss on the first frame
+    game.score = LEVEL_THRESHOLDS[game.current_level - 1]
+
+
+def _boss_attacks(game, frame):
+    # The boss appears during frame 0 and attacks from frame 1 on, once per cooldown
+    if game.boss is not None and frame > 0:
+        game.boss.last_attack = cooldown_stamp(frame - 1, game.boss.attack_cooldown)
+
+
+def _game_over_and_restart(game, frame):
+    # End the game, then press Enter on the next frame
+    if frame % 60 == 0:
+        game.game_over = True
+    elif frame % 60 == 1:
+        post_key(pygame.K_RETURN)
+
+
+def _setup_victory(game):
+    game.victory = True
+    victory_effect = VictoryEffect()
+    game.all_sprites.add(victory_effect)
+    game.effects.add(victory_effect)
+
+
+SCENARIOS = [
+    Scenario("idle_level_1", "Level 1 with no player input"),
+    Scenario("weapon_level_5_fire", "Weapon level 5 with sustained fire",
+             setup=_setup_weapon_level_5, frame_hook=_fire),
+    Scenario("missile_barrage", "Missile level 4 homing barrage every cooldown",
+             setup=_setup_missile_barrage, frame_hook=_launch_missiles),
+    Scenario("bomb_clear", "Bomb dropped as often as the debounce allows",
+             setup=_setup_bomb_clear, frame_hook=_drop_bomb),
+    Scenario("boss_swarm_level_3", "Level 3 boss spawning its swarm",
+             setup=_setup_boss_swarm, frame_hook=_boss_attacks),
+    # The victory effect lasts 180 frames
+    Scenario("victory_screen", "Victory screen celebration effect",
+             frames=180, setup=_setup_victory),
+    Scenario("restart", "Game over followed by Enter every 60 frames",
+             frame_hook=_game_over_and_restart),
+    Scenario("stress_1000_bees", "Stress mode with 1000 bees, 500 bullets, 50 missiles, 100 power-ups",
+             game_args=['--stress', 'bees=1000,bullets=500,missiles=50,powerups=100,curve=instant']),
+]
+
+SCENARIOS_BY_NAME = {scenario.name: scenario for scenario in SCENARIOS}
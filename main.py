@@ -4,8 +4,15 @@ Retro Bee Shooter Game - Main Entry Point
 """
 import sys
 import logging
-from src.game.game_manager import GameManager
-from src.utils.config import parse_args, setup_logging
+from src.utils import startup_profile
+
+with startup_profile.phase('import pygame'):
+    import pygame
+
+with startup_profile.phase('import game modules'):
+    from src.game.game_manager import GameManager
+    from src.utils.config import parse_args, setup_logging
+    from src.utils import hotlog
 
 def main():
     """Main entry point for the game"""
@@ -14,20 +21,28 @@ def main():
     
     # Setup logging
     logger = setup_logging(args)
+    exit_status = 0
     
     try:
         # Create and run game
         game = GameManager(args)
         game.run()
+
+        # With --profile-startup the game stops once loading has finished
+        if args.profile_startup:
+            print("\n".join(startup_profile.format_report()))
+            if startup_profile.over_budget():
+                exit_status = 1
     except Exception as e:
         logger.error("Error in game: %s", str(e), exc_info=True)
+        hotlog.dump(logger)
         print(f"\nERROR: {str(e)}\n")
         import traceback
         traceback.print_exc()
         print("\nThe game encountered an error. Check game_debug.log for details.")
     finally:
         logger.info("Game shutting down")
-        sys.exit()
+        sys.exit(exit_status)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,328 @@
+"""
+Scrolling background
+
+The starfield is endless: it is made of seamless square chunks generated on
+demand as the scroll position moves. Each chunk is drawn from a random
+generator seeded by the world seed and the chunk's position, so the same spot
+always looks the same, and nothing repeats. Chunks are generated on a worker
+thread, for the view ahead of the scroll direction before they are needed,
+and kept in an LRU cache limited by a memory budget; draw() blits only the
+chunks on screen, with a plain gradient standing in for any not ready yet.
+"""
+import math
+import random
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from src.utils.constants import WHITE
+
+logger = logging.getLogger('bee_shooter.background')
+
+# Chunk (tile) edge length in pixels
+TILE_SIZE = 256
+
+# The vertical gradient repeats every this many rows of tiles
+GRADIENT_BANDS = 4
+GRADIENT_PERIOD = GRADIENT_BANDS * TILE_SIZE
+
+# Pixel memory the chunk cache may hold; enough for a screen plus the prefetched chunks
+CHUNK_BUDGET_BYTES = 12 * 1024 * 1024
+
+# Rows and columns of chunks generated ahead of the scroll direction
+PREFETCH_CHUNKS = 1
+
+# Stars stay this far inside the tile edges, so neighbouring tiles never cut one in half
+STAR_MARGIN = 10
+
+# Stars per tile (the old 800x800 star pattern's density)
+DISTANT_STARS = 30
+MEDIUM_STARS = 5
+BRIGHT_STARS = 1
+
+# Chance of a tile holding a nebula, and its size range
+NEBULA_CHANCE = 0.3
+NEBULA_SIZES = (80, TILE_SIZE - 2 * STAR_MARGIN)
+
+# Nebula colors, with emphasis on reds
+NEBULA_COLORS = [
+    (80, 30, 70, 3),   # Purple
+    (70, 30, 80, 3),   # Blue-purple
+    (30, 50, 80, 3),   # Blue
+    (120, 30, 30, 3),   # Red
+    (150, 40, 30, 3),   # Bright red
+    (100, 30, 20, 3),   # Dark red
+    (130, 50, 30, 3),   # Red-orange
+    (140, 30, 40, 3)    # Red-purple
+]
+NEBULA_WEIGHTS = [1, 1, 1, 3, 3, 3, 3, 3]
+
+
+def gradient_color(y):
+    """Return the dark blue gradient color of a background row, repeating every GRADIENT_PERIOD"""
+    gradient_factor = (math.sin(2 * math.pi * y / GRADIENT_PERIOD) + 1) / 2  # Oscillates between 0 and 1
+    color_value = int(15 + 10 * gradient_factor)  # Range from 15 to 25
+    return (color_value // 3, color_value // 3, color_value)
+
+
+def draw_stars(surf, rng):
+    """Scatter distant, medium and bright stars over a tile, away from its edges"""
+    low = STAR_MARGIN
+    high = surf.get_width() - STAR_MARGIN
+
+    # Distant stars (small, various brightness)
+    for _ in range(DISTANT_STARS):
+        x = rng.randrange(low, high)
+        y = rng.randrange(low, high)
+        brightness = rng.randrange(100, 256)
+        radius = rng.randrange(1, 3) / 2  # Smaller stars
+        pygame.draw.circle(surf, (brightness, brightness, brightness), (x, y), radius)
+
+    # Medium stars (slightly larger, with glow)
+    for _ in range(MEDIUM_STARS):
+        x = rng.randrange(low, high)
+        y = rng.randrange(low, high)
+        brightness = rng.randrange(180, 256)
+        radius = rng.randrange(1, 3)
+        pygame.draw.circle(surf, (brightness, brightness, brightness), (x, y), radius)
+
+        # Add subtle glow
+        glow_color = (brightness // 4, brightness // 4, brightness // 3)
+        pygame.draw.circle(surf, glow_color, (x, y), radius + 1, 1)
+
+    # Bright stars with lens flare
+    for _ in range(BRIGHT_STARS):
+        x = rng.randrange(low, high)
+        y = rng.randrange(low, high)
+        pygame.draw.circle(surf, WHITE, (x, y), 2)
+
+        # Add cross-shaped lens flare
+        flare_length = rng.randrange(4, 8)
+        pygame.draw.line(surf, (100, 100, 150), (x - flare_length, y), (x + flare_length, y))
+        pygame.draw.line(surf, (100, 100, 150), (x, y - flare_length), (x, y + flare_length))
+
+
+def radial_fade(size):
+    """Return a white mask whose alpha fades from opaque at 70% of the radius to 0 at the edge"""
+    mask = pygame.Surface((size, size), pygame.SRCALPHA)
+    mask.fill((255, 255, 255, 0))
+    center = (size // 2, size // 2)
+    radius = size / 2
+    inner = int(radius * 0.7)
+
+    # Filled circles from the edge inwards, each one more opaque than the last
+    for r in range(int(radius), inner, -1):
+        fade_factor = max(0, 1.0 - (r / radius - 0.7) / 0.3)
+        pygame.draw.circle(mask, (255, 255, 255, int(255 * fade_factor)), center, r)
+    pygame.draw.circle(mask, (255, 255, 255, 255), center, inner)
+    return mask
+
+
+def create_nebula(size, rng):
+    """Return a faint nebula surface that fades to transparent towards its edge"""
+    nebula = pygame.Surface((size, size), pygame.SRCALPHA)
+    nebula_color = rng.choices(NEBULA_COLORS, weights=NEBULA_WEIGHTS, k=1)[0]
+
+    # Draw the nebula as a series of transparent circles with gaussian distribution
+    center_x, center_y = size // 2, size // 2
+    for _ in range(100):
+        # Use gaussian distribution to concentrate circles near the center
+        nx = int(rng.gauss(center_x, size / 6))
+        ny = int(rng.gauss(center_y, size / 6))
+
+        # Skip if outside the surface
+        if nx < 0 or nx >= size or ny < 0 or ny >= size:
+            continue
+
+        # Size also follows gaussian distribution - larger near center
+        dist_from_center = math.sqrt((nx - center_x)**2 + (ny - center_y)**2)
+        max_radius = max(6, size // 4 * (1 - dist_from_center / (size / 2)))  # Ensure at least 6 for valid range
+        nr = rng.randrange(5, int(max_radius))
+
+        pygame.draw.circle(nebula, nebula_color, (nx, ny), nr)
+
+    # Fade to transparent from 70% of the radius outwards, with rings drawn
+    # into a mask instead of adjusting every pixel
+    nebula.blit(radial_fade(size), (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return nebula
+
+
+def create_gradient_tile(top, size=TILE_SIZE):
+    """Return a tile holding only the dark space gradient, drawn one line at a time"""
+    surf = pygame.Surface((size, size))
+    for y in range(size):
+        pygame.draw.line(surf, gradient_color(top + y), (0, y), (size, y))
+    return surf
+
+
+def create_tile(top, rng, size=TILE_SIZE):
+    """Return one background tile
+
+    Args:
+        top: Background row of the tile's first line, which sets its part of the gradient
+        rng: random.Random for the star and nebula layout
+        size: Tile edge length
+    """
+    surf = create_gradient_tile(top, size)
+
+    # Nebulae sit behind the stars and fade out before the tile edges
+    if rng.random() < NEBULA_CHANCE:
+        nebula_size = rng.randrange(*NEBULA_SIZES)
+        low = STAR_MARGIN
+        high = size - STAR_MARGIN - nebula_size
+        surf.blit(create_nebula(nebula_size, rng), (rng.randint(low, high), rng.randint(low, high)))
+
+    draw_stars(surf, rng)
+    return surf
+
+
+class ChunkedBackground:
+    """Endless background generated chunk by chunk as it scrolls into view
+
+    Args:
+        seed: World seed; a chunk always looks the same for the same seed
+        budget_bytes: Pixel memory the chunk cache may hold
+        chunk_size: Chunk edge length in pixels
+    """
+    def __init__(self, seed, budget_bytes=CHUNK_BUDGET_BYTES, chunk_size=TILE_SIZE):
+        self.seed = seed
+        self.budget_bytes = budget_bytes
+        self.chunk_size = chunk_size
+        self.chunks = OrderedDict()  # (column, row) -> Surface, least recently drawn first
+        self.size_bytes = 0
+        self.pending = {}  # (column, row) -> Future of a chunk being generated
+        self.placeholders = {}  # Gradient position -> gradient-only tile
+        self.executor = None
+        self.last_scroll = None
+        self.stats = {'generated': 0, 'evicted': 0, 'placeholders': 0}
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def generate_chunk(self, column, row):
+        """Generate one chunk (safe on a worker thread)"""
+        rng = random.Random("%d:%d:%d" % (self.seed, column, row))
+        return create_tile(row * self.chunk_size, rng, self.chunk_size)
+
+    def view_keys(self, scroll_x, scroll_y, width, height):
+        """Return the (column, row) of every chunk covering a view"""
+        size = self.chunk_size
+        x = int(scroll_x)
+        y = int(scroll_y)
+        return [(column, row)
+                for row in range(y // size, (y + height - 1) // size + 1)
+                for column in range(x // size, (x + width - 1) // size + 1)]
+
+    def generate_view(self, scroll_x, scroll_y, width, height):
+        """Generate the chunks covering a view, e.g. on a loader worker; hand the result to add_chunks()"""
+        return {key: self.generate_chunk(*key) for key in self.view_keys(scroll_x, scroll_y, width, height)}
+
+    def add_chunks(self, chunks):
+        """Convert generated chunks to the display format and cache them (main thread only)"""
+        for key, chunk in chunks.items():
+            self._store(key, chunk)
+        self._evict(0)
+
+    def _store(self, key, chunk):
+        chunk = chunk.convert()
+        old = self.chunks.pop(key, None)
+        if old is not None:
+            self.size_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        self.chunks[key] = chunk
+        self.size_bytes += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+        self.stats['generated'] += 1
+
+    def _evict(self, keep):
+        """Drop least recently drawn chunks while over budget, keeping the newest keep"""
+        while self.size_bytes > self.budget_bytes and len(self.chunks) > keep:
+            _, chunk = self.chunks.popitem(last=False)
+            self.size_bytes -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+            self.stats['evicted'] += 1
+
+    def request(self, key):
+        """Queue a chunk for generation on the worker, unless it is cached or queued"""
+        if key in self.chunks or key in self.pending:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='background-chunks')
+        self.pending[key] = self.executor.submit(self.generate_chunk, *key)
+
+    def poll(self):
+        """Cache the chunks the worker has finished (main thread only)"""
+        for key, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[key]
+            try:
+                chunk = future.result()
+            except Exception as e:
+                logger.error("Generating background chunk %s failed: %s", key, e, exc_info=True)
+                continue
+            self._store(key, chunk)
+
+    def placeholder(self, row):
+        """Return the gradient-only tile drawn for a chunk of a row that is not generated yet"""
+        top = row * self.chunk_size % GRADIENT_PERIOD
+        tile = self.placeholders.get(top)
+        if tile is None:
+            tile = self.placeholders[top] = create_gradient_tile(top, self.chunk_size).convert()
+        return tile
+
+    def draw(self, surface, scroll_x, scroll_y, offset=(0, 0)):
+        """Blit the chunks that cover the surface, requesting missing and upcoming ones
+
+        Args:
+            surface: Surface to draw on
+            scroll_x, scroll_y: Scroll position; the world point at the surface's top left
+            offset: Extra (x, y) shift, e.g. screen shake
+        """
+        self.poll()
+
+        size = self.chunk_size
+        width, height = surface.get_size()
+        origin_x = int(scroll_x) - offset[0]
+        origin_y = int(scroll_y) - offset[1]
+        first_column = origin_x // size
+        first_row = origin_y // size
+        last_column = (origin_x + width - 1) // size
+        last_row = (origin_y + height - 1) // size
+
+        blits = []
+        for row in range(first_row, last_row + 1):
+            y = row * size - origin_y
+            for column in range(first_column, last_column + 1):
+                key = (column, row)
+                chunk = self.chunks.get(key)
+                if chunk is None:
+                    self.request(key)
+                    chunk = self.placeholder(row)
+                    self.stats['placeholders'] += 1
+                else:
+                    # Visible chunks are the most recently used
+                    self.chunks.move_to_end(key)
+                blits.append((chunk, (column * size - origin_x, y)))
+        surface.blits(blits, False)
+
+        # Generate the chunks about to scroll into view, on the side the view is moving to
+        if self.last_scroll is not None:
+            dx = int(scroll_x) - self.last_scroll[0]
+            dy = int(scroll_y) - self.last_scroll[1]
+            ahead_first_column = first_column - PREFETCH_CHUNKS if dx < 0 else first_column
+            ahead_last_column = last_column + PREFETCH_CHUNKS if dx > 0 else last_column
+            ahead_first_row = first_row - PREFETCH_CHUNKS if dy < 0 else first_row
+            ahead_last_row = last_row + PREFETCH_CHUNKS if dy > 0 else last_row
+            for row in range(ahead_first_row, ahead_last_row + 1):
+                for column in range(ahead_first_column, ahead_last_column + 1):
+                    self.request((column, row))
+        self.last_scroll = (int(scroll_x), int(scroll_y))
+
+        self._evict((last_column - first_column + 1) * (last_row - first_row + 1))
+
+    def close(self):
+        """Drop queued chunk requests and stop the worker"""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
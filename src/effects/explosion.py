@@ -5,28 +5,73 @@ import pygame
 import random
 from src.utils.constants import ORANGE, YELLOW, WHITE
 from src.utils.resources import load_image
+from src.utils import diagnostics
+
+# Animation frames by explosion size, shared by every explosion of that size
+_frames = {}
+
+
+def explosion_frames(size=None, frame_count=9):
+    """Return the animation frames for an explosion size, building them on first use
+
+    Frame 0 is the base image; the explosion grows to 1.5 times its size over
+    the first half and shrinks back while fading out over the second half.
+    """
+    frames = _frames.get(size)
+    if frames is not None:
+        return frames
+
+    image = load_image("explosion")
+    diagnostics.count_surface('explosion')
+
+    # Scale explosion if size is specified
+    if size:
+        image = pygame.transform.scale(image, (size, size))
+        diagnostics.count_surface('explosion_scale')
+
+    current_size = image.get_width()
+    max_size = current_size * 1.5
+    frames = [image]
+    for frame in range(1, frame_count):
+        # Calculate new size based on frame
+        if frame < frame_count // 2:
+            # Expand
+            progress = frame / (frame_count // 2)
+            new_size = int(current_size + (max_size - current_size) * progress)
+        else:
+            # Contract
+            progress = (frame - frame_count // 2) / (frame_count // 2)
+            new_size = int(max_size - (max_size - current_size) * progress)
+
+        scaled = pygame.transform.scale(image, (new_size, new_size))
+        diagnostics.count_surface('explosion_scale')
+
+        # Adjust transparency based on frame
+        if frame > frame_count * 0.7:
+            # Fade out towards the end
+            alpha = int(255 * (1 - (frame - frame_count * 0.7) / (frame_count * 0.3)))
+            scaled.set_alpha(alpha)
+        frames.append(scaled)
+
+    _frames[size] = frames
+    return frames
+
 
 class Explosion(pygame.sprite.Sprite):
     """Explosion animation effect"""
+    __slots__ = ('frames', 'image', 'rect', 'frame', 'frame_rate', 'last_update', 'frame_count')
+
     def __init__(self, center, size=None):
         super(Explosion, self).__init__()
-        self.image = load_image("explosion")
-
-        # Scale explosion if size is specified
-        if size:
-            self.image = pygame.transform.scale(self.image, (size, size))
+        self.frame_count = 9  # Total number of frames
+        self.frames = explosion_frames(size, self.frame_count)
+        self.image = self.frames[0]
 
         self.rect = self.image.get_rect()
         self.rect.center = center
         self.frame = 0
         self.frame_rate = 50  # ms per frame
         self.last_update = pygame.time.get_ticks()
-        self.frame_count = 9  # Total number of frames
-
-        # Store original image for scaling
-        self.original_image = self.image.copy()
-        self.current_size = self.image.get_width()
-        self.max_size = self.current_size * 1.5
 
     def update(self):
         """Update explosion animation"""
@@ -41,28 +86,8 @@ class Explosion(pygame.sprite.Sprite):
             if self.frame >= self.frame_count:
                 self.kill()
             else:
-                # Calculate new size based on frame
-                if self.frame < self.frame_count // 2:
-                    # Expand
-                    progress = self.frame / (self.frame_count // 2)
-                    new_size = int(self.current_size + (self.max_size - self.current_size) * progress)
-                else:
-                    # Contract
-                    progress = (self.frame - self.frame_count // 2) / (self.frame_count // 2)
-                    new_size = int(self.max_size - (self.max_size - self.current_size) * progress)
-
-                # Keep track of center
+                # Switch to the shared frame, keeping the center
                 center = self.rect.center
-
-                # Scale the image
-                self.image = pygame.transform.scale(self.original_image, (new_size, new_size))
-
-                # Update rect and center
+                self.image = self.frames[self.frame]
                 self.rect = self.image.get_rect()
                 self.rect.center = center
-
-                # Adjust transparency based on frame
-                if self.frame > self.frame_count * 0.7:
-                    # Fade out towards the end
-                    alpha = int(255 * (1 - (self.frame - self.frame_count * 0.7) / (self.frame_count * 0.3)))
-                    self.image.set_alpha(alpha)
@@ -5,6 +5,7 @@ import pygame
 import random
 import math
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, YELLOW, WHITE, ORANGE, LIGHT_BLUE
+from src.utils import diagnostics
 
 class VictoryEffect(pygame.sprite.Sprite):
     """Visual effect for victory celebration"""
@@ -65,16 +66,19 @@ class VictoryEffect(pygame.sprite.Sprite):
 
         # Draw victory text
         font = pygame.font.Font(None, 72)
+        diagnostics.count_surface('font')
         text = font.render("CONGRATULATIONS!", True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//3))
         self.image.blit(text, text_rect)
 
         font = pygame.font.Font(None, 48)
+        diagnostics.count_surface('font')
         text = font.render("You have defeated all bosses!", True, YELLOW)
         text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         self.image.blit(text, text_rect)
 
         font = pygame.font.Font(None, 36)
+        diagnostics.count_surface('font')
         text = font.render("Press ENTER to play again", True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH//2, 2*SCREEN_HEIGHT//3))
         self.image.blit(text, text_rect)
@@ -5,113 +5,57 @@ import pygame
 import random
 import math
 from src.utils.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, YELLOW, ORANGE, RED, PURPLE, GREY,
+    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, YELLOW, RED, GREY,
     ENEMY_LEVEL_1, ENEMY_LEVEL_2, ENEMY_LEVEL_3, ENEMY_LEVEL_4
 )
 from src.utils.resources import load_image
+from src.utils import diagnostics
+from src.game.timers import frames_for
+from src.game.spawn_director import random_bee_level
+from src.utils.definitions import DEFINITIONS
+
+# Frames a bee stays white after a hit
+FLASH_FRAMES = frames_for(100)
+
+
+class BeeType:
+    """Per-level bee data shared by every bee of that level, including its images
+
+    Args:
+        record: BeeRecord from the definitions file
+    """
+    __slots__ = ('level', 'health', 'speed_factor', 'points', 'color', 'size', 'drop_chance',
+                 'drop_weights', 'movement_pattern', 'wing_delay', 'images')
+
+    def __init__(self, record):
+        self.level = record.level
+        self.health = record.health
+        self.speed_factor = record.speed_factor
+        self.points = record.points
+        self.color = record.color
+        self.size = record.size
+        self.drop_chance = record.drop_chance
+        self.drop_weights = record.drop_weights
+        self.movement_pattern = record.movement_pattern
+        self.wing_delay = record.wing_delay  # Frames between wing state changes
+        self.images = {}  # (wing state, flashed) -> Surface
+
+    def image(self, wing_state, flashed=False):
+        """Return the shared image for a wing state, drawing it on first use"""
+        key = (wing_state, flashed)
+        image = self.images.get(key)
+        if image is None:
+            image = self.images[key] = self.create_image(wing_state, WHITE if flashed else self.color)
+        return image
 
-class Bee(pygame.sprite.Sprite):
-    """Bee class for enemies"""
-    def __init__(self, level=None):
-        super(Bee, self).__init__()
-
-        # Initialize wing state variables first to avoid attribute errors
-        self.wing_state = 0  # 0: wings up, 1: wings middle, 2: wings down
-        self.wing_timer = 0
-        self.wing_delay = 5  # Frames between wing state changes
-
-        # Randomly choose level if not specified, with more higher level enemies
-        if level is None:
-            # Level distribution: 40% level 1, 30% level 2, 20% level 3, 10% level 4
-            # (Changed from 60/25/10/5 to 40/30/20/10 - more higher level enemies)
-            level_choices = [ENEMY_LEVEL_1] * 40 + [ENEMY_LEVEL_2] * 30 + [ENEMY_LEVEL_3] * 20 + [ENEMY_LEVEL_4] * 10
-            self.level = random.choice(level_choices)
-        else:
-            self.level = level
-
-        # Faster wing flapping for higher level bees
-        if self.level >= ENEMY_LEVEL_3:
-            self.wing_delay = 3  # Elite and Queen bees flap wings faster
-
-        # Set properties based on level
-        if self.level == ENEMY_LEVEL_1:
-            # Basic bee (increased speed from 1.0 to 1.2)
-            self.health = 1
-            self.speed_factor = 1.2
-            self.points = 10
-            self.color = YELLOW
-            self.size = 1.0
-            self.drop_chance = 0.10  # 10% chance to drop power-up
-            self.drop_weights = {"weapon_upgrade": 3, "bomb": 2, "missile": 2, "missile_upgrade": 3}  # 30% weapon, 20% bomb, 20% missile, 30% missile upgrade
-        elif self.level == ENEMY_LEVEL_2:
-            # Soldier bee (increased speed from 1.2 to 1.4)
-            self.health = 2
-            self.speed_factor = 1.4
-            self.points = 20
-            self.color = ORANGE
-            self.size = 1.2
-            self.drop_chance = 0.15  # 15% chance to drop power-up
-            self.drop_weights = {"weapon_upgrade": 3, "bomb": 2, "missile": 2, "missile_upgrade": 3}  # 30% weapon, 20% bomb, 20% missile, 30% missile upgrade
-        elif self.level == ENEMY_LEVEL_3:
-            # Elite bee (increased speed from 1.3 to 1.6)
-            self.health = 3
-            self.speed_factor = 1.6
-            self.points = 30
-            self.color = RED
-            self.size = 1.4
-            self.drop_chance = 0.20  # 20% chance to drop power-up
-            self.drop_weights = {"weapon_upgrade": 3, "bomb": 2, "missile": 2, "missile_upgrade": 3}  # 30% weapon, 20% bomb, 20% missile, 30% missile upgrade
-        elif self.level == ENEMY_LEVEL_4:
-            # Queen bee (increased speed from 0.9 to 1.1)
-            self.health = 5
-            self.speed_factor = 1.1
-            self.points = 50
-            self.color = PURPLE
-            self.size = 1.8
-            self.drop_chance = 0.30  # 30% chance to drop power-up
-            self.drop_weights = {"weapon_upgrade": 3, "bomb": 2, "missile": 2, "missile_upgrade": 3}  # 30% weapon, 20% bomb, 20% missile, 30% missile upgrade
-
-        # Create the base image
-        self.base_image = self.create_bee_image()
-        self.image = self.base_image
-        self.rect = self.image.get_rect()
-
-        # Position - ensure width is valid before using it
-        if self.rect.width > 0:
-            self.rect.x = random.randrange(SCREEN_WIDTH - self.rect.width)
-        else:
-            self.rect.x = random.randrange(SCREEN_WIDTH - 30)  # Use default width
-        self.rect.y = random.randrange(-100, -40)
-
-        # Movement - reduced speed range for lower difficulty
-        base_speedy = random.randrange(1, 3)  # Reduced from (2,4) to (1,3)
-        base_speedx = random.randrange(-1, 2)  # Reduced from (-2,3) to (-1,2)
-
-        # Apply speed factor with a lower maximum cap
-        self.speedy = min(base_speedy * self.speed_factor, 3.0)  # Reduced cap from 5.0 to 3.0
-        self.speedx = max(min(base_speedx * self.speed_factor, 2.0), -2.0)  # Reduced cap from 3.0 to 2.0
-
-        # Special movement patterns for higher level bees
-        self.movement_pattern = "straight"  # Default pattern
-        self.movement_timer = 0
-        self.angle = 0  # For circular movement
-
-        # Higher level bees have special movement patterns
-        if self.level == ENEMY_LEVEL_3:
-            # Elite bees have zigzag movement
-            self.movement_pattern = "zigzag"
-        elif self.level == ENEMY_LEVEL_4:
-            # Queen bees have circular movement
-            self.movement_pattern = "circle"
-
-    def create_bee_image(self):
-        # Pass wing_state to the method
+    def create_image(self, wing_state, color):
         """Create the bee image based on level and size with evil cartoon style"""
         # Base size is 30x30, scaled by self.size
         width = int(30 * self.size)
         height = int(30 * self.size)
 
         image = pygame.Surface((width, height), pygame.SRCALPHA)
+        diagnostics.count_surface('bee_image')
 
         # Body - more oval shaped for cartoon look
         body_width = int(width * 0.45)
@@ -122,7 +66,7 @@ class Bee(pygame.sprite.Sprite):
             body_width * 2,
             body_height
         )
-        pygame.draw.ellipse(image, self.color, body_rect)
+        pygame.draw.ellipse(image, color, body_rect)
 
         # Add body outline for cartoon effect
         pygame.draw.ellipse(image, BLACK, body_rect, max(1, int(width * 0.03)))
@@ -153,13 +97,13 @@ class Bee(pygame.sprite.Sprite):
         wing_offset_y = 0
         wing_scale_y = 1.0
 
-        if self.wing_state == 0:  # Wings up
+        if wing_state == 0:  # Wings up
             wing_offset_y = -int(height * 0.1)  # Move wings up
             wing_scale_y = 0.8  # Slightly narrower wings
-        elif self.wing_state == 1:  # Wings middle (default)
+        elif wing_state == 1:  # Wings middle (default)
             wing_offset_y = 0
             wing_scale_y = 1.0
-        elif self.wing_state == 2:  # Wings down
+        elif wing_state == 2:  # Wings down
             wing_offset_y = int(height * 0.1)  # Move wings down
             wing_scale_y = 0.8  # Slightly narrower wings
 
@@ -187,7 +131,7 @@ class Bee(pygame.sprite.Sprite):
         pygame.draw.ellipse(image, BLACK, right_wing_rect, max(1, int(width * 0.02)))
 
         # Add wing motion blur effect for faster flapping (higher level bees)
-        if self.level >= ENEMY_LEVEL_3 and self.wing_state != 1:  # Only for up and down states
+        if self.level >= ENEMY_LEVEL_3 and wing_state != 1:  # Only for up and down states
             # Semi-transparent motion blur
             blur_color = (255, 255, 255, 100)  # White with alpha
 
@@ -199,6 +143,7 @@ class Bee(pygame.sprite.Sprite):
                 wing_height
             )
             blur_surface = pygame.Surface((wing_width, wing_height), pygame.SRCALPHA)
+            diagnostics.count_surface('bee_image')
             pygame.draw.ellipse(blur_surface, blur_color,
                               (0, 0, wing_width, wing_height))
             image.blit(blur_surface, (blur_left_rect.left, blur_left_rect.top))
@@ -366,14 +311,126 @@ class Bee(pygame.sprite.Sprite):
 
         return image
 
+
+
+# Bee levels, from the definitions file
+BEE_TYPES = {level: BeeType(record) for level, record in DEFINITIONS.bees.items()}
+
+
+class Bee(pygame.sprite.Sprite):
+    """Bee class for enemies
+
+    Per-instance state lives in slots; level data and images are shared
+    through the bee's BeeType.
+    """
+    __slots__ = ('bee_type', 'level', 'health', 'wing_state', 'wing_timer', 'image', 'rect',
+                 'speedx', 'speedy', 'movement_timer', 'angle', 'swarm', 'swarm_index', 'generation',
+                 'flash_timer')
+
+    def __init__(self, level=None):
+        super(Bee, self).__init__()
+
+        # Swarm moving this bee while it is in a SwarmGroup (see src/game/swarm.py)
+        self.swarm = None
+        self.swarm_index = -1
+        self.generation = 0
+        self.flash_timer = None  # Timer ending the current hit flash
+
+        self.reset(level)
+
+    def reset(self, level=None):
+        """Set up the bee as newly spawned, so a dead bee can be reused
+
+        Args:
+            level: Bee level, or None for a random level
+        """
+        # A new life; anything still holding the bee from its last one can tell by the generation
+        self.generation += 1
+        self.cancel_flash()
+
+        # Initialize wing state variables first to avoid attribute errors
+        self.wing_state = 0  # 0: wings up, 1: wings middle, 2: wings down
+        self.wing_timer = 0
+
+        # Randomly choose level if not specified, with more higher level enemies
+        if level is None:
+            # Level distribution: 40% level 1, 30% level 2, 20% level 3, 10% level 4
+            # (Changed from 60/25/10/5 to 40/30/20/10 - more higher level enemies)
+            self.level = random_bee_level()
+        else:
+            self.level = level
+
+        # Shared properties for this level
+        self.bee_type = BEE_TYPES[self.level]
+        self.health = self.bee_type.health
+
+        # Shared image for the current wing state
+        self.image = self.bee_type.image(self.wing_state)
+        self.rect = self.image.get_rect()
+
+        # Position - ensure width is valid before using it
+        if self.rect.width > 0:
+            self.rect.x = random.randrange(SCREEN_WIDTH - self.rect.width)
+        else:
+            self.rect.x = random.randrange(SCREEN_WIDTH - 30)  # Use default width
+        self.rect.y = random.randrange(-100, -40)
+
+        # Movement - reduced speed range for lower difficulty
+        base_speedy = random.randrange(1, 3)  # Reduced from (2,4) to (1,3)
+        base_speedx = random.randrange(-1, 2)  # Reduced from (-2,3) to (-1,2)
+
+        # Apply speed factor with a lower maximum cap
+        self.speedy = min(base_speedy * self.bee_type.speed_factor, 3.0)  # Reduced cap from 5.0 to 3.0
+        self.speedx = max(min(base_speedx * self.bee_type.speed_factor, 2.0), -2.0)  # Reduced cap from 3.0 to 2.0
+
+        # Movement pattern state (zigzag for Elite, circle for Queen, see BEE_TYPES)
+        self.movement_timer = 0
+        self.angle = 0  # For circular movement
+
+    # Level data, read from the shared BeeType
+    @property
+    def speed_factor(self):
+        return self.bee_type.speed_factor
+
+    @property
+    def points(self):
+        return self.bee_type.points
+
+    @property
+    def color(self):
+        return self.bee_type.color
+
+    @property
+    def size(self):
+        return self.bee_type.size
+
+    @property
+    def drop_chance(self):
+        return self.bee_type.drop_chance
+
+    @property
+    def drop_weights(self):
+        return self.bee_type.drop_weights
+
+    @property
+    def movement_pattern(self):
+        return self.bee_type.movement_pattern
+
+    @property
+    def wing_delay(self):
+        return self.bee_type.wing_delay
+
     def update(self):
         """Update bee position and behavior"""
+        if self.swarm is not None:
+            return  # Moved by the swarm controller
+
         # Update movement timer
         self.movement_timer += 1
 
         # Update wing flapping animation
         self.wing_timer += 1
-        if self.wing_timer >= self.wing_delay:
+        if self.wing_timer >= self.bee_type.wing_delay:
             self.wing_timer = 0
             # Cycle through wing states: 0 (up) -> 1 (middle) -> 2 (down) -> 1 (middle) -> 0 (up)
             if self.wing_state == 0:
@@ -384,13 +441,13 @@ class Bee(pygame.sprite.Sprite):
             elif self.wing_state == 2:
                 self.wing_state = 1  # middle
 
-            # Recreate the bee image with the new wing state
-            self.base_image = self.create_bee_image()
-            self.image = self.base_image
+            # Switch to the shared image for the new wing state
+            self.image = self.bee_type.image(self.wing_state)
 
         # Apply special movement patterns
-        if self.movement_pattern != "straight":
-            if self.movement_pattern == "zigzag":
+        movement_pattern = self.bee_type.movement_pattern
+        if movement_pattern != "straight":
+            if movement_pattern == "zigzag":
                 # Zigzag pattern - with reduced speed caps
                 if self.movement_timer % 30 < 15:  # Switch direction every 15 frames
                     # Reduced from 2.5 to 1.5
@@ -398,7 +455,7 @@ class Bee(pygame.sprite.Sprite):
                 else:
                     self.speedx = max(-1.5, -abs(self.speedx))
 
-            elif self.movement_pattern == "circle":
+            elif movement_pattern == "circle":
                 # Circular pattern - with reduced speed caps
                 self.angle += 0.05  # Reduced from 0.08 to 0.05 for slower circular movement
                 # Reduced from 2.5 to 1.5
@@ -413,68 +470,55 @@ class Bee(pygame.sprite.Sprite):
         # If bee goes off screen, reset position
         if (self.rect.top > SCREEN_HEIGHT + 10 or
             self.rect.left < -25 or self.rect.right > SCREEN_WIDTH + 25):
+            self.respawn()
 
-            # Reset position - ensure width is valid before using it
-            if self.rect.width > 0:
-                self.rect.x = random.randrange(SCREEN_WIDTH - self.rect.width)
-            else:
-                self.rect.x = random.randrange(SCREEN_WIDTH - 30)  # Use default width
-            self.rect.y = random.randrange(-100, -40)
-
-            # Reset movement with reduced speed ranges (same as initialization)
-            base_speedy = random.randrange(1, 3)  # Reduced from (2,4) to (1,3)
-            base_speedx = random.randrange(-1, 2)  # Reduced from (-2,3) to (-1,2)
+    def respawn(self):
+        """Move the bee back above the screen with a new speed"""
+        # Reset position - ensure width is valid before using it
+        if self.rect.width > 0:
+            self.rect.x = random.randrange(SCREEN_WIDTH - self.rect.width)
+        else:
+            self.rect.x = random.randrange(SCREEN_WIDTH - 30)  # Use default width
+        self.rect.y = random.randrange(-100, -40)
 
-            # Apply speed factor with lower caps
-            self.speedy = min(base_speedy * self.speed_factor, 3.0)  # Reduced cap from 5.0 to 3.0
-            self.speedx = max(min(base_speedx * self.speed_factor, 2.0), -2.0)  # Reduced cap from 3.0 to 2.0
+        # Reset movement with reduced speed ranges (same as initialization)
+        base_speedy = random.randrange(1, 3)  # Reduced from (2,4) to (1,3)
+        base_speedx = random.randrange(-1, 2)  # Reduced from (-2,3) to (-1,2)
 
-            # Ensure bee is visible by forcing a positive speed
-            if self.speedy <= 0:
-                self.speedy = 1.0
+        # Apply speed factor with lower caps
+        self.speedy = min(base_speedy * self.bee_type.speed_factor, 3.0)  # Reduced cap from 5.0 to 3.0
+        self.speedx = max(min(base_speedx * self.bee_type.speed_factor, 2.0), -2.0)  # Reduced cap from 3.0 to 2.0
 
-    def hit(self, damage):
-        """Handle being hit by a bullet or missile"""
-        self.health -= damage
-        # Flash the bee white briefly to indicate damage
-        original_color = self.color  # Store original color
-        self.color = WHITE
+        # Ensure bee is visible by forcing a positive speed
+        if self.speedy <= 0:
+            self.speedy = 1.0
 
-        # Store current wing state
-        current_wing_state = self.wing_state
+    def hit(self, damage, timers):
+        """Handle being hit by a bullet or missile
 
-        # Create flashed image
-        self.base_image = self.create_bee_image()
-        self.image = self.base_image
+        Args:
+            damage: Health lost
+            timers: TimerWheel used to end the flash
+        """
+        self.health -= damage
 
-        # Restore original color and wing state
-        self.color = original_color
-        self.wing_state = current_wing_state
+        # Flash the bee white briefly to indicate damage
+        self.image = self.bee_type.image(self.wing_state, flashed=True)
 
-        # Schedule color restoration
-        pygame.time.set_timer(pygame.USEREVENT, 100)  # 100ms flash
+        # Schedule color restoration, restarting the flash if one is running
+        self.cancel_flash()
+        self.flash_timer = timers.schedule(FLASH_FRAMES, self.restore_color)
 
         # Return True if the bee is destroyed
         return self.health <= 0
 
     def restore_color(self):
         """Restore the bee's original color after being hit"""
-        # Store current wing state
-        current_wing_state = self.wing_state
-
-        # Reset color based on level
-        if self.level == ENEMY_LEVEL_1:
-            self.color = YELLOW
-        elif self.level == ENEMY_LEVEL_2:
-            self.color = ORANGE
-        elif self.level == ENEMY_LEVEL_3:
-            self.color = RED
-        elif self.level == ENEMY_LEVEL_4:
-            self.color = PURPLE
-
-        # Recreate the image with the original color
-        self.base_image = self.create_bee_image()
-        self.image = self.base_image
-
-        # Restore wing state
-        self.wing_state = current_wing_state
+        self.image = self.bee_type.image(self.wing_state)
+        self.flash_timer = None
+
+    def cancel_flash(self):
+        """Drop a pending flash restoration, so it cannot fire on the bee's next life"""
+        if self.flash_timer is not None:
+            self.flash_timer.cancel()
+            self.flash_timer = None
@@ -6,147 +6,165 @@ import math
 import random
 from pygame.locals import USEREVENT
 from src.utils.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, YELLOW, ORANGE, RED, PURPLE, GREEN, GREY,
+    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, YELLOW, RED, PURPLE, GREEN, GREY,
     ENEMY_LEVEL_1, ENEMY_LEVEL_2, ENEMY_LEVEL_3, ENEMY_LEVEL_4
 )
 from src.utils.resources import load_image
-from src.entities.bee import Bee
+from src.utils import diagnostics
+from src.game.timers import frames_for
+from src.utils.definitions import DEFINITIONS
+
+# Boss records by level, from the definitions file
+BOSS_TYPES = DEFINITIONS.bosses
+
+# Frames the boss stays white after a hit
+FLASH_FRAMES = frames_for(50)
+
+# Level -> (normal image, flashed image)
+_images = {}
+
+
+def boss_images(level, size, color):
+    """Return the boss's normal and flashed images for a level, drawing them on first use"""
+    images = _images.get(level)
+    if images is None:
+        image = create_boss_image(level, size, color)
+
+        # Flashed image: the normal one under a semi-transparent white overlay
+        flash_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        flash_surface.fill((255, 255, 255, 100))
+        flash_image = image.copy()
+        flash_image.blit(flash_surface, (0, 0))
+        diagnostics.count_surface('boss_flash')
+        images = _images[level] = (image, flash_image)
+    return images
+
+
+def create_boss_image(level, size, color):
+    """Draw the boss for a level"""
+    # Create boss image with proper transparency
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    diagnostics.count_surface('boss_image')
+    # Fill with transparent color to ensure no background rectangle
+    image.fill((0, 0, 0, 0))
+
+    # Draw boss based on level
+    if level == 1:  # Giant Bee
+        # Body
+        pygame.draw.circle(image, color, (size//2, size//2), size//2 - 10)
+
+        # Stripes
+        for i in range(3):
+            y_pos = size//4 + i * size//6
+            pygame.draw.rect(image, BLACK, (10, y_pos, size - 20, size//10))
+
+        # Eyes
+        eye_size = size // 8
+        pygame.draw.circle(image, BLACK, (size//3, size//3), eye_size)
+        pygame.draw.circle(image, BLACK, (2*size//3, size//3), eye_size)
+
+        # Wings
+        wing_points = [
+            (size//4, size//4),
+            (0, 0),
+            (size//4, size//2)
+        ]
+        pygame.draw.polygon(image, WHITE, wing_points)
+
+        wing_points = [
+            (3*size//4, size//4),
+            (size, 0),
+            (3*size//4, size//2)
+        ]
+        pygame.draw.polygon(image, WHITE, wing_points)
+
+    elif level == 2:  # Bee Queen
+        # Body
+        pygame.draw.circle(image, color, (size//2, size//2), size//2 - 10)
+
+        # Crown
+        crown_points = [
+            (size//4, size//4),
+            (size//3, size//8),
+            (size//2, size//4),
+            (2*size//3, size//8),
+            (3*size//4, size//4)
+        ]
+        pygame.draw.polygon(image, YELLOW, crown_points)
+
+        # Stripes
+        for i in range(4):
+            y_pos = size//3 + i * size//8
+            pygame.draw.rect(image, BLACK, (10, y_pos, size - 20, size//12))
+
+        # Eyes
+        eye_size = size // 8
+        pygame.draw.circle(image, BLACK, (size//3, size//3), eye_size)
+        pygame.draw.circle(image, BLACK, (2*size//3, size//3), eye_size)
+
+        # Wings
+        wing_points = [
+            (size//4, size//3),
+            (0, size//6),
+            (0, size//2),
+            (size//4, size//2)
+        ]
+        pygame.draw.polygon(image, WHITE, wing_points)
+
+        wing_points = [
+            (3*size//4, size//3),
+            (size, size//6),
+            (size, size//2),
+            (3*size//4, size//2)
+        ]
+        pygame.draw.polygon(image, WHITE, wing_points)
+
+    elif level == 3:  # Alien Hive Mind
+        # Main body
+        pygame.draw.circle(image, color, (size//2, size//2), size//2 - 10)
+
+        # Alien features
+        # Eyes (multiple)
+        for i in range(3):
+            for j in range(2):
+                eye_x = size//3 + j * size//3
+                eye_y = size//4 + i * size//6
+                eye_size = size // 12
+                pygame.draw.circle(image, GREEN, (eye_x, eye_y), eye_size)
+                pygame.draw.circle(image, BLACK, (eye_x, eye_y), eye_size//2)
+
+        # Tentacles
+        for i in range(8):
+            angle = i * math.pi / 4
+            end_x = size//2 + int(math.cos(angle) * size//1.5)
+            end_y = size//2 + int(math.sin(angle) * size//1.5)
+            pygame.draw.line(image, PURPLE, (size//2, size//2), (end_x, end_y), 5)
+
+    return image
+
 
 class Boss(pygame.sprite.Sprite):
     """Boss class for end of level challenges"""
     def __init__(self, level):
         super(Boss, self).__init__()
 
-        # Boss properties based on level
+        # Boss properties based on level, from the definitions file
         self.level = level
-
-        if level == 1:  # Level 1 Boss: Giant Bee
-            self.health = 75  # Increased 5x from 15
-            self.max_health = 75
-            self.speed = 1.5
-            self.points = 500
-            self.color = YELLOW
-            self.size = 100
-            self.attack_pattern = "circle"
-            self.attack_cooldown = 1500
-            self.last_attack = 0
-        elif level == 2:  # Level 2 Boss: Bee Queen
-            self.health = 100  # Increased 5x from 20
-            self.max_health = 100
-            self.speed = 2
-            self.points = 1000
-            self.color = ORANGE
-            self.size = 120
-            self.attack_pattern = "zigzag"
-            self.attack_cooldown = 1200
-            self.last_attack = 0
-        elif level == 3:  # Level 3 Boss: Alien Hive Mind
-            self.health = 150  # Increased 5x from 30
-            self.max_health = 150
-            self.speed = 2.5
-            self.points = 2000
-            self.color = RED
-            self.size = 150
-            self.attack_pattern = "swarm"
-            self.attack_cooldown = 1000
-            self.last_attack = 0
-
-        # Create boss image with proper transparency
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        # Fill with transparent color to ensure no background rectangle
-        self.image.fill((0, 0, 0, 0))
-
-        # Draw boss based on level
-        if level == 1:  # Giant Bee
-            # Body
-            pygame.draw.circle(self.image, self.color, (self.size//2, self.size//2), self.size//2 - 10)
-
-            # Stripes
-            for i in range(3):
-                y_pos = self.size//4 + i * self.size//6
-                pygame.draw.rect(self.image, BLACK, (10, y_pos, self.size - 20, self.size//10))
-
-            # Eyes
-            eye_size = self.size // 8
-            pygame.draw.circle(self.image, BLACK, (self.size//3, self.size//3), eye_size)
-            pygame.draw.circle(self.image, BLACK, (2*self.size//3, self.size//3), eye_size)
-
-            # Wings
-            wing_points = [
-                (self.size//4, self.size//4),
-                (0, 0),
-                (self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-            wing_points = [
-                (3*self.size//4, self.size//4),
-                (self.size, 0),
-                (3*self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-        elif level == 2:  # Bee Queen
-            # Body
-            pygame.draw.circle(self.image, self.color, (self.size//2, self.size//2), self.size//2 - 10)
-
-            # Crown
-            crown_points = [
-                (self.size//4, self.size//4),
-                (self.size//3, self.size//8),
-                (self.size//2, self.size//4),
-                (2*self.size//3, self.size//8),
-                (3*self.size//4, self.size//4)
-            ]
-            pygame.draw.polygon(self.image, YELLOW, crown_points)
-
-            # Stripes
-            for i in range(4):
-                y_pos = self.size//3 + i * self.size//8
-                pygame.draw.rect(self.image, BLACK, (10, y_pos, self.size - 20, self.size//12))
-
-            # Eyes
-            eye_size = self.size // 8
-            pygame.draw.circle(self.image, BLACK, (self.size//3, self.size//3), eye_size)
-            pygame.draw.circle(self.image, BLACK, (2*self.size//3, self.size//3), eye_size)
-
-            # Wings
-            wing_points = [
-                (self.size//4, self.size//3),
-                (0, self.size//6),
-                (0, self.size//2),
-                (self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-            wing_points = [
-                (3*self.size//4, self.size//3),
-                (self.size, self.size//6),
-                (self.size, self.size//2),
-                (3*self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-        elif level == 3:  # Alien Hive Mind
-            # Main body
-            pygame.draw.circle(self.image, self.color, (self.size//2, self.size//2), self.size//2 - 10)
-
-            # Alien features
-            # Eyes (multiple)
-            for i in range(3):
-                for j in range(2):
-                    eye_x = self.size//3 + j * self.size//3
-                    eye_y = self.size//4 + i * self.size//6
-                    eye_size = self.size // 12
-                    pygame.draw.circle(self.image, GREEN, (eye_x, eye_y), eye_size)
-                    pygame.draw.circle(self.image, BLACK, (eye_x, eye_y), eye_size//2)
-
-            # Tentacles
-            for i in range(8):
-                angle = i * math.pi / 4
-                end_x = self.size//2 + int(math.cos(angle) * self.size//1.5)
-                end_y = self.size//2 + int(math.sin(angle) * self.size//1.5)
-                pygame.draw.line(self.image, PURPLE, (self.size//2, self.size//2), (end_x, end_y), 5)
+        self.boss_type = BOSS_TYPES[level]
+        self.health = self.boss_type.health
+        self.max_health = self.boss_type.health
+        self.speed = self.boss_type.speed
+        self.points = self.boss_type.points
+        self.color = self.boss_type.color
+        self.size = self.boss_type.size
+        self.attack_pattern = self.boss_type.attack_pattern
+        self.attack_cooldown = self.boss_type.attack_cooldown
+        self.last_attack = 0
+
+        # Shared normal and flashed images for this level
+        self.normal_image, self.flash_image = boss_images(level, self.size, self.color)
+        self.image = self.normal_image
+        self.flash_timer = None  # Timer ending the current hit flash
 
         # Set up rect and position
         self.rect = self.image.get_rect()
@@ -160,6 +178,7 @@ class Boss(pygame.sprite.Sprite):
 
         # Attack variables
         self.attack_timer = 0
+        self.spawns = []  # Queued (bee level, rect attribute, position) spawn commands
 
     def update(self):
         """Update boss movement and behavior"""
@@ -202,56 +221,67 @@ class Boss(pygame.sprite.Sprite):
         if self.rect.bottom > SCREEN_HEIGHT // 2:
             self.rect.bottom = SCREEN_HEIGHT // 2
 
-        # Attack logic
+        # Attack logic - queue one attack per cooldown for the game loop to spawn
         now = pygame.time.get_ticks()
         if now - self.last_attack > self.attack_cooldown:
-            self.attack()
+            self.spawns.extend(self.attack())
             self.last_attack = now
 
     def attack(self):
-        """Attack by spawning enemy bees"""
+        """Return this attack's spawn commands
+
+        Each command is (bee level, rect attribute, position): the bee's rect
+        attribute (e.g. 'center') is set to position when it is spawned.
+        """
         # Different attack patterns based on boss level (reduced difficulty)
         if self.level == 1:  # Level 1 Boss: Simple attack
             # Spawn 2 bees (reduced from 3) in a spread pattern
-            bees = []
+            spawns = []
             for i in range(2):
-                new_bee = Bee(level=ENEMY_LEVEL_1)  # Easier bees (reduced from level 2)
                 offset = (i - 0.5) * 50  # -25, 25
-                new_bee.rect.centerx = self.rect.centerx + offset
-                new_bee.rect.top = self.rect.bottom
-                bees.append(new_bee)
-            return bees
+                # Easier bees (reduced from level 2)
+                spawns.append((ENEMY_LEVEL_1, 'midtop', (self.rect.centerx + offset, self.rect.bottom)))
+            return spawns
 
         elif self.level == 2:  # Level 2 Boss: More complex attack
             # Spawn 3 bees (reduced from 5) in a circular pattern
-            bees = []
+            spawns = []
             for i in range(3):
-                new_bee = Bee(level=ENEMY_LEVEL_2)  # Easier bees (reduced from level 3)
                 angle = i * 2 * math.pi / 3
                 offset_x = int(math.cos(angle) * 70)
                 offset_y = int(math.sin(angle) * 70)
-                new_bee.rect.centerx = self.rect.centerx + offset_x
-                new_bee.rect.centery = self.rect.centery + offset_y
-                bees.append(new_bee)
-            return bees
+                # Easier bees (reduced from level 3)
+                spawns.append((ENEMY_LEVEL_2, 'center',
+                               (self.rect.centerx + offset_x, self.rect.centery + offset_y)))
+            return spawns
 
         elif self.level == 3:  # Level 3 Boss: Advanced attack
             # Spawn 4 bees (reduced from 7) in a complex pattern
-            bees = []
+            spawns = []
             for i in range(4):
-                new_bee = Bee(level=ENEMY_LEVEL_3)  # Easier bees (reduced from level 4)
                 angle = i * 2 * math.pi / 4
                 offset_x = int(math.cos(angle) * 100)
                 offset_y = int(math.sin(angle) * 100)
-                new_bee.rect.centerx = self.rect.centerx + offset_x
-                new_bee.rect.centery = self.rect.centery + offset_y
-                bees.append(new_bee)
-            return bees
+                # Easier bees (reduced from level 4)
+                spawns.append((ENEMY_LEVEL_3, 'center',
+                               (self.rect.centerx + offset_x, self.rect.centery + offset_y)))
+            return spawns
 
         return []
 
-    def hit(self, damage):
-        """Handle being hit"""
+    def take_spawns(self):
+        """Return and clear the spawn commands queued since the last call"""
+        spawns = self.spawns
+        self.spawns = []
+        return spawns
+
+    def hit(self, damage, timers):
+        """Handle being hit
+
+        Args:
+            damage: Health lost
+            timers: TimerWheel used to end the flash
+        """
         # Handle being hit
         self.health -= damage
 
@@ -261,113 +291,18 @@ class Boss(pygame.sprite.Sprite):
             return True
 
         # Boss still alive, flash white briefly to indicate damage
-        flash_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        flash_surface.fill((255, 255, 255, 100))  # Semi-transparent white
-        self.image.blit(flash_surface, (0, 0))
-
-        # Schedule a redraw of the boss after the flash
-        pygame.time.set_timer(pygame.USEREVENT + 1, 50)  # 50ms flash duration
+        self.image = self.flash_image
+        if self.flash_timer is not None:
+            self.flash_timer.cancel()
+        self.flash_timer = timers.schedule(FLASH_FRAMES, self.end_flash)
 
         # Return False as boss is not destroyed
         return False
 
-    def redraw(self):
-        """Redraw the boss after flash effect"""
-        # Create boss image with proper transparency
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.image.fill((0, 0, 0, 0))  # Fill with transparent color
-
-        # Redraw boss based on level
-        if self.level == 1:  # Giant Bee
-            # Body
-            pygame.draw.circle(self.image, self.color, (self.size//2, self.size//2), self.size//2 - 10)
-
-            # Stripes
-            for i in range(3):
-                y_pos = self.size//4 + i * self.size//6
-                pygame.draw.rect(self.image, BLACK, (10, y_pos, self.size - 20, self.size//10))
-
-            # Eyes
-            eye_size = self.size // 8
-            pygame.draw.circle(self.image, BLACK, (self.size//3, self.size//3), eye_size)
-            pygame.draw.circle(self.image, BLACK, (2*self.size//3, self.size//3), eye_size)
-
-            # Wings
-            wing_points = [
-                (self.size//4, self.size//4),
-                (0, 0),
-                (self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-            wing_points = [
-                (3*self.size//4, self.size//4),
-                (self.size, 0),
-                (3*self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-        elif self.level == 2:  # Bee Queen
-            # Body
-            pygame.draw.circle(self.image, self.color, (self.size//2, self.size//2), self.size//2 - 10)
-
-            # Crown
-            crown_points = [
-                (self.size//4, self.size//4),
-                (self.size//3, self.size//8),
-                (self.size//2, self.size//4),
-                (2*self.size//3, self.size//8),
-                (3*self.size//4, self.size//4)
-            ]
-            pygame.draw.polygon(self.image, YELLOW, crown_points)
-
-            # Stripes
-            for i in range(4):
-                y_pos = self.size//3 + i * self.size//8
-                pygame.draw.rect(self.image, BLACK, (10, y_pos, self.size - 20, self.size//12))
-
-            # Eyes
-            eye_size = self.size // 8
-            pygame.draw.circle(self.image, BLACK, (self.size//3, self.size//3), eye_size)
-            pygame.draw.circle(self.image, BLACK, (2*self.size//3, self.size//3), eye_size)
-
-            # Wings
-            wing_points = [
-                (self.size//4, self.size//3),
-                (0, self.size//6),
-                (0, self.size//2),
-                (self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-            wing_points = [
-                (3*self.size//4, self.size//3),
-                (self.size, self.size//6),
-                (self.size, self.size//2),
-                (3*self.size//4, self.size//2)
-            ]
-            pygame.draw.polygon(self.image, WHITE, wing_points)
-
-        elif self.level == 3:  # Alien Hive Mind
-            # Main body
-            pygame.draw.circle(self.image, self.color, (self.size//2, self.size//2), self.size//2 - 10)
-
-            # Alien features
-            # Eyes (multiple)
-            for i in range(3):
-                for j in range(2):
-                    eye_x = self.size//3 + j * self.size//3
-                    eye_y = self.size//4 + i * self.size//6
-                    eye_size = self.size // 12
-                    pygame.draw.circle(self.image, GREEN, (eye_x, eye_y), eye_size)
-                    pygame.draw.circle(self.image, BLACK, (eye_x, eye_y), eye_size//2)
-
-            # Tentacles
-            for i in range(8):
-                angle = i * math.pi / 4
-                end_x = self.size//2 + int(math.cos(angle) * self.size//1.5)
-                end_y = self.size//2 + int(math.sin(angle) * self.size//1.5)
-                pygame.draw.line(self.image, PURPLE, (self.size//2, self.size//2), (end_x, end_y), 5)
+    def end_flash(self):
+        """Show the normal image again after a hit flash"""
+        self.image = self.normal_image
+        self.flash_timer = None
 
     def draw_health_bar(self, screen):
         """Draw boss health bar"""
@@ -389,5 +324,6 @@ class Boss(pygame.sprite.Sprite):
 
         # Text
         font = pygame.font.Font(None, 24)
+        diagnostics.count_surface('font')
         boss_text = font.render(f"BOSS - Level {self.level}", True, WHITE)
         screen.blit(boss_text, (bar_x + bar_width // 2 - boss_text.get_width() // 2, bar_y - 25))
@@ -4,32 +4,58 @@ Missile entity
 import pygame
 import math
 import random
-import logging
 from src.utils.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, GREY, RED, ORANGE
 )
 from src.utils.resources import load_image
+from src.utils import diagnostics, hotlog
 
-logger = logging.getLogger('bee_shooter.missile')
+logger = hotlog.get_logger('bee_shooter.missile')
+
+# Shared missile image and its rotations by whole degree, drawn on first use
+_original_image = None
+_rotations = {}
 
-class Missile(pygame.sprite.Sprite):
-    """Missile class for player's special weapon"""
-    def __init__(self, x, y, damage=1, target_seeking=False):
-        super(Missile, self).__init__()
-        self.image = pygame.Surface((10, 20), pygame.SRCALPHA)
+
+def missile_image():
+    """Return the shared, unrotated missile image"""
+    global _original_image
+
+    if _original_image is None:
+        image = pygame.Surface((10, 20), pygame.SRCALPHA)
+        diagnostics.count_surface('missile')
 
         # Missile body
-        pygame.draw.rect(self.image, GREY, (3, 0, 4, 15))
+        pygame.draw.rect(image, GREY, (3, 0, 4, 15))
         # Missile head
-        pygame.draw.polygon(self.image, RED, [(3, 0), (7, 0), (5, -5)])
+        pygame.draw.polygon(image, RED, [(3, 0), (7, 0), (5, -5)])
         # Missile fins
-        pygame.draw.polygon(self.image, GREY, [(0, 15), (3, 15), (3, 10)])
-        pygame.draw.polygon(self.image, GREY, [(7, 15), (10, 15), (7, 10)])
+        pygame.draw.polygon(image, GREY, [(0, 15), (3, 15), (3, 10)])
+        pygame.draw.polygon(image, GREY, [(7, 15), (10, 15), (7, 10)])
         # Missile engine
-        pygame.draw.rect(self.image, ORANGE, (4, 15, 2, 5))
+        pygame.draw.rect(image, ORANGE, (4, 15, 2, 5))
+        _original_image = image
+    return _original_image
+
+
+def rotated_image(angle):
+    """Return the shared missile image rotated to the nearest whole degree"""
+    key = int(round(angle)) % 360
+    image = _rotations.get(key)
+    if image is None:
+        image = _rotations[key] = pygame.transform.rotate(missile_image(), key)
+        diagnostics.count_surface('missile_rotation')
+    return image
+
 
-        # Store original image for rotation
-        self.original_image = self.image.copy()
+class Missile(pygame.sprite.Sprite):
+    """Missile class for player's special weapon"""
+    __slots__ = ('image', 'rect', 'speedx', 'speedy', 'damage', 'target_seeking', 'target',
+                 'target_generation', 'max_turn_rate', 'smoke_timer', 'smoke_delay', 'angle', 'direction')
+
+    def __init__(self, x, y, damage=1, target_seeking=False):
+        super(Missile, self).__init__()
+        self.image = missile_image()
 
         self.rect = self.image.get_rect()
         self.rect.centerx = x
@@ -39,6 +65,7 @@ class Missile(pygame.sprite.Sprite):
         self.damage = damage
         self.target_seeking = target_seeking
         self.target = None
+        self.target_generation = None
         self.max_turn_rate = 0.5  # Maximum turning rate (increased from 0.3 for better tracking)
         self.smoke_timer = 0
         self.smoke_delay = 2  # Frames between smoke particles (reduced from 3 for more smoke)
@@ -63,26 +90,26 @@ class Missile(pygame.sprite.Sprite):
                 return
 
             # Check if target is still alive
-            if hasattr(self.target, 'alive') and callable(getattr(self.target, 'alive')):
-                if not self.target.alive():
-                    # Target is no longer alive, clear it
-                    logger.debug("Missile target is no longer alive, clearing target")
-                    self.target = None
-                    self.speedx = 0
-                    self.speedy = -8
-                    return
+            if not self.target_alive():
+                # Target is no longer alive, clear it
+                logger.debug("Missile target is no longer alive, clearing target")
+                self.target = None
+                self.speedx = 0
+                self.speedy = -8
+                return
 
             # Calculate direction to target
             target_direction = pygame.math.Vector2(
                 self.target.rect.centerx - self.rect.centerx,
                 self.target.rect.centery - self.rect.centery
             )
+            target_distance = target_direction.length()
 
             # Log target direction for debugging
-            logger.debug(f"Target direction: {target_direction}, length: {target_direction.length()}")
+            logger.debug("Target direction: %s, length: %.1f", target_direction, target_distance)
 
             # Skip if target is too close (avoid division by zero)
-            if target_direction.length() > 5:
+            if target_distance > 5:
                 target_direction = target_direction.normalize()
 
                 # Calculate angle between current direction and target direction
@@ -91,7 +118,7 @@ class Missile(pygame.sprite.Sprite):
                     self.direction.x * target_direction.x + self.direction.y * target_direction.y
                 ))
 
-                logger.debug(f"Angle difference: {angle_diff}")
+                logger.debug("Angle difference: %.2f", angle_diff)
 
                 # Increase turning rate for better tracking
                 self.max_turn_rate = 2.0  # Increased from 0.8 for much better tracking
@@ -110,16 +137,16 @@ class Missile(pygame.sprite.Sprite):
                 # Update speed based on direction
                 speed_factor = 8  # Base speed
                 # Increase speed if target is far away
-                if target_direction.length() > 200:
+                if target_distance > 200:
                     speed_factor = 12  # Faster to catch up (increased from 10)
 
                 self.speedx = self.direction.x * speed_factor
                 self.speedy = self.direction.y * speed_factor
 
-                logger.debug(f"Missile speed: ({self.speedx}, {self.speedy})")
+                logger.debug("Missile speed: (%.2f, %.2f)", self.speedx, self.speedy)
 
                 # Rotate image to match direction
-                self.image = pygame.transform.rotate(self.original_image, self.angle)
+                self.image = rotated_image(self.angle)
                 self.rect = self.image.get_rect(center=self.rect.center)
         else:
             # Not target seeking, just go straight up
@@ -141,6 +168,15 @@ class Missile(pygame.sprite.Sprite):
             self.rect.right < 0 or self.rect.left > SCREEN_WIDTH):
             self.kill()
 
+    def target_alive(self):
+        """Return True if the target is set and is still the sprite it was when aimed at"""
+        target = self.target
+        if target is None:
+            return False
+        if not target.alive():
+            return False
+        return getattr(target, 'generation', None) == self.target_generation
+
     def set_target(self, target):
         """Set the target for the missile"""
         if target is None:
@@ -148,5 +184,7 @@ class Missile(pygame.sprite.Sprite):
             return
 
         self.target = target
+        # Pooled bees are reused, so remember which life of the bee is the target
+        self.target_generation = getattr(target, 'generation', None)
         self.target_seeking = True  # Ensure target seeking is enabled
-        logger.debug(f"Missile target set to {target.__class__.__name__} at position {target.rect.center}")
+        logger.debug("Missile target set to %s at position %s", target.__class__.__name__, target.rect.center)
@@ -3,20 +3,81 @@ Player entity
 """
 import pygame
 import math
-from pygame.locals import K_LEFT, K_RIGHT, K_UP, K_DOWN
 from src.utils.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, ORANGE, YELLOW,
     WEAPON_LEVEL_1, WEAPON_LEVEL_2, WEAPON_LEVEL_3, WEAPON_LEVEL_4, WEAPON_LEVEL_5,
     MISSILE_LEVEL_1, MISSILE_LEVEL_2, MISSILE_LEVEL_3, MISSILE_LEVEL_4
 )
 from src.utils.resources import load_image, sounds, play_sound
-from src.entities.bullet import Bullet
+from src.utils import diagnostics
 from src.entities.missile import Missile
+from src.game.input_state import ACTION_LEFT, ACTION_RIGHT, ACTION_UP, ACTION_DOWN
+
+# Ship images with engine flames, shared by (flame size, side engines)
+_frames = {}
+
+
+def player_frame(flicker, side_engines):
+    """Return the ship image with its engine flames drawn, built on first use
+
+    Args:
+        flicker: Engine flicker step; the flame size repeats every 3 steps
+        side_engines: Draw the side engine flames as well as the center one
+    """
+    key = (flicker % 3, side_engines)
+    image = _frames.get(key)
+    if image is None:
+        image = _frames[key] = load_image("player")
+        diagnostics.count_surface('player_image')
+        draw_engine_flames(image, key[0], side_engines)
+    return image
+
+
+def draw_engine_flames(image, flicker, side_engines):
+    """Draw engine flames on a ship image"""
+    # Engine flame positions (adjust based on your ship design)
+    flame_positions = [(40, 45)]  # Center engine
+
+    # Add side engines for higher weapon levels
+    if side_engines:
+        flame_positions.extend([(30, 40), (50, 40)])  # Side engines
+
+    # Draw flames with flicker effect
+    for pos in flame_positions:
+        # Flame size varies with flicker
+        flame_height = 5 + flicker
+        flame_width = 3
+
+        # Flame colors
+        colors = [ORANGE, YELLOW, WHITE]
+
+        # Draw flame layers (from outside to inside)
+        for i, color in enumerate(colors):
+            # Each layer is smaller than the outer one
+            layer_height = flame_height - i
+            layer_width = flame_width - (i * 0.5)
+
+            if layer_height > 0 and layer_width > 0:
+                # Create flame polygon
+                flame_points = [
+                    (pos[0] - layer_width/2, pos[1]),  # Top left
+                    (pos[0] + layer_width/2, pos[1]),  # Top right
+                    (pos[0], pos[1] + layer_height)    # Bottom point
+                ]
+
+                # Draw flame on ship image
+                pygame.draw.polygon(image, color, flame_points)
+
 
 class Player(pygame.sprite.Sprite):
-    """Player class representing the player's ship"""
-    def __init__(self):
+    """Player class representing the player's ship
+
+    Args:
+        input_state: InputState sampled by the game loop, read for movement
+    """
+    def __init__(self, input_state):
         super(Player, self).__init__()
+        self.input = input_state
         self.image = load_image("player", BLACK)
         self.rect = self.image.get_rect()
         self.rect.centerx = SCREEN_WIDTH // 2
@@ -38,17 +99,14 @@ class Player(pygame.sprite.Sprite):
 
     def update(self):
         """Update player position and state"""
-        # Get pressed keys
-        keys = pygame.key.get_pressed()
-
         # Movement
-        if keys[K_LEFT]:
+        if self.input.held(ACTION_LEFT):
             self.rect.x -= self.speed
-        if keys[K_RIGHT]:
+        if self.input.held(ACTION_RIGHT):
             self.rect.x += self.speed
-        if keys[K_UP]:
+        if self.input.held(ACTION_UP):
             self.rect.y -= self.speed
-        if keys[K_DOWN]:
+        if self.input.held(ACTION_DOWN):
             self.rect.y += self.speed
 
         # Force the player to be within screen bounds
@@ -64,49 +122,11 @@ class Player(pygame.sprite.Sprite):
         # Engine animation - more intense when moving
         self.engine_flicker = (self.engine_flicker + 1) % 6
 
-        # Load the base fighter image
-        self.image = load_image("player")
-
-        # Add engine flames
-        self.draw_engine_flames()
-
-    def draw_engine_flames(self):
-        """Draw engine flames on the player ship"""
-        # Engine flame positions (adjust based on your ship design)
-        flame_positions = [(40, 45)]  # Center engine
-
-        # Add side engines for higher weapon levels
-        if self.weapon_level >= WEAPON_LEVEL_3:
-            flame_positions.extend([(30, 40), (50, 40)])  # Side engines
-
-        # Draw flames with flicker effect
-        for pos in flame_positions:
-            # Flame size varies with flicker
-            flame_height = 5 + (self.engine_flicker % 3)
-            flame_width = 3
-
-            # Flame colors
-            colors = [ORANGE, YELLOW, WHITE]
-
-            # Draw flame layers (from outside to inside)
-            for i, color in enumerate(colors):
-                # Each layer is smaller than the outer one
-                layer_height = flame_height - i
-                layer_width = flame_width - (i * 0.5)
-
-                if layer_height > 0 and layer_width > 0:
-                    # Create flame polygon
-                    flame_points = [
-                        (pos[0] - layer_width/2, pos[1]),  # Top left
-                        (pos[0] + layer_width/2, pos[1]),  # Top right
-                        (pos[0], pos[1] + layer_height)    # Bottom point
-                    ]
-
-                    # Draw flame on ship image
-                    pygame.draw.polygon(self.image, color, flame_points)
+        # Shared ship image for this engine frame
+        self.image = player_frame(self.engine_flicker, self.weapon_level >= WEAPON_LEVEL_3)
 
     def shoot(self):
-        """Create bullets based on weapon level"""
+        """Return (x, bottom, angle) for each bullet fired this frame, based on weapon level"""
         now = pygame.time.get_ticks()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
@@ -116,36 +136,36 @@ class Player(pygame.sprite.Sprite):
             # Different bullet patterns based on weapon level
             if self.weapon_level == WEAPON_LEVEL_1:
                 # Single bullet
-                bullets.append(Bullet(self.rect.centerx, self.rect.top))
+                bullets.append((self.rect.centerx, self.rect.top, 0))
 
             elif self.weapon_level == WEAPON_LEVEL_2:
                 # Two bullets side by side
-                bullets.append(Bullet(self.rect.left + 10, self.rect.top))
-                bullets.append(Bullet(self.rect.right - 10, self.rect.top))
+                bullets.append((self.rect.left + 10, self.rect.top, 0))
+                bullets.append((self.rect.right - 10, self.rect.top, 0))
 
             elif self.weapon_level == WEAPON_LEVEL_3:
                 # Three bullets - one center, two angled
-                bullets.append(Bullet(self.rect.centerx, self.rect.top))
-                bullets.append(Bullet(self.rect.left + 10, self.rect.top, -1))
-                bullets.append(Bullet(self.rect.right - 10, self.rect.top, 1))
+                bullets.append((self.rect.centerx, self.rect.top, 0))
+                bullets.append((self.rect.left + 10, self.rect.top, -1))
+                bullets.append((self.rect.right - 10, self.rect.top, 1))
 
             elif self.weapon_level == WEAPON_LEVEL_4:
                 # Four bullets - two straight, two angled
-                bullets.append(Bullet(self.rect.centerx - 15, self.rect.top))
-                bullets.append(Bullet(self.rect.centerx + 15, self.rect.top))
-                bullets.append(Bullet(self.rect.left + 5, self.rect.top, -1))
-                bullets.append(Bullet(self.rect.right - 5, self.rect.top, 1))
+                bullets.append((self.rect.centerx - 15, self.rect.top, 0))
+                bullets.append((self.rect.centerx + 15, self.rect.top, 0))
+                bullets.append((self.rect.left + 5, self.rect.top, -1))
+                bullets.append((self.rect.right - 5, self.rect.top, 1))
 
             elif self.weapon_level == WEAPON_LEVEL_5:
                 # Five bullets - three straight, two angled
-                bullets.append(Bullet(self.rect.centerx, self.rect.top))
-                bullets.append(Bullet(self.rect.centerx - 20, self.rect.top))
-                bullets.append(Bullet(self.rect.centerx + 20, self.rect.top))
-                bullets.append(Bullet(self.rect.left + 5, self.rect.top, -2))
-                bullets.append(Bullet(self.rect.right - 5, self.rect.top, 2))
+                bullets.append((self.rect.centerx, self.rect.top, 0))
+                bullets.append((self.rect.centerx - 20, self.rect.top, 0))
+                bullets.append((self.rect.centerx + 20, self.rect.top, 0))
+                bullets.append((self.rect.left + 5, self.rect.top, -2))
+                bullets.append((self.rect.right - 5, self.rect.top, 2))
 
             # Play shooting sound
-            play_sound('shoot', channel='shoot')
+            play_sound('shoot')
 
             return bullets
 
@@ -163,14 +183,14 @@ class Player(pygame.sprite.Sprite):
                 self.shoot_delay = 150  # Faster fire rate for levels 4-5
 
             # Play power-up sound
-            play_sound('powerup', channel='powerup')
+            play_sound('powerup')
             return True
         return False
 
     def add_bomb(self):
         """Add a bomb to the player's inventory"""
         self.bombs += 1
-        play_sound('powerup', channel='powerup')
+        play_sound('powerup')
 
     def bomb(self):
         """Use a bomb if available and not on cooldown"""
@@ -192,17 +212,14 @@ class Player(pygame.sprite.Sprite):
         self.last_bomb = now
 
         # Play bomb sound
-        play_sound('bomb', channel='bomb')
-
-        # Force event processing to ensure keyboard input isn't blocked
-        pygame.event.pump()
+        play_sound('bomb')
 
         return True
 
     def add_missile(self):
         """Add missiles to the player's inventory"""
         self.missiles += 2  # Add 2 missiles at a time
-        play_sound('powerup', channel='powerup')
+        play_sound('powerup')
 
     def upgrade_missile(self):
         """Upgrade the player's missiles"""
@@ -211,12 +228,12 @@ class Player(pygame.sprite.Sprite):
             # Add bonus missiles when upgrading
             self.missiles += 3
             # Play power-up sound
-            play_sound('powerup', channel='powerup')
+            play_sound('powerup')
             return True
         else:
             # If already at max level, just add more missiles
             self.missiles += 5
-            play_sound('powerup', channel='powerup')
+            play_sound('powerup')
             return False
 
     def launch_missile(self, auto_launch=False):
@@ -257,9 +274,9 @@ class Player(pygame.sprite.Sprite):
             # Play missile sound (at lower volume if auto-launched)
             if auto_launch:
                 # Use lower volume for auto-launch
-                play_sound('missile', channel='missile', volume=0.3)
+                play_sound('missile', volume=0.3)
             else:
-                play_sound('missile', channel='missile')
+                play_sound('missile')
 
             return launched_missiles
         return None
@@ -2,27 +2,36 @@
 PowerUp entity
 """
 import pygame
-import random
 from src.utils.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BLUE, RED, GREY, YELLOW, WHITE, ORANGE, CYAN
 )
 from src.utils.resources import load_image
+from src.utils import diagnostics
+from src.game.spawn_director import random_powerup_type
+
+# Power-up images by type and their pulse frames by (type, size), shared by every power-up
+_images = {}
+_scaled_images = {}
+
 
 class PowerUp(pygame.sprite.Sprite):
     """PowerUp class for player upgrades"""
+    __slots__ = ('type', 'image', 'rect', 'speedy', 'animation_timer', 'pulse_direction', 'scale_factor')
+
     def __init__(self, center, powerup_type=None):
         super(PowerUp, self).__init__()
 
         # Randomly choose type if not specified
         if powerup_type is None:
             # 30% weapon upgrade, 20% bomb, 20% missile, 30% missile upgrade
-            self.type = random.choice(["weapon_upgrade"] * 3 + ["bomb"] * 2 +
-                                    ["missile"] * 2 + ["missile_upgrade"] * 3)
+            self.type = random_powerup_type()
         else:
             self.type = powerup_type
 
-        # Create image based on type
-        self.image = self.create_powerup_image()
+        # Shared image based on type, created for the first power-up of each type
+        self.image = _images.get(self.type)
+        if self.image is None:
+            self.image = _images[self.type] = self.create_powerup_image()
         self.rect = self.image.get_rect()
         self.rect.center = center
         self.speedy = 2  # Falling speed
@@ -30,9 +39,12 @@ class PowerUp(pygame.sprite.Sprite):
         # Animation variables
         self.animation_timer = 0
         self.pulse_direction = 1  # 1 for growing, -1 for shrinking
-        self.original_image = self.image.copy()
         self.scale_factor = 1.0
 
+    @property
+    def original_image(self):
+        return _images[self.type]
+
     def create_powerup_image(self):
         """Create powerup image based on type"""
         image = pygame.Surface((30, 30), pygame.SRCALPHA)
@@ -77,6 +89,7 @@ class PowerUp(pygame.sprite.Sprite):
         final_image = pygame.Surface((40, 40), pygame.SRCALPHA)
         final_image.blit(glow_surf, (0, 0))
         final_image.blit(image, (5, 5))
+        diagnostics.count_surface('powerup', 3)
 
         return final_image
 
@@ -103,13 +116,18 @@ class PowerUp(pygame.sprite.Sprite):
             self.scale_factor += 0.05 * self.pulse_direction
 
             # Scale the image
-            new_width = int(self.original_image.get_width() * self.scale_factor)
-            new_height = int(self.original_image.get_height() * self.scale_factor)
+            original_image = _images[self.type]
+            new_width = int(original_image.get_width() * self.scale_factor)
+            new_height = int(original_image.get_height() * self.scale_factor)
 
             # Keep original center
             old_center = self.rect.center
 
-            # Scale image
-            self.image = pygame.transform.scale(self.original_image, (new_width, new_height))
+            # Scale image, reusing the frame if any power-up of this type had this size
+            key = (self.type, new_width, new_height)
+            self.image = _scaled_images.get(key)
+            if self.image is None:
+                self.image = _scaled_images[key] = pygame.transform.scale(original_image, (new_width, new_height))
+                diagnostics.count_surface('powerup_scale')
             self.rect = self.image.get_rect()
             self.rect.center = old_center
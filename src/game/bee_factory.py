@@ -0,0 +1,69 @@
+"""
+Bee factory
+
+Hands out Bee sprites, reusing dead ones instead of constructing new ones.
+Killed bees are given back with release() and reset() on their next use, so
+waves, respawns and boss attacks stop allocating a sprite (and its rect) per
+bee. prewarm() fills the pool and draws every bee level's shared images ahead
+of time, so the first wave or boss attack does not pay for them.
+"""
+import logging
+from src.entities.bee import Bee, BEE_TYPES
+
+logger = logging.getLogger('bee_shooter.bee_factory')
+
+# Bees built by prewarm()
+DEFAULT_PREWARM = 32
+
+# Most dead bees kept for reuse; extra ones are left to the garbage collector
+MAX_FREE = 512
+
+
+class BeeFactory:
+    """Pool of reusable bees
+
+    Args:
+        max_free: Most dead bees kept for reuse
+    """
+    def __init__(self, max_free=MAX_FREE):
+        self.max_free = max_free
+        self.free = []
+        self.stats = {'created': 0, 'reused': 0, 'released': 0}
+
+    def __len__(self):
+        return len(self.free)
+
+    def prewarm(self, count=DEFAULT_PREWARM):
+        """Draw every bee image and fill the pool with count bees"""
+        for bee_type in BEE_TYPES.values():
+            for wing_state in (0, 1, 2):
+                bee_type.image(wing_state)
+                bee_type.image(wing_state, flashed=True)
+        while len(self.free) < min(count, self.max_free):
+            self.free.append(Bee())
+            self.stats['created'] += 1
+        logger.debug("Bee pool prewarmed with %d bees", len(self.free))
+
+    def create(self, level=None):
+        """Return a newly spawned bee, reusing a dead one when possible
+
+        Args:
+            level: Bee level, or None for the random level mix of Bee()
+        """
+        if self.free:
+            bee = self.free.pop()
+            bee.reset(level)
+            self.stats['reused'] += 1
+            return bee
+        self.stats['created'] += 1
+        return Bee(level)
+
+    def release(self, bee):
+        """Kill a bee and keep it for reuse"""
+        if not bee.alive():
+            return  # Already released, or never spawned
+        bee.kill()
+        bee.cancel_flash()
+        self.stats['released'] += 1
+        if len(self.free) < self.max_free:
+            self.free.append(bee)
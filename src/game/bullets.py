@@ -0,0 +1,224 @@
+"""
+Bullet manager
+
+Keeps every player bullet in parallel arrays (x, y, vx, vy, damage, alive)
+instead of one sprite per bullet. Bullets are moved and culled in one step,
+collided against sprites with the batched collision kernel and drawn from the
+shared bullet images. numpy is used when it is installed; otherwise the same
+arrays are plain lists.
+"""
+import pygame
+from src.utils.constants import SCREEN_WIDTH, YELLOW, CYAN, PINK
+from src.entities.bullet import bullet_image
+from src.game.collision import collide_boxes, sprite_boxes, is_precise, mask_for
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Bullet size (matching bullet_image) and default speed
+BULLET_WIDTH = 5
+BULLET_HEIGHT = 15
+BULLET_SPEED = -10
+
+# Bullets are solid rectangles, so one filled mask serves every bullet in precise mode
+_bullet_mask = None
+
+
+def bullet_mask():
+    """Return the shared mask of a bullet"""
+    global _bullet_mask
+    if _bullet_mask is None:
+        _bullet_mask = pygame.mask.Mask((BULLET_WIDTH, BULLET_HEIGHT), fill=True)
+    return _bullet_mask
+
+
+class BulletManager:
+    """All player bullets as a structure of arrays
+
+    Positions are the top-left corner of each bullet's rect. Rows are kept
+    packed: dead and off-screen bullets are removed in bulk after each step.
+
+    Args:
+        capacity: Initial number of rows allocated for the numpy arrays
+        use_numpy: Force (True) or disable (False) numpy; None uses it if installed
+    """
+    def __init__(self, capacity=256, use_numpy=None):
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy and numpy is not None
+        self.count = 0
+        if self.use_numpy:
+            self.x = numpy.zeros(capacity)
+            self.y = numpy.zeros(capacity)
+            self.vx = numpy.zeros(capacity)
+            self.vy = numpy.zeros(capacity)
+            self.damage = numpy.zeros(capacity, dtype=numpy.int32)
+            self.alive = numpy.zeros(capacity, dtype=bool)
+        else:
+            self.x = []
+            self.y = []
+            self.vx = []
+            self.vy = []
+            self.damage = []
+            self.alive = []
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, angle=0, damage=1):
+        """Add a bullet whose rect has its center x at x and its bottom at y
+
+        Args:
+            x: Center x of the bullet
+            y: Bottom of the bullet
+            angle: Horizontal speed (negative is left)
+            damage: Damage dealt to whatever it hits
+        """
+        left = x - BULLET_WIDTH // 2
+        top = y - BULLET_HEIGHT
+        if self.use_numpy:
+            if self.count == len(self.x):
+                self._grow()
+            i = self.count
+            self.x[i] = left
+            self.y[i] = top
+            self.vx[i] = angle
+            self.vy[i] = BULLET_SPEED
+            self.damage[i] = damage
+            self.alive[i] = True
+        else:
+            self.x.append(left)
+            self.y.append(top)
+            self.vx.append(angle)
+            self.vy.append(BULLET_SPEED)
+            self.damage.append(damage)
+            self.alive.append(True)
+        self.count += 1
+
+    def _grow(self):
+        """Double the capacity of the numpy arrays"""
+        for name in ('x', 'y', 'vx', 'vy', 'damage', 'alive'):
+            array = getattr(self, name)
+            grown = numpy.zeros(len(array) * 2, dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            setattr(self, name, grown)
+
+    def _compact(self):
+        """Drop rows that are no longer alive, keeping the order of the rest"""
+        n = self.count
+        if self.use_numpy:
+            keep = self.alive[:n]
+            kept = int(keep.sum())
+            if kept == n:
+                return
+            for array in (self.x, self.y, self.vx, self.vy, self.damage):
+                array[:kept] = array[:n][keep]
+            self.alive[:kept] = True
+            self.alive[kept:n] = False
+            self.count = kept
+        else:
+            if all(self.alive):
+                return
+            rows = [i for i in range(n) if self.alive[i]]
+            self.x = [self.x[i] for i in rows]
+            self.y = [self.y[i] for i in rows]
+            self.vx = [self.vx[i] for i in rows]
+            self.vy = [self.vy[i] for i in rows]
+            self.damage = [self.damage[i] for i in rows]
+            self.alive = [True] * len(rows)
+            self.count = len(rows)
+
+    def update(self):
+        """Move every bullet one frame and remove those that left the screen"""
+        n = self.count
+        if not n:
+            return
+        if self.use_numpy:
+            x = self.x[:n]
+            y = self.y[:n]
+            x += self.vx[:n]
+            y += self.vy[:n]
+            self.alive[:n] &= (y + BULLET_HEIGHT >= 0) & (x + BULLET_WIDTH >= 0) & (x <= SCREEN_WIDTH)
+        else:
+            x, y, vx, vy, alive = self.x, self.y, self.vx, self.vy, self.alive
+            for i in range(n):
+                x[i] += vx[i]
+                y[i] += vy[i]
+                if y[i] + BULLET_HEIGHT < 0 or x[i] + BULLET_WIDTH < 0 or x[i] > SCREEN_WIDTH:
+                    alive[i] = False
+        self._compact()
+
+    def collide(self, sprites):
+        """Remove bullets that hit any of the sprites
+
+        Like pygame.sprite.groupcollide(bullets, sprites, True, False): every
+        bullet that overlaps at least one sprite is removed and reported with
+        all the sprites it overlaps, in sprite order. In precise collision mode
+        only bullets touching opaque sprite pixels count.
+
+        Returns:
+            List of (damage, [sprites hit]) per removed bullet, in firing order
+        """
+        n = self.count
+        if not n or not sprites:
+            return []
+        sprites = list(sprites)
+
+        if self.use_numpy:
+            x = self.x[:n]
+            y = self.y[:n]
+            boxes = numpy.stack((x, y, x + BULLET_WIDTH, y + BULLET_HEIGHT), axis=1)
+        else:
+            boxes = [(x, y, x + BULLET_WIDTH, y + BULLET_HEIGHT) for x, y in zip(self.x, self.y)]
+
+        precise = is_precise()
+        hits = []
+        for i, indices in collide_boxes(boxes, sprite_boxes(sprites), self.use_numpy):
+            hit = [sprites[j] for j in indices]
+            if precise:
+                x = int(self.x[i])
+                y = int(self.y[i])
+                hit = [sprite for sprite in hit if mask_for(sprite.image).overlap(
+                    bullet_mask(), (x - sprite.rect.x, y - sprite.rect.y)) is not None]
+                if not hit:
+                    continue
+            hits.append((int(self.damage[i]), hit))
+            self.alive[i] = False
+
+        if hits:
+            self._compact()
+        return hits
+
+    def collide_sprite(self, sprite):
+        """Remove bullets that hit one sprite, like pygame.sprite.spritecollide(sprite, bullets, True)
+
+        Returns:
+            List of the damage of each removed bullet
+        """
+        return [damage for damage, _ in self.collide([sprite])]
+
+    def clear(self):
+        """Remove every bullet"""
+        if self.use_numpy:
+            self.alive[:self.count] = False
+        else:
+            self.alive = [False] * self.count
+        self._compact()
+
+    def draw(self, surface, offset=(0, 0)):
+        """Blit every bullet from the shared images, coloured by direction"""
+        n = self.count
+        if not n:
+            return
+        straight = bullet_image(YELLOW)
+        right = bullet_image(CYAN)
+        left = bullet_image(PINK)
+        dx, dy = offset
+        if self.use_numpy:
+            xs = self.x[:n].tolist()
+            ys = self.y[:n].tolist()
+            vxs = self.vx[:n].tolist()
+        else:
+            xs, ys, vxs = self.x, self.y, self.vx
+        surface.blits([(straight if vx == 0 else right if vx > 0 else left, (x + dx, y + dy))
+                       for x, y, vx in zip(xs, ys, vxs)], False)
@@ -0,0 +1,182 @@
+"""
+Collision kernel
+
+Tests two lists of axis-aligned boxes against each other in one batched step
+instead of pairwise Rect checks in Python. Small and medium tests use a numpy
+broadcast over every (a, b) pair; large ones, or any test without numpy, use
+sort-and-sweep: the b boxes are sorted by their left edge once, and each a box
+only checks the b boxes whose left edge falls within its horizontal reach.
+
+groupcollide() and spritecollide() are drop-ins for the pygame.sprite
+functions of the same name, including their dokill arguments. In precise mode
+(configure(precise=True)) box hits are confirmed with pygame.mask overlap
+tests, using one mask per image; images are cached and shared per frame
+(bee wing states, player engine frames, missile rotations), so masks are built
+once per frame image rather than once per test.
+"""
+import bisect
+import weakref
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Most (a, b) pairs tested with a numpy broadcast; larger tests are swept
+BROADCAST_MAX_PAIRS = 200000
+
+# Collision settings, changed with configure()
+_settings = {'precise': False}  # Confirm box hits with pixel masks
+
+# Image -> Mask, dropped together with the image
+_masks = weakref.WeakKeyDictionary()
+
+
+def configure(precise=False):
+    """Change collision settings
+
+    Args:
+        precise: True to confirm box hits with pixel masks, False for boxes only
+    """
+    _settings['precise'] = precise
+
+
+def is_precise():
+    """Return True when box hits are confirmed with pixel masks"""
+    return _settings['precise']
+
+
+def mask_for(image):
+    """Return the mask of an image's opaque pixels, built on first use"""
+    mask = _masks.get(image)
+    if mask is None:
+        mask = _masks[image] = pygame.mask.from_surface(image)
+    return mask
+
+
+def sprites_overlap(sprite_a, sprite_b):
+    """Pixel test for two sprites whose rects overlap"""
+    offset = (sprite_b.rect.x - sprite_a.rect.x, sprite_b.rect.y - sprite_a.rect.y)
+    return mask_for(sprite_a.image).overlap(mask_for(sprite_b.image), offset) is not None
+
+
+def sprite_boxes(sprites):
+    """Return the (left, top, right, bottom) boxes of the sprites' rects"""
+    boxes = []
+    for sprite in sprites:
+        rect = sprite.rect
+        boxes.append((rect.left, rect.top, rect.right, rect.bottom))
+    return boxes
+
+
+def collide_boxes(a, b, use_numpy=None):
+    """Find every overlapping pair of boxes
+
+    Boxes overlap when they share some area, like pygame.Rect.colliderect;
+    boxes with no width or height never overlap anything.
+
+    Args:
+        a: Sequence of (left, top, right, bottom) boxes, or an (n, 4) numpy array
+        b: Sequence of (left, top, right, bottom) boxes, or an (m, 4) numpy array
+        use_numpy: Force (True) or disable (False) numpy; None uses it if installed
+
+    Returns:
+        List of (index in a, [indices in b]) for each a box that hits anything,
+        in a order with b indices ascending
+    """
+    if not len(a) or not len(b):
+        return []
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if use_numpy and numpy is not None and len(a) * len(b) <= BROADCAST_MAX_PAIRS:
+        return _broadcast(numpy.asarray(a, dtype=float), numpy.asarray(b, dtype=float))
+    return _sweep(a, b)
+
+
+def _broadcast(a, b):
+    """Test every pair at once with an (n, m) overlap matrix"""
+    overlap = ((a[:, 0, None] < b[:, 2]) & (b[:, 0] < a[:, 2, None]) &
+               (a[:, 1, None] < b[:, 3]) & (b[:, 1] < a[:, 3, None]))
+    overlap &= ((a[:, 0] < a[:, 2]) & (a[:, 1] < a[:, 3]))[:, None]
+    overlap &= (b[:, 0] < b[:, 2]) & (b[:, 1] < b[:, 3])
+    rows = numpy.flatnonzero(overlap.any(axis=1))
+    return [(i, numpy.flatnonzero(overlap[i]).tolist()) for i in rows.tolist()]
+
+
+def _sweep(a, b):
+    """Test each a box against the b boxes that can reach it along x"""
+    if numpy is not None and isinstance(a, numpy.ndarray):
+        a = a.tolist()
+    if numpy is not None and isinstance(b, numpy.ndarray):
+        b = b.tolist()
+
+    order = sorted((j for j in range(len(b)) if b[j][0] < b[j][2] and b[j][1] < b[j][3]),
+                   key=lambda j: b[j][0])
+    if not order:
+        return []
+    lefts = [b[j][0] for j in order]
+    widest = max(b[j][2] - b[j][0] for j in order)
+
+    hits = []
+    for i, (left, top, right, bottom) in enumerate(a):
+        if left >= right or top >= bottom:
+            continue
+        # Only b boxes starting between (left - widest) and right can overlap along x
+        start = bisect.bisect_right(lefts, left - widest)
+        end = bisect.bisect_left(lefts, right)
+        found = []
+        for k in range(start, end):
+            j = order[k]
+            box = b[j]
+            if left < box[2] and top < box[3] and box[1] < bottom:
+                found.append(j)
+        if found:
+            found.sort()
+            hits.append((i, found))
+    return hits
+
+
+def groupcollide(group_a, group_b, dokill_a, dokill_b):
+    """Batched pygame.sprite.groupcollide
+
+    Returns:
+        Dict of sprite in group_a -> list of sprites in group_b it overlaps
+    """
+    sprites_a = group_a.sprites()
+    sprites_b = group_b.sprites()
+    crashed = {}
+    for i, indices in collide_boxes(sprite_boxes(sprites_a), sprite_boxes(sprites_b)):
+        sprite = sprites_a[i]
+        hit = [sprites_b[j] for j in indices]
+        if _settings['precise']:
+            hit = [other for other in hit if sprites_overlap(sprite, other)]
+            if not hit:
+                continue
+        crashed[sprite] = hit
+
+    if dokill_a:
+        for sprite in crashed:
+            sprite.kill()
+    if dokill_b:
+        for hit in crashed.values():
+            for sprite in hit:
+                sprite.kill()
+    return crashed
+
+
+def spritecollide(sprite, group, dokill):
+    """Batched pygame.sprite.spritecollide
+
+    Returns:
+        List of sprites in group that overlap sprite
+    """
+    sprites = group.sprites()
+    hits = collide_boxes(sprite_boxes([sprite]), sprite_boxes(sprites))
+    crashed = [sprites[j] for j in hits[0][1]] if hits else []
+    if _settings['precise']:
+        crashed = [other for other in crashed if sprites_overlap(sprite, other)]
+    if dokill:
+        for hit in crashed:
+            hit.kill()
+    return crashed
@@ -0,0 +1,92 @@
+"""
+Power-up drop resolver
+
+Decides what, if anything, a killed bee drops. The drop chance and the
+power-up weights depend on the bee's level, the player's weapon and missile
+levels and what made the kill; each combination is compiled once into a
+chance and an alias table, so a kill costs one or two random numbers and a
+dict lookup instead of copying and adjusting the weights and building a
+choice list. Upgrades change the player's levels and so pick a new table.
+"""
+import random
+from src.utils.constants import WEAPON_LEVEL_1, WEAPON_LEVEL_5, MISSILE_LEVEL_4
+from src.game.spawn_director import AliasTable
+
+# What made the kill
+SOURCE_BULLET = 'bullet'
+SOURCE_MISSILE = 'missile'
+SOURCE_BOMB = 'bomb'
+
+# Kills that can drop power-ups; bombed bees drop nothing
+DROP_SOURCES = (SOURCE_BULLET, SOURCE_MISSILE)
+
+# Missile kills drop power-ups 1.5x as often, with missiles slightly more likely
+MISSILE_DROP_FACTOR = 1.5
+MISSILE_EXTRA_WEIGHT = 1
+
+
+def drop_weights(bee_type, weapon_level, missile_level, source):
+    """Return the power-up weights for a kill, adjusted for the player's levels"""
+    weights = dict(bee_type.drop_weights)
+
+    # Slightly increase missile weight for missile kills
+    if source == SOURCE_MISSILE and "missile" in weights:
+        weights["missile"] += MISSILE_EXTRA_WEIGHT
+
+    # Adjust weapon_upgrade weight based on player's weapon level
+    if weapon_level >= WEAPON_LEVEL_5 and "weapon_upgrade" in weights:
+        # Remove weapon upgrade if already at max level
+        weights["weapon_upgrade"] = 0
+    elif weapon_level > WEAPON_LEVEL_1 and "weapon_upgrade" in weights:
+        # Reduce weapon upgrade chance by 30% for each level above 1
+        reduction_factor = 1.0 - (0.3 * (weapon_level - WEAPON_LEVEL_1))
+        weights["weapon_upgrade"] = max(1, int(weights["weapon_upgrade"] * reduction_factor))
+
+    # Adjust missile_upgrade weight based on player's missile level
+    if missile_level >= MISSILE_LEVEL_4 and "missile_upgrade" in weights:
+        # Reduce missile upgrade chance if already at max level
+        weights["missile_upgrade"] = max(1, weights["missile_upgrade"] // 2)
+
+    # If no valid choices (unlikely), default to bomb
+    if not any(weight > 0 for weight in weights.values()):
+        weights = {"bomb": 1}
+    return weights
+
+
+class DropResolver:
+    """Compiled drop tables keyed by (bee level, weapon level, missile level, kill source)"""
+    def __init__(self):
+        self.tables = {}
+
+    def table(self, bee_type, weapon_level, missile_level, source):
+        """Return (drop chance, AliasTable) for a kill, compiling it on first use"""
+        key = (bee_type.level, weapon_level, missile_level, source)
+        entry = self.tables.get(key)
+        if entry is None:
+            chance = bee_type.drop_chance
+            if source == SOURCE_MISSILE:
+                chance *= MISSILE_DROP_FACTOR
+            weights = drop_weights(bee_type, weapon_level, missile_level, source)
+            entry = self.tables[key] = (chance, AliasTable(weights))
+        return entry
+
+    def resolve(self, kills, player, rng=random):
+        """Roll the power-up drops of a frame's kills
+
+        Args:
+            kills: KillEvents (see src.game.kill_events)
+            player: Player, for the weapon and missile levels
+
+        Returns:
+            List of (position, power-up type) for the kills that drop one
+        """
+        drops = []
+        weapon_level = player.weapon_level
+        missile_level = player.missile_level
+        for kill in kills:
+            if kill.source not in DROP_SOURCES:
+                continue
+            chance, table = self.table(kill.bee_type, weapon_level, missile_level, kill.source)
+            if rng.random() < chance:
+                drops.append((kill.position, table.draw(rng)))
+        return drops
@@ -8,22 +8,35 @@ import logging
 from pygame.locals import *
 from src.utils.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, RED, GREEN, BLUE, YELLOW, ORANGE,
-    PURPLE, CYAN, PINK, GREY, LIGHT_BLUE, DARK_BLUE, B_KEY, B_KEY_UPPER,
-    ENEMY_LEVEL_1, ENEMY_LEVEL_2, ENEMY_LEVEL_3, ENEMY_LEVEL_4,
-    WEAPON_LEVEL_1, WEAPON_LEVEL_2, WEAPON_LEVEL_3, WEAPON_LEVEL_4, WEAPON_LEVEL_5,
-    MISSILE_LEVEL_1, MISSILE_LEVEL_2, MISSILE_LEVEL_3, MISSILE_LEVEL_4,
-    LEVEL_THRESHOLDS
+    PURPLE, CYAN, PINK, GREY, LIGHT_BLUE, DARK_BLUE,
+    WEAPON_LEVEL_2, WEAPON_LEVEL_3, WEAPON_LEVEL_4,
+    MISSILE_LEVEL_1, MISSILE_LEVEL_2, MISSILE_LEVEL_3
 )
-from src.utils.resources import load_image, setup_sound_system, play_sound
+from src.utils.definitions import LEVEL_THRESHOLDS
+from src.utils.resources import setup_sound_system, load_sound_files, install_sounds, play_sound, stop_sounds, flush_sounds, play_music
+from src.utils import diagnostics, hotlog, startup_profile
 from src.entities.player import Player
-from src.entities.bee import Bee
-from src.entities.boss import Boss
 from src.entities.powerup import PowerUp
 from src.effects.explosion import Explosion
 from src.effects.bomb_effect import BombEffect
-from src.effects.victory_effect import VictoryEffect
+from src.effects.background import ChunkedBackground
+from src.game.stress import StressConfig, StressDirector
+from src.game.loader import AssetLoader
+from src.game.bullets import BulletManager
+from src.game.swarm import Swarm, SwarmGroup
+from src.game.bee_factory import BeeFactory
+from src.game.timers import TimerWheel
+from src.game import spawn_director
+from src.game.drops import DropResolver, SOURCE_BULLET, SOURCE_MISSILE, SOURCE_BOMB
+from src.game.kill_events import KillBuffer
+from src.game import collision
+from src.game.input_state import (
+    InputState, ACTION_LEFT, ACTION_RIGHT, ACTION_UP, ACTION_DOWN, ACTION_FIRE, ACTION_MISSILE,
+    ACTION_BOMB, ACTION_QUIT, ACTION_RESTART, ACTION_DIAGNOSTICS, ACTION_EXPORT_DIAGNOSTICS
+)
 
 logger = logging.getLogger('bee_shooter.game_manager')
+hot_logger = hotlog.get_logger('bee_shooter.game_manager')
 
 class GameManager:
     """Main game manager class"""
@@ -33,62 +46,68 @@ class GameManager:
         self.screen = None
         self.clock = None
         self.running = True
-        self.game_over = False
         self.score = 0
         self.high_score = 0
         self.debug_info = args.debug
 
+        # Diagnostics overlay (F3) and report export (F4)
+        self.show_diagnostics = False
+        self.diagnostics_path = "diagnostics_report.json"
+        diagnostics.install()
+
+        # Rect-only or pixel-accurate collisions
+        collision.configure(precise=args.precise_collisions)
+
         # Initialize pygame
-        pygame.init()
-        pygame.display.set_caption("Bee Shooter")
+        with startup_profile.phase('pygame init'):
+            pygame.init()
+            pygame.display.set_caption("Bee Shooter")
 
         # Create screen
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
-
-        # Setup sound system
-        self.sounds, self.sound_enabled = setup_sound_system(args)
+        with startup_profile.phase('display'):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.clock = pygame.time.Clock()
+
+        # Show the splash screen before any asset is built
+        with startup_profile.phase('splash'):
+            self.splash_title_font = pygame.font.Font(None, 72)
+            self.splash_font = pygame.font.Font(None, 28)
+            self.loader = AssetLoader()
+            self.loading = True
+            self.draw_splash()
+            pygame.display.flip()
+        startup_profile.mark('first_frame')
 
-        # Start background music if sound is enabled
+        # Initialize the mixer here, decode the effects on a worker; music starts once they are ready
+        # (dummy sounds stand in until then, and for good if sound is disabled)
+        self.sound_enabled = setup_sound_system(args)
+        self.sounds = install_sounds({})
         if self.sound_enabled:
-            try:
-                # Play background music on a loop (-1 means loop indefinitely)
-                print("Attempting to play background music...")
-                play_sound('background_music', channel='background_music', loops=-1, fade_ms=2000)
-                print("Background music started successfully")
-                logger.info("Background music started")
-            except Exception as e:
-                print(f"Failed to play background music: {e}")
-                logger.error(f"Failed to play background music: {e}")
-                # Continue game without background music
+            self.loader.submit("sound", load_sound_files, self.on_sound_ready)
 
-        # Initialize sprite groups
-        self.all_sprites = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.bees = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
-        self.explosions = pygame.sprite.Group()
-        self.missiles_group = pygame.sprite.Group()
+        # Bee contact never ends the game when set (used by scripted benchmark runs)
+        self.invulnerable = False
 
-        # Screen shake effect
-        self.screen_shake = 0
+        # Keyboard and mouse state, sampled once per tick (bomb presses are debounced there)
+        self.input = InputState()
 
-        # B key debounce variables
-        self.last_b_key_time = 0
-        self.b_key_debounce_time = 500  # milliseconds
-
-        # Auto-missile launch variables
-        self.last_auto_missile_time = 0
+        # Auto-missile launch delay
         self.auto_missile_delay = 3000  # Launch a missile every 3 seconds
 
-        # Background scrolling variables
-        self.bg_scroll_x = 0
-        self.bg_scroll_y = 0
+        # Level system settings
+        self.max_level = len(LEVEL_THRESHOLDS)
+        self.level_thresholds = LEVEL_THRESHOLDS  # From the definitions file
+
+        # Background scrolling speeds
         self.bg_scroll_speed = 5.0  # Very fast scrolling speed for high-speed flight effect
         self.bg_auto_scroll_speed = 3.0  # Faster automatic vertical scrolling speed
 
-        # Create background
-        self.background = load_image("background")
+        # Endless background, generated in chunks as it scrolls; the first screen is built on a worker
+        # (chunks are seeded from their position, so they don't share random state with the game)
+        self.background = ChunkedBackground(random.getrandbits(32))
+        self.loader.submit("background",
+                           lambda: self.background.generate_view(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT),
+                           self.on_background_ready)
 
         # Create twinkling stars effect with varying speeds for parallax effect
         self.twinkle_stars = []
@@ -107,14 +126,33 @@ class GameManager:
                 "move_speed": move_speed  # Stars move at different speeds
             })
 
-        # Create moving nebula effect with more red nebulae
+        # Create moving nebula clouds on a worker
         self.nebula_clouds = []
+        nebula_rng = random.Random(random.getrandbits(32))
+        self.loader.submit("nebulae", lambda: self.create_nebula_clouds(nebula_rng),
+                           self.on_nebula_clouds_ready)
+
+        # Power-up drop tables, compiled as they are needed
+        self.drop_resolver = DropResolver()
+
+        # Reusable bees, kept across games
+        with startup_profile.phase('bee prewarm'):
+            self.bee_factory = BeeFactory()
+            self.bee_factory.prewarm()
+
+        # Start the first game
+        with startup_profile.phase('first session'):
+            self.reset_session()
+
+    def create_nebula_clouds(self, rng):
+        """Create moving nebula effect with more red nebulae"""
+        nebula_clouds = []
         for _ in range(4):  # Increased from 2 to 4 for more nebulae
-            x = random.randrange(-100, SCREEN_WIDTH)
-            y = random.randrange(-100, SCREEN_HEIGHT)
-            size = random.randrange(150, 300)
-            speed_x = random.uniform(-0.2, 0.2)
-            speed_y = random.uniform(-0.2, 0.2)
+            x = rng.randrange(-100, SCREEN_WIDTH)
+            y = rng.randrange(-100, SCREEN_HEIGHT)
+            size = rng.randrange(150, 300)
+            speed_x = rng.uniform(-0.2, 0.2)
+            speed_y = rng.uniform(-0.2, 0.2)
 
             # Create a nebula surface with transparency
             nebula_surf = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -132,59 +170,207 @@ class GameManager:
             ]
             # Increase probability of red nebulae (last 5 colors are reddish)
             weights = [1, 1, 1, 3, 3, 3, 3, 3]  # Higher weights for red colors
-            nebula_color = random.choices(nebula_colors, weights=weights, k=1)[0] + (3,)  # Very low alpha
+            nebula_color = rng.choices(nebula_colors, weights=weights, k=1)[0] + (3,)  # Very low alpha
 
             # Draw the nebula as a series of transparent circles
             for _ in range(40):
-                nx = random.randrange(0, size)
-                ny = random.randrange(0, size)
-                nr = random.randrange(20, size // 2)
+                nx = rng.randrange(0, size)
+                ny = rng.randrange(0, size)
+                nr = rng.randrange(20, size // 2)
                 pygame.draw.circle(nebula_surf, nebula_color, (nx, ny), nr)
 
-            self.nebula_clouds.append({"surf": nebula_surf, "pos": [x, y], "speed": (speed_x, speed_y)})
+            nebula_clouds.append({"surf": nebula_surf, "pos": [x, y], "speed": (speed_x, speed_y)})
+
+        return nebula_clouds
+
+    def on_nebula_clouds_ready(self, nebula_clouds):
+        """Swap in the nebula clouds built by the loader"""
+        self.nebula_clouds = nebula_clouds
+
+    def on_background_ready(self, chunks):
+        """Cache the first screen of background chunks, converted to the display format"""
+        self.background.add_chunks(chunks)
+
+    def on_sound_ready(self, decoded):
+        """Store the decoded sounds and start the background music"""
+        self.sounds = install_sounds(decoded)
+
+        # Start streaming background music
+        play_music()
+
+    def finish_loading(self):
+        """Block until every asset has been loaded and swapped in"""
+        self.loader.wait()
+        self.on_loading_finished()
+
+    def on_loading_finished(self):
+        """Leave the splash screen and record the loader's build steps"""
+        self.loading = False
+        for task in self.loader.tasks:
+            startup_profile.record('load ' + task.name, self.loader.timings.get(task.name, 0.0), 'loader')
+        startup_profile.mark('ready')
+
+    def draw_splash(self):
+        """Draw the loading screen with a progress bar"""
+        self.screen.fill(DARK_BLUE)
+
+        title = self.splash_title_font.render("BEE SHOOTER", True, YELLOW)
+        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)))
+
+        bar_width = 300
+        bar_height = 16
+        bar_x = (SCREEN_WIDTH - bar_width) // 2
+        bar_y = SCREEN_HEIGHT * 2 // 3
+        pygame.draw.rect(self.screen, YELLOW, (bar_x, bar_y, int(bar_width * self.loader.progress), bar_height))
+        pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+
+        pending = self.loader.pending()
+        if pending:
+            text = self.splash_font.render("Loading " + ", ".join(pending) + "...", True, WHITE)
+            self.screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, bar_y + 40)))
+
+    def reset_session(self):
+        """Reset the game state for a new game
+
+        Display, audio, background and other assets created in __init__ are
+        reused, so restarting after game over takes a single frame.
+        """
+        self.high_score = max(self.high_score, self.score)
+        self.score = 0
+        self.game_over = False
+
+        # Give the last game's bees back to the pool (there are none before the first game)
+        for bee in list(getattr(self, 'bees', ())):
+            self.bee_factory.release(bee)
+
+        # Don't carry the last game's sound effects over into the new one
+        stop_sounds()
+
+        # Initialize sprite groups
+        self.all_sprites = pygame.sprite.Group()
+        self.bullets = BulletManager()  # Player bullets are arrays, not sprites
+        self.swarm = Swarm()  # Moves every bee in one batched step
+        self.bees = SwarmGroup(self.swarm)
+        self.powerups = pygame.sprite.Group()
+        self.explosions = pygame.sprite.Group()
+        self.effects = pygame.sprite.Group()  # Explosions and bomb and victory effects, still animated after the game ends
+        self.kills = KillBuffer()
+        self.missiles_group = pygame.sprite.Group()
+
+        # Hit flashes and other delayed actions, advanced once per tick
+        self.timers = TimerWheel()
+
+        # Screen shake effect
+        self.screen_shake = 0
+
+        # Auto-missile launch timer
+        self.last_auto_missile_time = 0
+
+        # Background scroll position
+        self.bg_scroll_x = 0
+        self.bg_scroll_y = 0
 
         # Level system variables
         self.current_level = 1
-        self.max_level = 3
         self.level_complete = False
         self.boss_active = False
         self.boss = None
         self.victory = False
-        self.level_thresholds = LEVEL_THRESHOLDS  # Use the constants
 
         # Create player
-        self.player = Player()
+        self.player = Player(self.input)
         self.all_sprites.add(self.player)
 
         # Spawn initial bees for level 1
         self.spawn_bees_for_level(self.current_level)
 
+        # Stress-test mode keeps entity counts topped up to the configured targets
+        self.stress = None
+        if self.args.stress is not None:
+            self.stress = StressDirector(StressConfig(**self.args.stress))
+            self.stress.start(self)
+
     def spawn_bees_for_level(self, level):
         """Spawn bees appropriate for the current level"""
         # Clear existing bees
         for bee in list(self.bees):
-            bee.kill()
+            self.bee_factory.release(bee)
 
         # Reduced number of bees for lower difficulty
         num_bees = 5 + level * 2  # Level 1: 7, Level 2: 9, Level 3: 11
 
-        # Adjust level distribution based on current game level
-        for _ in range(num_bees):
-            # Higher levels have more difficult bees
-            if level == 1:
-                level_weights = [ENEMY_LEVEL_1] * 60 + [ENEMY_LEVEL_2] * 30 + [ENEMY_LEVEL_3] * 10
-                bee_level = random.choice(level_weights)
-            elif level == 2:
-                level_weights = [ENEMY_LEVEL_1] * 30 + [ENEMY_LEVEL_2] * 50 + [ENEMY_LEVEL_3] * 20
-                bee_level = random.choice(level_weights)
-            else:  # Level 3
-                level_weights = [ENEMY_LEVEL_1] * 10 + [ENEMY_LEVEL_2] * 30 + [ENEMY_LEVEL_3] * 40 + [ENEMY_LEVEL_4] * 20
-                bee_level = random.choice(level_weights)
-
-            new_bee = Bee(level=bee_level)
+        # Higher levels have more difficult bees (see spawn_director.LEVEL_BEE_WEIGHTS)
+        for bee_level in spawn_director.bee_levels(level, num_bees):
+            new_bee = self.bee_factory.create(bee_level)
             self.all_sprites.add(new_bee)
             self.bees.add(new_bee)
 
+    def kill_bee(self, bee, source, sound='explosion'):
+        """Record a bee that was shot down or bombed and remove it
+
+        Score, explosion, sound and power-up drop are handled with the rest of
+        the frame's kills by process_kills().
+
+        Args:
+            bee: The destroyed bee
+            source: SOURCE_BULLET, SOURCE_MISSILE (drops power-ups more often) or SOURCE_BOMB (no drops)
+            sound: Sound to play for the kill, or None
+        """
+        self.kills.add_bee(bee, source, sound)
+        self.bee_factory.release(bee)
+
+    def defeat_boss(self):
+        """Record the boss's defeat, remove it and move on to the next level or victory"""
+        self.kills.add_boss(self.boss)
+
+        # Remove boss from all sprite groups
+        self.boss.kill()
+        self.boss_active = False
+
+        # Level completion logic
+        if self.current_level < self.max_level:
+            # Advance to next level
+            self.current_level += 1
+            self.level_complete = True
+
+            # Spawn bees for next level
+            self.spawn_bees_for_level(self.current_level)
+        else:
+            # Game completed - victory!
+            self.victory = True
+            from src.effects.victory_effect import VictoryEffect
+            victory_effect = VictoryEffect()
+            self.all_sprites.add(victory_effect)
+            self.effects.add(victory_effect)
+
+    def process_kills(self):
+        """Apply the kills recorded this frame in one batch
+
+        Adds the score once, starts the merged explosions, requests each sound
+        once and spawns the power-ups the kills drop.
+        """
+        kills = self.kills
+        if not kills:
+            return
+
+        self.score += kills.score
+
+        for position, size in kills.merged_explosions():
+            explosion = Explosion(position, size)
+            self.all_sprites.add(explosion)
+            self.explosions.add(explosion)
+            self.effects.add(explosion)
+
+        for name in kills.sounds:
+            play_sound(name)
+
+        for position, powerup_type in self.drop_resolver.resolve(kills.kills, self.player):
+            powerup = PowerUp(position, powerup_type)
+            self.all_sprites.add(powerup)
+            self.powerups.add(powerup)
+
+        kills.clear()
+
     def handle_b_key(self):
         """Handle B key press for bomb"""
         # Use bomb directly here
@@ -192,34 +378,39 @@ class GameManager:
             # Create bomb effect
             bomb_effect = BombEffect(self.player.rect.center)
             self.all_sprites.add(bomb_effect)
+            self.effects.add(bomb_effect)
 
-            # Store bee data
-            bee_data = []
+            # Destroy all bees; the bomb effect has its own sound and bombed bees drop nothing
             for bee in list(self.bees):
-                bee_data.append((bee.rect.center, bee.points))
-
-            # Increase score
-            score_increase = sum(points for _, points in bee_data)
-            self.score += score_increase
-
-            # Remove all bees
-            for bee in list(self.bees):
-                bee.kill()
-
-            # Create explosion effects
-            for pos, _ in bee_data[:5]:
-                explosion = Explosion(pos)
-                self.all_sprites.add(explosion)
-                self.explosions.add(explosion)
+                self.kill_bee(bee, SOURCE_BOMB, sound=None)
 
             # Generate new bees (increased from 3 to 6)
             for _ in range(6):
-                new_bee = Bee()
+                new_bee = self.bee_factory.create()
                 self.all_sprites.add(new_bee)
                 self.bees.add(new_bee)
 
-            # Force event processing to ensure keyboard input isn't blocked
-            pygame.event.pump()
+    def draw_diagnostics(self, font):
+        """Draw last-frame Surface allocations and GC statistics"""
+        lines = ["Surfaces last frame:"]
+        for subsystem, count in sorted(diagnostics.last_frame_surface_counts.items(),
+                                       key=lambda item: -item[1]):
+            lines.append(f"  {subsystem}: {count}")
+
+        gc_stats = diagnostics.gc_stats
+        lines.append("GC: %d/%d/%d  max %.2fms  last %.2fms" % (
+            gc_stats['collections'][0], gc_stats['collections'][1], gc_stats['collections'][2],
+            gc_stats['max_pause_ms'], gc_stats['last_pause_ms']))
+        background = self.background
+        lines.append("Background: %d chunks (%d KB)  %d pending" % (
+            len(background), background.size_bytes // 1024, len(background.pending)))
+        lines.append(f"FPS: {self.clock.get_fps():.1f}")
+
+        y = 60
+        for line in lines:
+            text = font.render(line, True, YELLOW)
+            self.screen.blit(text, (10, y))
+            y += 20
 
     def run(self):
         """Main game loop"""
@@ -227,162 +418,96 @@ class GameManager:
             # Keep loop running at the right speed
             self.clock.tick(FPS)
 
-            # Process input (events)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return False  # Exit the game
-
-                # Custom event for boss redraw after flash
-                elif event.type == pygame.USEREVENT + 1:
-                    # Redraw boss if it exists and is alive
-                    if self.boss_active and self.boss and self.boss.alive():
-                        self.boss.redraw()
-                    # Stop the timer
-                    pygame.time.set_timer(pygame.USEREVENT + 1, 0)
-
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Mouse click to shoot
-                    bullets = self.player.shoot()
-                    if bullets:
-                        for bullet in bullets:
-                            self.all_sprites.add(bullet)
-                            self.bullets.add(bullet)
-
-                elif event.type == pygame.KEYDOWN:
-                    # Keyboard controls
-                    if event.key == pygame.K_ESCAPE:
+            # Sample keyboard and mouse once for this tick
+            events = pygame.event.get()
+            self.input.sample(events, pygame.time.get_ticks())
+            if self.input.quit_requested or self.input.pressed(ACTION_QUIT):
+                self.running = False
+                self.background.close()
+                return False  # Exit the game
+
+            # Keep showing the splash screen until every asset has been swapped in
+            if self.loading:
+                if self.loader.poll():
+                    self.on_loading_finished()
+                    if self.args.profile_startup:
                         self.running = False
-                        return False
-
-                    # Space to shoot
-                    elif event.key == pygame.K_SPACE:
-                        bullets = self.player.shoot()
-                        if bullets:
-                            for bullet in bullets:
-                                self.all_sprites.add(bullet)
-                                self.bullets.add(bullet)
-
-                    # M to launch missile
-                    elif event.key == pygame.K_m:
-                        missiles = self.player.launch_missile()
-                        if missiles:
-                            for missile in missiles:
-                                self.all_sprites.add(missile)
-                                self.missiles_group.add(missile)
-
-                                # Find closest bee for targeting
-                                if self.bees and len(self.bees) > 0:
-                                    try:
-                                        # Get all bees that are on screen or just above it
-                                        valid_targets = [bee for bee in self.bees.sprites()
-                                                        if bee.rect.bottom > -50 and bee.rect.top < SCREEN_HEIGHT]
-
-                                        if valid_targets:
-                                            closest_bee = min(valid_targets,
-                                                            key=lambda bee: ((bee.rect.centerx - missile.rect.centerx)**2 +
-                                                                            (bee.rect.centery - missile.rect.centery)**2))
-                                            missile.set_target(closest_bee)
-                                            print(f"Missile launched and targeting {closest_bee.__class__.__name__} at {closest_bee.rect.center}")
-                                        else:
-                                            # No valid targets, try to find any bee
-                                            closest_bee = min(self.bees.sprites(),
-                                                            key=lambda bee: ((bee.rect.centerx - missile.rect.centerx)**2 +
-                                                                            (bee.rect.centery - missile.rect.centery)**2))
-                                            missile.set_target(closest_bee)
-                                            print(f"Missile launched and targeting off-screen bee at {closest_bee.rect.center}")
-                                    except (ValueError, AttributeError) as e:
-                                        print(f"Error finding target for missile: {e}")
-                                        # If there's an error, try to target the boss instead
-                                        if self.boss_active and self.boss and self.boss.alive():
-                                            missile.set_target(self.boss)
-                                            print(f"Missile targeting boss instead at {self.boss.rect.center}")
-                                # If no bees but boss is active, target the boss
-                                elif self.boss_active and self.boss and self.boss.alive():
-                                    missile.set_target(self.boss)
-                                    print(f"Missile launched and targeting boss at {self.boss.rect.center}")
+                        return False  # Startup profiled, main() prints the report
+                else:
+                    self.draw_splash()
+                    pygame.display.flip()
+                    continue
+
+            # Space or mouse click to shoot
+            if self.input.pressed(ACTION_FIRE):
+                bullets = self.player.shoot()
+                if bullets:
+                    for x, y, angle in bullets:
+                        self.bullets.spawn(x, y, angle)
+
+            # M to launch missile
+            if self.input.pressed(ACTION_MISSILE):
+                missiles = self.player.launch_missile()
+                if missiles:
+                    for missile in missiles:
+                        self.all_sprites.add(missile)
+                        self.missiles_group.add(missile)
+
+                        # Find closest bee for targeting
+                        if self.bees and len(self.bees) > 0:
+                            try:
+                                # Get all bees that are on screen or just above it
+                                valid_targets = [bee for bee in self.bees.sprites()
+                                                if bee.rect.bottom > -50 and bee.rect.top < SCREEN_HEIGHT]
+
+                                if valid_targets:
+                                    closest_bee = min(valid_targets,
+                                                    key=lambda bee: ((bee.rect.centerx - missile.rect.centerx)**2 +
+                                                                    (bee.rect.centery - missile.rect.centery)**2))
+                                    missile.set_target(closest_bee)
+                                    hot_logger.debug("Missile launched and targeting %s at %s", closest_bee.__class__.__name__, closest_bee.rect.center)
                                 else:
-                                    print("Missile launched but no targets available")
-
-                    # Enter to restart after game over
-                    elif event.key == pygame.K_RETURN and (self.game_over or self.victory):
-                        # Reset game
-                        self.__init__(self.args)
-                        self.game_over = False
-                        self.victory = False
-
-                    # Detect B key for bomb with debounce
-                    # Try multiple ways to detect B key
-                    b_key_codes = [B_KEY, B_KEY_UPPER, K_b, pygame.K_b, 98, ord('b'), ord('B')]
-                    if event.key in b_key_codes or pygame.key.name(event.key).lower() == 'b':
-                        print("\n\n*** B KEY PRESSED IN EVENT HANDLER ***\n\n")
-
-                        # Check debounce
-                        now = pygame.time.get_ticks()
-                        if now - self.last_b_key_time > self.b_key_debounce_time:
-                            # Update last B key press time
-                            self.last_b_key_time = now
-
-                            # Use bomb
-                            self.handle_b_key()
-
-                            # Force event processing to ensure keyboard input isn't blocked
-                            pygame.event.pump()
-
-                            # Force update player position
-                            keys = pygame.key.get_pressed()
-                            if keys[K_LEFT] and self.player.rect.left > 0:
-                                self.player.rect.x -= self.player.speed
-                            if keys[K_RIGHT] and self.player.rect.right < SCREEN_WIDTH:
-                                self.player.rect.x += self.player.speed
-                            if keys[K_UP] and self.player.rect.top > 0:
-                                self.player.rect.y -= self.player.speed
-                            if keys[K_DOWN] and self.player.rect.bottom < SCREEN_HEIGHT:
-                                self.player.rect.y += self.player.speed
+                                    # No valid targets, try to find any bee
+                                    closest_bee = min(self.bees.sprites(),
+                                                    key=lambda bee: ((bee.rect.centerx - missile.rect.centerx)**2 +
+                                                                    (bee.rect.centery - missile.rect.centery)**2))
+                                    missile.set_target(closest_bee)
+                                    hot_logger.debug("Missile launched and targeting off-screen bee at %s", closest_bee.rect.center)
+                            except (ValueError, AttributeError) as e:
+                                hot_logger.warning("Error finding target for missile: %s", e)
+                                # If there's an error, try to target the boss instead
+                                if self.boss_active and self.boss and self.boss.alive():
+                                    missile.set_target(self.boss)
+                                    hot_logger.debug("Missile targeting boss instead at %s", self.boss.rect.center)
+                        # If no bees but boss is active, target the boss
+                        elif self.boss_active and self.boss and self.boss.alive():
+                            missile.set_target(self.boss)
+                            hot_logger.debug("Missile launched and targeting boss at %s", self.boss.rect.center)
+                        else:
+                            hot_logger.debug("Missile launched but no targets available")
+
+            # F3 toggles the diagnostics overlay
+            if self.input.pressed(ACTION_DIAGNOSTICS):
+                self.show_diagnostics = not self.show_diagnostics
+
+            # F4 samples top allocators and exports a diagnostics report
+            if self.input.pressed(ACTION_EXPORT_DIAGNOSTICS):
+                diagnostics.export(self.diagnostics_path, diagnostics.sample_allocations())
+
+            # B to use a bomb (debounced by the input state)
+            if self.input.pressed(ACTION_BOMB):
+                self.handle_b_key()
+
+            # Enter to restart after game over
+            if self.input.pressed(ACTION_RESTART) and (self.game_over or self.victory):
+                # Reset game state, keeping display, audio and assets
+                self.reset_session()
 
             # Skip update if game over
             if self.game_over or self.victory:
                 # Only update explosions and effects
-                for sprite in self.all_sprites:
-                    if isinstance(sprite, Explosion) or isinstance(sprite, BombEffect) or isinstance(sprite, VictoryEffect):
-                        sprite.update()
+                self.effects.update()
             else:
-                # Detect B key directly in game loop
-                keys = pygame.key.get_pressed()
-                now = pygame.time.get_ticks()
-
-                # Print pressed keys once per second
-                if self.debug_info and now % 1000 < 20:  # Only print once per second
-                    pressed_keys = [i for i, pressed in enumerate(keys) if pressed]
-                    if pressed_keys:
-                        key_names = [pygame.key.name(k) for k in pressed_keys]
-                        print(f"Currently pressed keys: {key_names}")
-                        print(f"B key code (K_b): {K_b}")
-                        print(f"B key pressed: {keys[K_b]}")
-
-                # Detect B key with debounce mechanism
-                # Try multiple ways to detect B key
-                try:
-                    # Detect all possible B key codes, including uppercase and lowercase
-                    # All possible B key codes
-                    b_key_codes = [B_KEY, B_KEY_UPPER, K_b, pygame.K_b, 98, ord('b'), ord('B')]
-                    # Check if any B key is pressed
-                    b_pressed = any(keys[code] for code in b_key_codes if code < len(keys))
-
-                    # Print B key status
-                    if self.debug_info and now % 1000 < 20:  # Only print once per second
-                        print(f"B_KEY (lowercase): {B_KEY}, pressed: {keys[B_KEY] if B_KEY < len(keys) else 'out of range'}")
-                        print(f"B_KEY_UPPER (uppercase): {B_KEY_UPPER}, pressed: {keys[B_KEY_UPPER] if B_KEY_UPPER < len(keys) else 'out of range'}")
-
-                    # Handle B key press with debounce
-                    if b_pressed and now - self.last_b_key_time > self.b_key_debounce_time:
-                        self.last_b_key_time = now
-                        self.handle_b_key()
-
-                except Exception as e:
-                    if self.debug_info:
-                        print(f"Error detecting B key: {e}")
-
                 # Auto-launch missiles if available
                 now = pygame.time.get_ticks()
                 if now - self.last_auto_missile_time > self.auto_missile_delay:
@@ -406,34 +531,41 @@ class GameManager:
                                                         key=lambda bee: ((bee.rect.centerx - missile.rect.centerx)**2 +
                                                                         (bee.rect.centery - missile.rect.centery)**2))
                                         missile.set_target(closest_bee)
-                                        print(f"Auto-missile targeting {closest_bee.__class__.__name__} at {closest_bee.rect.center}")
+                                        hot_logger.debug("Auto-missile targeting %s at %s", closest_bee.__class__.__name__, closest_bee.rect.center)
                                     else:
                                         # No valid targets, try to find any bee
                                         closest_bee = min(self.bees.sprites(),
                                                         key=lambda bee: ((bee.rect.centerx - missile.rect.centerx)**2 +
                                                                         (bee.rect.centery - missile.rect.centery)**2))
                                         missile.set_target(closest_bee)
-                                        print(f"Auto-missile targeting off-screen bee at {closest_bee.rect.center}")
+                                        hot_logger.debug("Auto-missile targeting off-screen bee at %s", closest_bee.rect.center)
                                 except (ValueError, AttributeError) as e:
-                                    print(f"Error finding target for auto-missile: {e}")
+                                    hot_logger.warning("Error finding target for auto-missile: %s", e)
                                     # If there's an error, try to target the boss instead
                                     if self.boss_active and self.boss and self.boss.alive():
                                         missile.set_target(self.boss)
-                                        print(f"Auto-missile targeting boss instead at {self.boss.rect.center}")
+                                        hot_logger.debug("Auto-missile targeting boss instead at %s", self.boss.rect.center)
                             # If no bees but boss is active, target the boss
                             elif self.boss_active and self.boss and self.boss.alive():
                                 missile.set_target(self.boss)
-                                print(f"Auto-missile targeting boss at {self.boss.rect.center}")
+                                hot_logger.debug("Auto-missile targeting boss at %s", self.boss.rect.center)
                             else:
-                                print("Auto-missile launched but no targets available")
+                                hot_logger.debug("Auto-missile launched but no targets available")
+
+                # Top up entity counts in stress-test mode
+                if self.stress:
+                    self.stress.update(self)
 
-                # Update all sprites
+                # Run due timers (hit flashes), then update all sprites
+                self.timers.advance()
                 self.all_sprites.update()
+                self.swarm.update()
+                self.bullets.update()
 
                 # Update missile targets if needed
                 for missile in self.missiles_group:
                     # If missile has no target or target is no longer alive
-                    if missile.target_seeking and (missile.target is None or not hasattr(missile.target, 'alive') or not missile.target.alive()):
+                    if missile.target_seeking and not missile.target_alive():
                         # Find a new target
                         if self.bees and len(self.bees) > 0:
                             # Find closest bee
@@ -442,30 +574,30 @@ class GameManager:
                                                 key=lambda bee: ((bee.rect.centerx - missile.rect.centerx)**2 +
                                                                 (bee.rect.centery - missile.rect.centery)**2))
                                 missile.set_target(closest_bee)
-                                print(f"Missile assigned target: {closest_bee.__class__.__name__} at {closest_bee.rect.center}")
+                                hot_logger.debug("Missile assigned target: %s at %s", closest_bee.__class__.__name__, closest_bee.rect.center)
                             except (ValueError, AttributeError) as e:
-                                print(f"Error finding closest bee: {e}")
+                                hot_logger.warning("Error finding closest bee: %s", e)
                                 # If there's an error, try to target the boss instead
                                 if self.boss_active and self.boss and self.boss.alive():
                                     missile.set_target(self.boss)
-                                    print(f"Missile assigned boss target at {self.boss.rect.center}")
+                                    hot_logger.debug("Missile assigned boss target at %s", self.boss.rect.center)
                         elif self.boss_active and self.boss and self.boss.alive():
                             # Target boss if no bees
                             missile.set_target(self.boss)
-                            print(f"Missile assigned boss target at {self.boss.rect.center}")
+                            hot_logger.debug("Missile assigned boss target at %s", self.boss.rect.center)
 
                 # Update background scroll position based on player movement
                 # Use different speeds for different layers to create parallax effect
                 player_move_speed_x = self.bg_scroll_speed * 1.5
                 player_move_speed_y = self.bg_scroll_speed * 1.5
 
-                if keys[K_LEFT]:
+                if self.input.held(ACTION_LEFT):
                     self.bg_scroll_x += player_move_speed_x
-                if keys[K_RIGHT]:
+                if self.input.held(ACTION_RIGHT):
                     self.bg_scroll_x -= player_move_speed_x
-                if keys[K_UP]:
+                if self.input.held(ACTION_UP):
                     self.bg_scroll_y += player_move_speed_y
-                if keys[K_DOWN]:
+                if self.input.held(ACTION_DOWN):
                     self.bg_scroll_y -= player_move_speed_y
 
                 # Apply automatic vertical scrolling for high-speed flight effect
@@ -485,121 +617,22 @@ class GameManager:
                 # No need to wrap manually - our new rendering system handles this
 
                 # Check for bullet-bee collisions
-                hits = pygame.sprite.groupcollide(self.bullets, self.bees, True, False)
-                for bullet, bees_hit in hits.items():
+                hits = self.bullets.collide(self.bees)
+                for damage, bees_hit in hits:
                     for bee in bees_hit:
-                        if bee.hit(bullet.damage):
-                            # Add score
-                            self.score += bee.points
-
-                            # Create explosion
-                            explosion = Explosion(bee.rect.center)
-                            self.all_sprites.add(explosion)
-                            self.explosions.add(explosion)
-
-                            # Play explosion sound
-                            play_sound('explosion', channel='explosion')
-
-                            # Random chance to spawn a power-up based on bee's drop chance
-                            if random.random() < bee.drop_chance:
-                                # Determine power-up type based on bee's drop weights and player's weapon level
-                                weights = dict(bee.drop_weights)  # Copy the weights
-
-                                # Adjust weapon_upgrade weight based on player's weapon level
-                                if self.player.weapon_level >= WEAPON_LEVEL_5 and "weapon_upgrade" in weights:
-                                    # Remove weapon upgrade if already at max level
-                                    weights["weapon_upgrade"] = 0
-                                elif self.player.weapon_level > WEAPON_LEVEL_1 and "weapon_upgrade" in weights:
-                                    # Reduce weapon upgrade chance by 30% for each level above 1
-                                    reduction_factor = 1.0 - (0.3 * (self.player.weapon_level - WEAPON_LEVEL_1))
-                                    weights["weapon_upgrade"] = max(1, int(weights["weapon_upgrade"] * reduction_factor))
-
-                                # Adjust missile_upgrade weight based on player's missile level
-                                if self.player.missile_level >= MISSILE_LEVEL_4 and "missile_upgrade" in weights:
-                                    # Reduce missile upgrade chance if already at max level
-                                    weights["missile_upgrade"] = max(1, weights["missile_upgrade"] // 2)
-
-                                # Create weighted choices list
-                                powerup_choices = []
-                                for ptype, weight in weights.items():
-                                    if weight > 0:  # Only add types with weight > 0
-                                        powerup_choices.extend([ptype] * weight)
-
-                                # If no valid choices (unlikely), default to bomb
-                                if not powerup_choices:
-                                    powerup_type = "bomb"
-                                else:
-                                    powerup_type = random.choice(powerup_choices)
-
-                                # Create power-up
-                                powerup = PowerUp(bee.rect.center, powerup_type)
-                                self.all_sprites.add(powerup)
-                                self.powerups.add(powerup)
-
-                            # Remove the bee
-                            bee.kill()
+                        # Skip bees already killed by another bullet this frame
+                        if bee.alive() and bee.hit(damage, self.timers):
+                            self.kill_bee(bee, SOURCE_BULLET)
 
                 # Check for missile-bee collisions
-                hits = pygame.sprite.groupcollide(self.missiles_group, self.bees, True, False)
+                hits = collision.groupcollide(self.missiles_group, self.bees, True, False)
                 for missile, bees_hit in hits.items():
                     for bee in bees_hit:
-                        if bee.hit(missile.damage):
-                            # Add score
-                            self.score += bee.points
-
-                            # Create explosion
-                            explosion = Explosion(bee.rect.center)
-                            self.all_sprites.add(explosion)
-                            self.explosions.add(explosion)
-
-                            # Play explosion sound
-                            play_sound('explosion', channel='explosion')
-
-                            # Higher chance to spawn a power-up with missiles (1.5x normal drop rate)
-                            if random.random() < (bee.drop_chance * 1.5):
-                                # Determine power-up type with weighted probabilities favoring missiles
-                                weights = dict(bee.drop_weights)  # Copy the weights
-
-                                # Slightly increase missile weight
-                                if "missile" in weights:
-                                    weights["missile"] += 1
-
-                                # Adjust weapon_upgrade weight based on player's weapon level
-                                if self.player.weapon_level >= WEAPON_LEVEL_5 and "weapon_upgrade" in weights:
-                                    # Remove weapon upgrade if already at max level
-                                    weights["weapon_upgrade"] = 0
-                                elif self.player.weapon_level > WEAPON_LEVEL_1 and "weapon_upgrade" in weights:
-                                    # Reduce weapon upgrade chance by 30% for each level above 1
-                                    reduction_factor = 1.0 - (0.3 * (self.player.weapon_level - WEAPON_LEVEL_1))
-                                    weights["weapon_upgrade"] = max(1, int(weights["weapon_upgrade"] * reduction_factor))
-
-                                # Adjust missile_upgrade weight based on player's missile level
-                                if self.player.missile_level >= MISSILE_LEVEL_4 and "missile_upgrade" in weights:
-                                    # Reduce missile upgrade chance if already at max level
-                                    weights["missile_upgrade"] = max(1, weights["missile_upgrade"] // 2)
-
-                                # Create weighted choices list
-                                powerup_choices = []
-                                for ptype, weight in weights.items():
-                                    if weight > 0:  # Only add types with weight > 0
-                                        powerup_choices.extend([ptype] * weight)
-
-                                # If no valid choices (unlikely), default to bomb
-                                if not powerup_choices:
-                                    powerup_type = "bomb"
-                                else:
-                                    powerup_type = random.choice(powerup_choices)
-
-                                # Create power-up
-                                powerup = PowerUp(bee.rect.center, powerup_type)
-                                self.all_sprites.add(powerup)
-                                self.powerups.add(powerup)
-
-                            # Remove the bee
-                            bee.kill()
+                        if bee.alive() and bee.hit(missile.damage, self.timers):
+                            self.kill_bee(bee, SOURCE_MISSILE)
 
                 # Check for player-powerup collisions
-                hits = pygame.sprite.spritecollide(self.player, self.powerups, True)
+                hits = collision.spritecollide(self.player, self.powerups, True)
                 for hit in hits:
                     # Apply power-up effect
                     if hit.type == "weapon_upgrade":
@@ -612,11 +645,11 @@ class GameManager:
                         self.player.upgrade_missile()
 
                 # Check for bee-player collisions
-                hits = pygame.sprite.spritecollide(self.player, self.bees, False)
-                if hits and not self.game_over:
+                hits = collision.spritecollide(self.player, self.bees, False)
+                if hits and not self.game_over and not self.invulnerable:
                     self.game_over = True
                     # Play game over sound
-                    play_sound('game_over', channel='game_over', fade_ms=500)
+                    play_sound('game_over', fade_ms=500)
 
                 # Check if we need to spawn more bees
                 if not self.boss_active and not self.game_over and not self.victory:
@@ -625,158 +658,66 @@ class GameManager:
                         # Calculate how many bees to spawn
                         num_to_spawn = 5 + self.current_level * 2 - len(self.bees)
 
-                        # Spawn new bees
-                        for _ in range(num_to_spawn):
-                            # Determine bee level based on current game level
-                            if self.current_level == 1:
-                                level_weights = [ENEMY_LEVEL_1] * 60 + [ENEMY_LEVEL_2] * 30 + [ENEMY_LEVEL_3] * 10
-                            elif self.current_level == 2:
-                                level_weights = [ENEMY_LEVEL_1] * 30 + [ENEMY_LEVEL_2] * 50 + [ENEMY_LEVEL_3] * 20
-                            else:  # Level 3
-                                level_weights = [ENEMY_LEVEL_1] * 10 + [ENEMY_LEVEL_2] * 30 + [ENEMY_LEVEL_3] * 40 + [ENEMY_LEVEL_4] * 20
-
-                            bee_level = random.choice(level_weights)
-                            new_bee = Bee(level=bee_level)
+                        # Spawn new bees, with the level mix of the current game level
+                        for bee_level in spawn_director.bee_levels(self.current_level, num_to_spawn):
+                            new_bee = self.bee_factory.create(bee_level)
                             self.all_sprites.add(new_bee)
                             self.bees.add(new_bee)
 
                     # Level progression logic - check if score threshold reached to spawn boss
+                    # (stress runs stay on one level so the entity counts hold)
                     current_threshold = self.level_thresholds[self.current_level - 1]  # Arrays are 0-indexed
-                    if self.score >= current_threshold:
-                        # Spawn boss for current level
+                    if self.score >= current_threshold and not self.stress:
+                        # Spawn boss for current level (imported on first use)
+                        from src.entities.boss import Boss
                         self.boss = Boss(self.current_level)
                         self.all_sprites.add(self.boss)
                         self.boss_active = True
 
                         # Clear regular bees when boss appears
                         for bee in list(self.bees):
-                            bee.kill()
+                            self.bee_factory.release(bee)
 
                 # Boss battle logic
                 if self.boss_active and self.boss.alive():
                     # Check for bullet-boss collisions
-                    hits = pygame.sprite.spritecollide(self.boss, self.bullets, True)
+                    hits = self.bullets.collide_sprite(self.boss)
                     for hit in hits:
-                        if self.boss.hit(1):  # Boss defeated
-                            # Add score
-                            self.score += self.boss.points
-
-                            # Remove boss from all sprite groups
-                            self.boss.kill()
-                            self.boss_active = False
-
-                            # Create explosion
-                            for _ in range(10):  # Multiple explosions for boss
-                                pos = (self.boss.rect.centerx + random.randint(-50, 50),
-                                      self.boss.rect.centery + random.randint(-50, 50))
-                                explosion = Explosion(pos)
-                                explosion_size = random.randint(30, 60)
-                                explosion.image = pygame.transform.scale(explosion.image, (explosion_size, explosion_size))
-                                self.all_sprites.add(explosion)
-                                self.explosions.add(explosion)
-
-                            # Play explosion sound
-                            play_sound('explosion', channel='explosion2')
-
-                            # Level completion logic
-                            if self.current_level < self.max_level:
-                                # Advance to next level
-                                self.current_level += 1
-                                self.level_complete = True
-
-                                # Spawn bees for next level
-                                self.spawn_bees_for_level(self.current_level)
-                            else:
-                                # Game completed - victory!
-                                self.victory = True
-                                victory_effect = VictoryEffect()
-                                self.all_sprites.add(victory_effect)
+                        if self.boss.hit(1, self.timers):  # Boss defeated
+                            self.defeat_boss()
+                            break
 
                     # Check for missile-boss collisions
-                    hits = pygame.sprite.spritecollide(self.boss, self.missiles_group, True)
-                    for hit in hits:
-                        if self.boss.hit(3):  # Missiles do more damage
-                            # Same logic as above for boss defeat
-                            self.score += self.boss.points
-
-                            # Remove boss from all sprite groups
-                            self.boss.kill()
-                            self.boss_active = False
-
-                            for _ in range(10):
-                                pos = (self.boss.rect.centerx + random.randint(-50, 50),
-                                      self.boss.rect.centery + random.randint(-50, 50))
-                                explosion = Explosion(pos)
-                                explosion_size = random.randint(30, 60)
-                                explosion.image = pygame.transform.scale(explosion.image, (explosion_size, explosion_size))
-                                self.all_sprites.add(explosion)
-                                self.explosions.add(explosion)
-
-                            play_sound('explosion', channel='explosion')
-
-                            if self.current_level < self.max_level:
-                                self.current_level += 1
-                                self.level_complete = True
-                                self.spawn_bees_for_level(self.current_level)
-                            else:
-                                self.victory = True
-                                victory_effect = VictoryEffect()
-                                self.all_sprites.add(victory_effect)
+                    if self.boss.alive():
+                        hits = collision.spritecollide(self.boss, self.missiles_group, True)
+                        for hit in hits:
+                            if self.boss.hit(3, self.timers):  # Missiles do more damage
+                                self.defeat_boss()
+                                break
 
-                    # Process boss attacks
+                    # Spawn the bees of attacks the boss made this frame
                     if self.boss.alive():
-                        # Check if boss has attacked
-                        attack_bees = self.boss.attack()
-                        if attack_bees:
-                            # Add spawned bees to sprite groups
-                            for bee in attack_bees:
-                                self.all_sprites.add(bee)
-                                self.bees.add(bee)
+                        for bee_level, anchor, position in self.boss.take_spawns():
+                            bee = self.bee_factory.create(bee_level)
+                            setattr(bee.rect, anchor, position)
+                            self.all_sprites.add(bee)
+                            self.bees.add(bee)
 
                 # Update screen shake effect
                 if self.screen_shake > 0:
                     self.screen_shake -= 1
 
+            # Score, explode and roll drops for this frame's kills together
+            self.process_kills()
+
             # Calculate screen shake offset
             shake_offset = (0, 0)
             if self.screen_shake > 0:
                 shake_offset = (random.randint(-5, 5), random.randint(-5, 5))
 
             # Draw / render
-            # Draw scrolling background with shake offset
-            # Use modulo for seamless scrolling of the large background
-            bg_width = self.background.get_width()
-            bg_height = self.background.get_height()
-
-            # Calculate the visible portion of the background
-            # We use modulo to wrap around the background seamlessly
-            view_x = int(self.bg_scroll_x) % bg_width
-            view_y = int(self.bg_scroll_y) % bg_height
-
-            # Draw the background in a way that ensures seamless scrolling
-            # We need to draw up to 4 sections to cover the screen when scrolling
-            self.screen.blit(self.background,
-                           (-view_x + shake_offset[0],
-                            -view_y + shake_offset[1]))
-
-            # Draw additional sections if needed to cover the screen edges
-            if view_x + SCREEN_WIDTH > bg_width:
-                # Draw right section
-                self.screen.blit(self.background,
-                               (bg_width - view_x + shake_offset[0],
-                                -view_y + shake_offset[1]))
-
-            if view_y + SCREEN_HEIGHT > bg_height:
-                # Draw bottom section
-                self.screen.blit(self.background,
-                               (-view_x + shake_offset[0],
-                                bg_height - view_y + shake_offset[1]))
-
-            if view_x + SCREEN_WIDTH > bg_width and view_y + SCREEN_HEIGHT > bg_height:
-                # Draw bottom-right section
-                self.screen.blit(self.background,
-                               (bg_width - view_x + shake_offset[0],
-                                bg_height - view_y + shake_offset[1]))
+            # Draw scrolling background with shake offset, only the chunks on screen
+            self.background.draw(self.screen, self.bg_scroll_x, self.bg_scroll_y, shake_offset)
 
             # Draw moving nebula clouds (behind stars)
             for cloud in self.nebula_clouds:
@@ -828,9 +769,11 @@ class GameManager:
             # Draw all sprites
             for sprite in self.all_sprites:
                 self.screen.blit(sprite.image, (sprite.rect.x + shake_offset[0], sprite.rect.y + shake_offset[1]))
+            self.bullets.draw(self.screen, shake_offset)
 
             # Use smaller font for status displays
             small_font = pygame.font.Font(None, 24)  # Reduced from 36 to 24
+            diagnostics.count_surface('font')
 
             # Draw score
             score_text = small_font.render(f"Score: {self.score}", True, WHITE)
@@ -865,21 +808,42 @@ class GameManager:
             missile_level_text = small_font.render(f"Missile: Lv.{self.player.missile_level}", True, WHITE)
             self.screen.blit(missile_level_text, (status_x, status_y_start + status_y_spacing * 3))
 
+            # Draw live entity counts in stress-test mode
+            if self.stress:
+                stress_text = small_font.render(
+                    f"Stress - bees: {len(self.bees)} bullets: {len(self.bullets)} "
+                    f"missiles: {len(self.missiles_group)} powerups: {len(self.powerups)} "
+                    f"FPS: {self.clock.get_fps():.1f}", True, YELLOW)
+                self.screen.blit(stress_text, (10, SCREEN_HEIGHT - 25))
+
             # Draw game over message
             if self.game_over:
                 # Use medium font for game over message (reduced from 74 to 60)
                 medium_font = pygame.font.Font(None, 60)
+                diagnostics.count_surface('font')
                 text = medium_font.render("GAME OVER", True, RED)
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
                 self.screen.blit(text, text_rect)
 
                 # Use small font for instructions (reduced from 36 to 28)
                 small_font_2 = pygame.font.Font(None, 28)
+                diagnostics.count_surface('font')
                 text = small_font_2.render("Press ENTER to play again", True, WHITE)
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))  # Adjusted position
                 self.screen.blit(text, text_rect)
 
+            # Draw diagnostics overlay
+            if self.show_diagnostics:
+                self.draw_diagnostics(small_font)
+
+            # Play this frame's sound effects, coalescing duplicate triggers
+            flush_sounds()
+
             # After drawing everything, flip the display
             pygame.display.flip()
 
+            # Close this frame's allocation counters
+            diagnostics.end_frame()
+
+        self.background.close()
         pygame.quit()
@@ -0,0 +1,150 @@
+"""
+Input state
+
+Samples the keyboard and mouse once per tick into compact action bitsets.
+Everything that reacts to input reads an InputState instead of polling pygame,
+which also makes input easy to remap and to record or replay.
+"""
+import pygame
+from src.utils.constants import B_KEY
+
+# Action bits
+ACTION_LEFT = 1 << 0
+ACTION_RIGHT = 1 << 1
+ACTION_UP = 1 << 2
+ACTION_DOWN = 1 << 3
+ACTION_FIRE = 1 << 4
+ACTION_MISSILE = 1 << 5
+ACTION_BOMB = 1 << 6
+ACTION_QUIT = 1 << 7
+ACTION_RESTART = 1 << 8
+ACTION_DIAGNOSTICS = 1 << 9
+ACTION_EXPORT_DIAGNOSTICS = 1 << 10
+
+# Default keyboard bindings (key code -> action bit)
+DEFAULT_KEY_BINDINGS = {
+    pygame.K_LEFT: ACTION_LEFT,
+    pygame.K_RIGHT: ACTION_RIGHT,
+    pygame.K_UP: ACTION_UP,
+    pygame.K_DOWN: ACTION_DOWN,
+    pygame.K_SPACE: ACTION_FIRE,
+    pygame.K_m: ACTION_MISSILE,
+    B_KEY: ACTION_BOMB,
+    pygame.K_ESCAPE: ACTION_QUIT,
+    pygame.K_RETURN: ACTION_RESTART,
+    pygame.K_F3: ACTION_DIAGNOSTICS,
+    pygame.K_F4: ACTION_EXPORT_DIAGNOSTICS,
+}
+
+# Default mouse bindings (button number -> action bit); any click shoots
+DEFAULT_MOUSE_BINDINGS = {
+    1: ACTION_FIRE,
+    2: ACTION_FIRE,
+    3: ACTION_FIRE,
+}
+
+# Minimum time between two accepted presses of an action (milliseconds)
+DEFAULT_DEBOUNCE = {
+    ACTION_BOMB: 500,
+}
+
+
+class InputState:
+    """Per-tick snapshot of which actions are held and which were just pressed
+
+    Args:
+        key_bindings: Dict of key code -> action bit (defaults to DEFAULT_KEY_BINDINGS)
+        mouse_bindings: Dict of mouse button -> action bit
+        debounce: Dict of action bit -> minimum milliseconds between presses
+    """
+    def __init__(self, key_bindings=None, mouse_bindings=None, debounce=None):
+        self.key_bindings = dict(DEFAULT_KEY_BINDINGS if key_bindings is None else key_bindings)
+        self.mouse_bindings = dict(DEFAULT_MOUSE_BINDINGS if mouse_bindings is None else mouse_bindings)
+        self.debounce = dict(DEFAULT_DEBOUNCE if debounce is None else debounce)
+
+        self.held_bits = 0      # Actions whose key is down this tick
+        self.pressed_bits = 0   # Actions that went down this tick (after debounce)
+        self.quit_requested = False
+
+        self.last_press = {}    # Action bit -> time of the last accepted press
+        self.recording = None   # List of (held, pressed) per tick while recording
+        self.replay = None      # Iterator of recorded (held, pressed) to play back
+
+    def bind_key(self, key, action):
+        """Bind a key to an action, replacing any previous binding for that key"""
+        self.key_bindings[key] = action
+
+    def unbind_key(self, key):
+        """Remove a key binding"""
+        self.key_bindings.pop(key, None)
+
+    def sample(self, events, now):
+        """Fold this tick's events and the keyboard state into the action bitsets
+
+        Args:
+            events: Events returned by pygame.event.get() this tick
+            now: Current time in milliseconds
+        """
+        event_bits = 0
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit_requested = True
+            elif event.type == pygame.KEYDOWN:
+                event_bits |= self.key_bindings.get(event.key, 0)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                event_bits |= self.mouse_bindings.get(event.button, 0)
+
+        if self.replay is not None:
+            held, pressed = next(self.replay, (0, 0))
+        else:
+            # The only keyboard poll of the tick
+            keys = pygame.key.get_pressed()
+            held = 0
+            for key, action in self.key_bindings.items():
+                if keys[key]:
+                    held |= action
+
+            # A press is a KEYDOWN event or a key that went down since the last tick
+            pressed = event_bits | (held & ~self.held_bits)
+
+            if pressed and self.debounce:
+                for action, interval in self.debounce.items():
+                    if pressed & action:
+                        if now - self.last_press.get(action, -interval) < interval:
+                            pressed &= ~action
+                        else:
+                            self.last_press[action] = now
+
+        self.held_bits = held
+        self.pressed_bits = pressed
+
+        if self.recording is not None:
+            self.recording.append((held, pressed))
+
+    def held(self, action):
+        """True while any key bound to the action is down"""
+        return self.held_bits & action != 0
+
+    def pressed(self, action):
+        """True on the tick the action was pressed"""
+        return self.pressed_bits & action != 0
+
+    def start_recording(self):
+        """Start recording the sampled bitsets of every tick"""
+        self.recording = []
+
+    def stop_recording(self):
+        """Stop recording and return the recorded (held, pressed) ticks"""
+        recording, self.recording = self.recording, None
+        return recording or []
+
+    def start_replay(self, ticks):
+        """Play back recorded (held, pressed) ticks instead of reading devices
+
+        Quit requests from the event queue are still honoured during a replay.
+        """
+        self.replay = iter(ticks)
+
+    def stop_replay(self):
+        """Return to reading the keyboard and mouse"""
+        self.replay = None
@@ -0,0 +1,111 @@
+"""
+Kill events
+
+Kills made during a frame (bees shot down or bombed, a defeated boss) are
+recorded in a KillBuffer and processed together once per frame by
+GameManager.process_kills(): the score is added once, each sound is requested
+once, power-up drops are rolled in one pass and explosions that land on top of
+each other are merged and capped. A bomb or a boss death then costs about as
+much as an ordinary busy frame instead of one explosion, sound and drop roll
+per bee.
+"""
+import random
+from collections import namedtuple
+
+# Most explosions started per frame, after merging
+MAX_EXPLOSIONS = 12
+
+# Explosions starting in the same cell of this size (pixels) are merged into one
+COALESCE_CELL = 32
+
+# Boss deaths scatter this many explosions around the boss
+BOSS_EXPLOSIONS = 10
+BOSS_EXPLOSION_SPREAD = 50
+BOSS_EXPLOSION_SIZES = (30, 60)
+
+# A killed bee; position, points and type are copied so the bee can be reused at once
+KillEvent = namedtuple('KillEvent', ['position', 'points', 'bee_type', 'source'])
+
+
+def coalesce_explosions(explosions, cell=COALESCE_CELL, limit=MAX_EXPLOSIONS):
+    """Merge explosions that start in the same cell and keep at most limit of them
+
+    Args:
+        explosions: List of (position, size) in the order they were requested
+        cell: Cell size in pixels
+        limit: Most explosions returned
+
+    Returns:
+        List of (position, size), the first explosion of each cell
+    """
+    merged = []
+    cells = set()
+    for position, size in explosions:
+        key = (int(position[0]) // cell, int(position[1]) // cell)
+        if key in cells:
+            continue
+        cells.add(key)
+        merged.append((position, size))
+        if len(merged) >= limit:
+            break
+    return merged
+
+
+class KillBuffer:
+    """Kills, explosions and sounds requested during one frame
+
+    Args:
+        max_explosions: Most explosions started per frame
+        cell: Explosions starting in the same cell of this size are merged
+    """
+    def __init__(self, max_explosions=MAX_EXPLOSIONS, cell=COALESCE_CELL):
+        self.max_explosions = max_explosions
+        self.cell = cell
+        self.kills = []
+        self.score = 0
+        self.explosions = []
+        self.sounds = []
+
+    def __len__(self):
+        return len(self.kills) + len(self.explosions) + len(self.sounds)
+
+    def add_bee(self, bee, source, sound='explosion'):
+        """Record a killed bee
+
+        Args:
+            bee: The killed bee, free to be released right after this call
+            source: What made the kill (see src.game.drops)
+            sound: Sound to play for the kill, or None
+        """
+        position = bee.rect.center
+        self.kills.append(KillEvent(position, bee.points, bee.bee_type, source))
+        self.score += bee.points
+        self.explosions.append((position, None))
+        if sound is not None:
+            self.add_sound(sound)
+
+    def add_boss(self, boss, rng=random):
+        """Record a defeated boss: its points and a cluster of explosions around it"""
+        self.score += boss.points
+        centerx, centery = boss.rect.center
+        for _ in range(BOSS_EXPLOSIONS):
+            position = (centerx + rng.randint(-BOSS_EXPLOSION_SPREAD, BOSS_EXPLOSION_SPREAD),
+                        centery + rng.randint(-BOSS_EXPLOSION_SPREAD, BOSS_EXPLOSION_SPREAD))
+            self.explosions.append((position, rng.randint(*BOSS_EXPLOSION_SIZES)))
+        self.add_sound('explosion')
+
+    def add_sound(self, name):
+        """Request a sound, played once however many kills ask for it"""
+        if name not in self.sounds:
+            self.sounds.append(name)
+
+    def merged_explosions(self):
+        """Return the merged and capped explosions (position, size) of this frame"""
+        return coalesce_explosions(self.explosions, self.cell, self.max_explosions)
+
+    def clear(self):
+        """Forget everything recorded, ready for the next frame"""
+        self.kills = []
+        self.score = 0
+        self.explosions = []
+        self.sounds = []
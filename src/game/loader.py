@@ -0,0 +1,90 @@
+"""
+Asset loader
+
+Runs asset generation and loading steps on worker threads while the main
+thread keeps the window responsive. Finished results are handed back on the
+main thread, where anything that needs the display (such as Surface.convert)
+can safely be done.
+"""
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('bee_shooter.loader')
+
+
+class LoadTask:
+    """A named asset build step and what to do with its result"""
+    def __init__(self, name, future, on_ready):
+        self.name = name
+        self.future = future
+        self.on_ready = on_ready
+        self.handled = False
+
+
+class AssetLoader:
+    """Build assets on worker threads and swap them in from the main thread
+
+    Args:
+        max_workers: Number of worker threads
+    """
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix='asset-loader')
+        self.tasks = []
+        self.timings = {}  # Task name -> seconds spent on the worker
+        self.started = time.perf_counter()
+
+    def submit(self, name, func, on_ready=None):
+        """Run func() on a worker; on_ready(result) is later called by poll()"""
+        def timed():
+            start = time.perf_counter()
+            try:
+                return func()
+            finally:
+                self.timings[name] = time.perf_counter() - start
+
+        self.tasks.append(LoadTask(name, self.executor.submit(timed), on_ready))
+
+    def poll(self):
+        """Hand finished results to their callbacks; returns True once everything is loaded"""
+        for task in self.tasks:
+            if task.handled or not task.future.done():
+                continue
+            task.handled = True
+            try:
+                result = task.future.result()
+            except Exception as e:
+                logger.error("Loading %s failed: %s", task.name, e, exc_info=True)
+                continue
+            if task.on_ready:
+                task.on_ready(result)
+            logger.debug("Loaded %s in %.3fs", task.name, self.timings.get(task.name, 0.0))
+
+        if self.done:
+            self.executor.shutdown(wait=False)
+        return self.done
+
+    def wait(self):
+        """Block until every task has finished and been handed over"""
+        for task in self.tasks:
+            try:
+                task.future.result()
+            except Exception:
+                pass  # Reported by poll()
+        return self.poll()
+
+    @property
+    def done(self):
+        return all(task.handled for task in self.tasks)
+
+    @property
+    def progress(self):
+        """Fraction of tasks finished (0.0 to 1.0)"""
+        if not self.tasks:
+            return 1.0
+        return sum(1 for task in self.tasks if task.handled) / len(self.tasks)
+
+    def pending(self):
+        """Names of tasks that have not been handed over yet"""
+        return [task.name for task in self.tasks if not task.handled]
@@ -0,0 +1,103 @@
+"""
+Spawn director
+
+Weighted choices used when spawning (bee levels per game level, the level of
+a bee spawned without one, the type of a power-up spawned without one) are
+read from the game definitions and compiled once into alias tables. Each draw
+then costs one random number and two list lookups, and sample(n) draws a
+whole wave without building the 100-element choice lists the spawn code used
+to create per bee.
+"""
+import random
+from src.utils.definitions import DEFINITIONS
+
+
+class AliasTable:
+    """Walker/Vose alias table for O(1) weighted sampling
+
+    Args:
+        weights: Dict of value -> weight; values with weight 0 are never drawn
+    """
+    def __init__(self, weights):
+        items = [(value, weight) for value, weight in weights.items() if weight > 0]
+        if not items:
+            raise ValueError("alias table needs at least one positive weight")
+        self.values = [value for value, _ in items]
+        n = len(items)
+        total = float(sum(weight for _, weight in items))
+
+        # Scale so the average bucket holds exactly 1.0, then pair each
+        # under-full bucket with an over-full one that tops it up
+        scaled = [weight * n / total for _, weight in items]
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Leftovers are 1.0 apart from rounding error
+        for i in small + large:
+            self.probability[i] = 1.0
+
+    def draw(self, rng=random):
+        """Return one weighted random value"""
+        u = rng.random() * len(self.values)
+        i = int(u)
+        if u - i < self.probability[i]:
+            return self.values[i]
+        return self.values[self.alias[i]]
+
+    def sample(self, n, rng=random):
+        """Return a list of n weighted random values"""
+        values = self.values
+        probability = self.probability
+        alias = self.alias
+        size = len(values)
+        result = []
+        for _ in range(n):
+            u = rng.random() * size
+            i = int(u)
+            result.append(values[i] if u - i < probability[i] else values[alias[i]])
+        return result
+
+
+# Bee level mix per game level, from the definitions file; levels past the last one use the last mix
+LEVEL_BEE_WEIGHTS = {level.level: level.bee_weights for level in DEFINITIONS.levels}
+
+# Level of a bee spawned without one (40% level 1, 30% level 2, 20% level 3, 10% level 4 by default)
+RANDOM_BEE_WEIGHTS = DEFINITIONS.random_bee_weights
+
+# Type of a power-up spawned without one (30% weapon, 20% bomb, 20% missile, 30% missile upgrade by default)
+RANDOM_POWERUP_WEIGHTS = DEFINITIONS.random_powerup_weights
+
+_level_tables = {level: AliasTable(weights) for level, weights in LEVEL_BEE_WEIGHTS.items()}
+_random_bee_table = AliasTable(RANDOM_BEE_WEIGHTS)
+_random_powerup_table = AliasTable(RANDOM_POWERUP_WEIGHTS)
+
+
+def level_table(game_level):
+    """Return the bee level table for a game level"""
+    return _level_tables.get(game_level) or _level_tables[max(_level_tables)]
+
+
+def bee_levels(game_level, n, rng=random):
+    """Return the levels of n bees spawned on a game level"""
+    return level_table(game_level).sample(n, rng)
+
+
+def random_bee_level(rng=random):
+    """Return the level of a bee spawned without one"""
+    return _random_bee_table.draw(rng)
+
+
+def random_powerup_type(rng=random):
+    """Return the type of a power-up spawned without one"""
+    return _random_powerup_table.draw(rng)
@@ -0,0 +1,126 @@
+"""
+Stress-test mode
+
+Keeps bees, bullets, missiles and power-ups topped up to configurable counts,
+ramping up along a spawn-rate curve, so the scaling limits of the update,
+collision and render paths can be found without waiting for a real boss swarm.
+"""
+import random
+import logging
+import pygame
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.entities.missile import Missile
+from src.entities.powerup import PowerUp
+from src.game import spawn_director
+
+logger = logging.getLogger('bee_shooter.stress')
+
+# Number of equal steps used by the "step" curve
+STEP_COUNT = 4
+
+# How often the current counts and frame rate are logged (milliseconds)
+REPORT_INTERVAL = 1000
+
+
+class StressConfig:
+    """Target entity counts for a stress run and how fast they are reached
+
+    Args:
+        bees, bullets, missiles, powerups: Target number of live entities
+        curve: "instant", "linear", "quadratic" or "step"
+        ramp_seconds: Time taken by the curve to reach the full targets
+        level: Game level used for the bee mix (None keeps the current level)
+    """
+    def __init__(self, bees=0, bullets=0, missiles=0, powerups=0,
+                 curve='linear', ramp_seconds=10.0, level=None):
+        self.targets = {
+            'bees': bees,
+            'bullets': bullets,
+            'missiles': missiles,
+            'powerups': powerups,
+        }
+        self.curve = curve
+        self.ramp_seconds = ramp_seconds
+        self.level = level
+
+    def fraction(self, elapsed_ms):
+        """Fraction (0.0 to 1.0) of the targets that should be alive at this time"""
+        if self.curve == 'instant' or self.ramp_seconds <= 0:
+            return 1.0
+
+        progress = min(1.0, elapsed_ms / (self.ramp_seconds * 1000.0))
+        if self.curve == 'quadratic':
+            return progress * progress
+        if self.curve == 'step':
+            # Jump up in equal steps, the first one immediately
+            return min(1.0, (int(progress * STEP_COUNT) + 1) / STEP_COUNT)
+        return progress
+
+    def target(self, kind, elapsed_ms):
+        """Number of entities of this kind that should be alive at this time"""
+        return int(self.targets[kind] * self.fraction(elapsed_ms))
+
+
+class StressDirector:
+    """Spawns entities into a GameManager to follow a StressConfig"""
+    def __init__(self, config):
+        self.config = config
+        self.start_time = None
+        self.last_report = 0
+
+    def start(self, game):
+        """Prepare the game for a stress run"""
+        self.start_time = pygame.time.get_ticks()
+        self.last_report = self.start_time
+
+        # A stress run only ends when the player quits
+        game.invulnerable = True
+        if self.config.level is not None:
+            game.current_level = max(1, min(game.max_level, self.config.level))
+            game.spawn_bees_for_level(game.current_level)
+
+        logger.info("Stress mode: targets %s, curve %s over %.1fs",
+                    self.config.targets, self.config.curve, self.config.ramp_seconds)
+
+    def update(self, game):
+        """Top every entity group up to its current target"""
+        now = pygame.time.get_ticks()
+        elapsed = now - self.start_time
+
+        self.spawn_bees(game, self.config.target('bees', elapsed) - len(game.bees))
+        self.spawn_bullets(game, self.config.target('bullets', elapsed) - len(game.bullets))
+        self.spawn_missiles(game, self.config.target('missiles', elapsed) - len(game.missiles_group))
+        self.spawn_powerups(game, self.config.target('powerups', elapsed) - len(game.powerups))
+
+        if now - self.last_report >= REPORT_INTERVAL:
+            self.last_report = now
+            logger.info("Stress t=%.1fs bees=%d bullets=%d missiles=%d powerups=%d sprites=%d fps=%.1f",
+                        elapsed / 1000.0, len(game.bees), len(game.bullets),
+                        len(game.missiles_group), len(game.powerups),
+                        len(game.all_sprites), game.clock.get_fps())
+
+    def spawn_bees(self, game, count):
+        """Spawn bees using the game level's usual mix"""
+        for bee_level in spawn_director.bee_levels(game.current_level, max(0, count)):
+            bee = game.bee_factory.create(bee_level)
+            game.all_sprites.add(bee)
+            game.bees.add(bee)
+
+    def spawn_bullets(self, game, count):
+        """Fire bullets upwards from random points along the bottom edge"""
+        for _ in range(count):
+            game.bullets.spawn(random.randrange(SCREEN_WIDTH), SCREEN_HEIGHT, random.choice([0, -1, 1]))
+
+    def spawn_missiles(self, game, count):
+        """Launch homing missiles; the game loop assigns their targets"""
+        for _ in range(count):
+            missile = Missile(random.randrange(SCREEN_WIDTH), SCREEN_HEIGHT, damage=1, target_seeking=True)
+            game.all_sprites.add(missile)
+            game.missiles_group.add(missile)
+
+    def spawn_powerups(self, game, count):
+        """Drop random power-ups from above the screen"""
+        for _ in range(count):
+            powerup = PowerUp((random.randrange(SCREEN_WIDTH), random.randrange(-SCREEN_HEIGHT, 0)))
+            game.all_sprites.add(powerup)
+            game.powerups.add(powerup)
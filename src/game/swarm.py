@@ -0,0 +1,228 @@
+"""
+Swarm controller
+
+Moves every bee in one batched step. Bee kinematics (position, speed,
+movement timer, circle angle, wing animation) live in one row per bee, with
+the rows of each movement pattern cached as index arrays, so the straight,
+zigzag and circle patterns are each advanced with a handful of array
+operations. The bee sprites stay in their groups for collisions and drawing;
+the swarm only writes their rects back and swaps their image when the wings
+flap. numpy is used when installed, otherwise rows are plain lists.
+"""
+import math
+import pygame
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Movement pattern codes
+PATTERN_STRAIGHT = 0
+PATTERN_ZIGZAG = 1
+PATTERN_CIRCLE = 2
+PATTERN_CODES = {"straight": PATTERN_STRAIGHT, "zigzag": PATTERN_ZIGZAG, "circle": PATTERN_CIRCLE}
+
+# Row columns
+X, Y, WIDTH, VX, VY, TIMER, ANGLE, PATTERN, WING_TIMER, WING_STATE, WING_DELAY = range(11)
+COLUMNS = 11
+
+
+def _round(value):
+    """Round half away from zero, like assigning a float to a pygame.Rect"""
+    return int(value + 0.5) if value >= 0 else int(value - 0.5)
+
+
+class Swarm:
+    """Batched movement for all bees
+
+    Args:
+        capacity: Initial number of rows allocated for the numpy array
+        use_numpy: Force (True) or disable (False) numpy; None uses it if installed
+    """
+    def __init__(self, capacity=256, use_numpy=None):
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy and numpy is not None
+        self.bees = []  # Row -> bee sprite
+        self.count = 0
+        self.state = numpy.zeros((capacity, COLUMNS)) if self.use_numpy else []
+        self._pattern_rows = None  # Pattern code -> row indices, rebuilt after adds and removes
+
+    def __len__(self):
+        return self.count
+
+    def add(self, bee):
+        """Take over a bee's movement, starting from its current rect and speeds"""
+        row = [bee.rect.x, bee.rect.y, bee.rect.width, bee.speedx, bee.speedy, bee.movement_timer,
+               bee.angle, PATTERN_CODES[bee.bee_type.movement_pattern], bee.wing_timer, bee.wing_state,
+               bee.bee_type.wing_delay]
+        if self.use_numpy:
+            if self.count == len(self.state):
+                grown = numpy.zeros((len(self.state) * 2, COLUMNS))
+                grown[:self.count] = self.state[:self.count]
+                self.state = grown
+            self.state[self.count] = row
+        else:
+            self.state.append(row)
+
+        bee.swarm = self
+        bee.swarm_index = self.count
+        self.bees.append(bee)
+        self.count += 1
+        self._pattern_rows = None
+
+    def remove(self, bee):
+        """Hand a bee's movement back to the sprite"""
+        index = bee.swarm_index
+        row = self.state[index]
+        bee.rect.topleft = (int(row[X]), int(row[Y]))
+        bee.speedx = float(row[VX])
+        bee.speedy = float(row[VY])
+        bee.movement_timer = int(row[TIMER])
+        bee.angle = float(row[ANGLE])
+        bee.wing_timer = int(row[WING_TIMER])
+        bee.wing_state = int(row[WING_STATE])
+        bee.swarm = None
+
+        # Move the last row into the gap
+        last = self.count - 1
+        if index != last:
+            moved = self.bees[last]
+            self.bees[index] = moved
+            moved.swarm_index = index
+            self.state[index] = self.state[last]
+        self.bees.pop()
+        if not self.use_numpy:
+            self.state.pop()
+        self.count -= 1
+        self._pattern_rows = None
+
+    def pattern_rows(self):
+        """Row indices of each movement pattern (numpy only)"""
+        if self._pattern_rows is None:
+            patterns = self.state[:self.count, PATTERN]
+            self._pattern_rows = {code: numpy.flatnonzero(patterns == code)
+                                  for code in (PATTERN_ZIGZAG, PATTERN_CIRCLE)}
+        return self._pattern_rows
+
+    def update(self):
+        """Advance every bee one frame and sync their sprites"""
+        if not self.count:
+            return
+        if self.use_numpy:
+            flapped, respawn = self._step_numpy()
+        else:
+            flapped, respawn = self._step_python()
+
+        # Write positions back to the sprites
+        state = self.state
+        if self.use_numpy:
+            positions = state[:self.count, X:Y + 1].astype(int).tolist()
+            for bee, position in zip(self.bees, positions):
+                bee.rect.topleft = position
+        else:
+            for bee, row in zip(self.bees, state):
+                bee.rect.topleft = (row[X], row[Y])
+
+        # Swap to the shared image for the new wing state
+        for index in flapped:
+            bee = self.bees[index]
+            bee.wing_state = int(state[index][WING_STATE])
+            bee.image = bee.bee_type.image(bee.wing_state)
+
+        # Bees that left the screen start again from the top
+        for index in respawn:
+            bee = self.bees[index]
+            bee.respawn()
+            row = state[index]
+            row[X] = bee.rect.x
+            row[Y] = bee.rect.y
+            row[VX] = bee.speedx
+            row[VY] = bee.speedy
+
+    def _step_numpy(self):
+        """Batched step; returns the rows whose wings flapped and those to respawn"""
+        s = self.state[:self.count]
+        s[:, TIMER] += 1
+
+        # Wing flapping: up -> middle -> down -> middle -> down ...
+        s[:, WING_TIMER] += 1
+        flap = s[:, WING_TIMER] >= s[:, WING_DELAY]
+        flapped = numpy.flatnonzero(flap)
+        if len(flapped):
+            s[flapped, WING_TIMER] = 0
+            s[flapped, WING_STATE] = numpy.where(s[flapped, WING_STATE] == 1, 2, 1)
+
+        rows = self.pattern_rows()
+
+        # Zigzag pattern - switch direction every 15 frames
+        zigzag = rows[PATTERN_ZIGZAG]
+        if len(zigzag):
+            speed = numpy.abs(s[zigzag, VX])
+            s[zigzag, VX] = numpy.where(s[zigzag, TIMER] % 30 < 15,
+                                        numpy.minimum(1.5, speed), numpy.maximum(-1.5, -speed))
+
+        # Circular pattern - sideways sine wave while moving down slowly
+        circle = rows[PATTERN_CIRCLE]
+        if len(circle):
+            s[circle, ANGLE] += 0.05
+            s[circle, VX] = numpy.sin(s[circle, ANGLE]) * 1.5
+            s[circle, VY] = numpy.minimum(2.0, numpy.abs(s[circle, VY]))
+
+        # Move, rounding like pygame.Rect does
+        for position, speed in ((X, VX), (Y, VY)):
+            moved = s[:, position] + s[:, speed]
+            s[:, position] = numpy.trunc(moved + numpy.copysign(0.5, moved))
+
+        off_screen = ((s[:, Y] > SCREEN_HEIGHT + 10) | (s[:, X] < -25) |
+                      (s[:, X] + s[:, WIDTH] > SCREEN_WIDTH + 25))
+        return flapped.tolist(), numpy.flatnonzero(off_screen).tolist()
+
+    def _step_python(self):
+        """Row-by-row step with the same results as _step_numpy"""
+        flapped = []
+        respawn = []
+        for index, row in enumerate(self.state):
+            row[TIMER] += 1
+
+            row[WING_TIMER] += 1
+            if row[WING_TIMER] >= row[WING_DELAY]:
+                row[WING_TIMER] = 0
+                row[WING_STATE] = 2 if row[WING_STATE] == 1 else 1
+                flapped.append(index)
+
+            pattern = row[PATTERN]
+            if pattern == PATTERN_ZIGZAG:
+                if row[TIMER] % 30 < 15:
+                    row[VX] = min(1.5, abs(row[VX]))
+                else:
+                    row[VX] = max(-1.5, -abs(row[VX]))
+            elif pattern == PATTERN_CIRCLE:
+                row[ANGLE] += 0.05
+                row[VX] = math.sin(row[ANGLE]) * 1.5
+                row[VY] = min(2.0, abs(row[VY]))
+
+            row[X] = _round(row[X] + row[VX])
+            row[Y] = _round(row[Y] + row[VY])
+
+            if (row[Y] > SCREEN_HEIGHT + 10 or row[X] < -25 or
+                    row[X] + row[WIDTH] > SCREEN_WIDTH + 25):
+                respawn.append(index)
+        return flapped, respawn
+
+
+class SwarmGroup(pygame.sprite.Group):
+    """Sprite group that hands its bees to a Swarm while they are members"""
+    def __init__(self, swarm, *sprites):
+        self.swarm = swarm
+        super(SwarmGroup, self).__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super(SwarmGroup, self).add_internal(sprite)
+        if sprite.swarm is None:
+            self.swarm.add(sprite)
+
+    def remove_internal(self, sprite):
+        super(SwarmGroup, self).remove_internal(sprite)
+        if sprite.swarm is self.swarm:
+            self.swarm.remove(sprite)
@@ -0,0 +1,102 @@
+"""
+Timer wheel
+
+Frame-based scheduler for hit flashes, cooldowns and other delayed actions.
+Timers are filed in a ring of slots by the tick they are due on, so advance()
+only looks at one slot per tick however many timers are pending. Timers
+further away than one turn of the wheel stay in their slot until their turn
+comes round. Unlike pygame.time.set_timer, nothing goes through the event
+queue and any number of timers can run at once.
+"""
+from src.utils.constants import FPS
+
+# Slots in the wheel; delays up to this many ticks are found without rescanning
+DEFAULT_SLOTS = 256
+
+
+def frames_for(ms):
+    """Convert a duration in milliseconds to a whole number of frames (at least 1)"""
+    return max(1, int(round(ms * FPS / 1000.0)))
+
+
+class Timer:
+    """A scheduled callback; keep it to cancel the callback"""
+    __slots__ = ('due', 'callback', 'args', 'interval', 'cancelled')
+
+    def __init__(self, due, callback, args, interval):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop the callback from running (again)"""
+        self.cancelled = True
+
+
+class TimerWheel:
+    """Hashed timing wheel advanced once per game tick
+
+    Args:
+        slots: Number of slots in the wheel
+    """
+    def __init__(self, slots=DEFAULT_SLOTS):
+        self.slots = [[] for _ in range(slots)]
+        self.tick = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def schedule(self, delay, callback, *args, interval=None):
+        """Run callback(*args) after delay ticks
+
+        Args:
+            delay: Ticks to wait (at least 1)
+            callback: Function to call
+            interval: Repeat every interval ticks until cancelled
+
+        Returns:
+            The Timer, for cancelling
+        """
+        timer = Timer(self.tick + max(1, int(delay)), callback, args, interval)
+        self._file(timer)
+        return timer
+
+    def _file(self, timer):
+        self.slots[timer.due % len(self.slots)].append(timer)
+        self.count += 1
+
+    def advance(self):
+        """Move on one tick and run the callbacks that are due"""
+        self.tick += 1
+        slot = self.slots[self.tick % len(self.slots)]
+        if not slot:
+            return
+
+        due = []
+        waiting = []
+        for timer in slot:
+            if timer.cancelled:
+                self.count -= 1
+            elif timer.due <= self.tick:
+                due.append(timer)
+            else:
+                waiting.append(timer)
+        slot[:] = waiting
+        self.count -= len(due)
+
+        for timer in due:
+            if timer.cancelled:
+                continue  # Cancelled by an earlier callback this tick
+            timer.callback(*timer.args)
+            if timer.interval and not timer.cancelled:
+                timer.due = self.tick + max(1, int(timer.interval))
+                self._file(timer)
+
+    def clear(self):
+        """Drop every pending timer"""
+        for slot in self.slots:
+            slot.clear()
+        self.count = 0
@@ -5,9 +5,49 @@ import os
 import argparse
 import platform
 import logging
+from src.utils import hotlog
 
-def parse_args():
-    """Parse command line arguments"""
+# Entity kinds and options understood by --stress
+STRESS_KINDS = ('bees', 'bullets', 'missiles', 'powerups')
+STRESS_CURVES = ('instant', 'linear', 'quadratic', 'step')
+DEFAULT_STRESS_SPEC = 'bees=1000,bullets=500,missiles=50,powerups=100'
+
+def parse_stress_spec(spec):
+    """Parse a --stress spec such as 'bees=2000,bullets=500,curve=linear,ramp=30'
+
+    Returns a dict of keyword arguments for StressConfig.
+    """
+    options = {}
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        key, sep, value = item.partition('=')
+        key = key.strip()
+        value = value.strip()
+        if not sep:
+            raise argparse.ArgumentTypeError("expected key=value, got '%s'" % item)
+        try:
+            if key in STRESS_KINDS or key == 'level':
+                options[key] = int(value)
+                if options[key] < 0:
+                    raise ValueError(value)
+            elif key == 'ramp':
+                options['ramp_seconds'] = float(value)
+                if options['ramp_seconds'] < 0:
+                    raise ValueError(value)
+            elif key == 'curve':
+                if value not in STRESS_CURVES:
+                    raise ValueError(value)
+                options['curve'] = value
+            else:
+                raise argparse.ArgumentTypeError("unknown stress option '%s'" % key)
+        except ValueError:
+            raise argparse.ArgumentTypeError("invalid value for %s: '%s'" % (key, value))
+    return options
+
+def parse_args(argv=None):
+    """Parse command line arguments (sys.argv when argv is None)"""
     parser = argparse.ArgumentParser(description='Retro Bee Shooter Game')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--debug-level', type=int, choices=[1, 2, 3], default=1,
@@ -16,7 +56,16 @@ def parse_args():
     parser.add_argument('--no-sound', action='store_true', help='Disable sound')
     parser.add_argument('--platform', choices=['windows', 'linux', 'macos', 'wsl'],
                         help='Override platform detection')
-    return parser.parse_args()
+    parser.add_argument('--stress', nargs='?', const=DEFAULT_STRESS_SPEC, type=parse_stress_spec,
+                        metavar='SPEC',
+                        help='Stress-test mode, e.g. bees=2000,bullets=500,missiles=50,powerups=100,'
+                             'curve=linear,ramp=30,level=3 (curves: %s)' % ', '.join(STRESS_CURVES))
+    parser.add_argument('--precise-collisions', action='store_true',
+                        help='Confirm collisions against the sprites\' opaque pixels instead of their rectangles')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Report startup phase times once loading finishes, then exit '
+                             '(exit status 1 when over the startup budget)')
+    return parser.parse_args(argv)
 
 def detect_platform():
     """Detect the current platform"""
@@ -57,6 +106,10 @@ def setup_logging(args):
         ]
     )
 
+    # Per-frame messages are rate limited except at the most verbose level
+    if args.debug and args.debug_level == 3:
+        hotlog.configure(rate_limit=None)
+
     logger = logging.getLogger('bee_shooter')
     logger.info("Game starting with debug=%s, level=%s", args.debug, args.debug_level)
     
@@ -46,6 +46,3 @@ MISSILE_LEVEL_1 = 1
 MISSILE_LEVEL_2 = 2
 MISSILE_LEVEL_3 = 3
 MISSILE_LEVEL_4 = 4
-
-# Level thresholds
-LEVEL_THRESHOLDS = [10000, 20000, 50000]
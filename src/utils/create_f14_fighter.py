@@ -5,9 +5,6 @@ import os
 import pygame
 import math
 
-# Initialize pygame
-pygame.init()
-
 # Constants
 WIDTH = 80
 HEIGHT = 60
@@ -141,5 +138,7 @@ def create_f14_fighter():
     return surface
 
 if __name__ == "__main__":
+    # Initialize pygame only when run as a script, importing has no side effects
+    pygame.init()
     create_f14_fighter()
     pygame.quit()
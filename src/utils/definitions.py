@@ -0,0 +1,131 @@
+"""
+Game definitions
+
+Bee, boss and level stats are read once at startup from
+assets/data/definitions.json into immutable records, so balance can be tuned
+without code changes. Colors are constant names (e.g. "YELLOW") or [r, g, b]
+lists. The records are read-only: namedtuples with mappingproxy dicts.
+"""
+import os
+import json
+import logging
+from collections import namedtuple
+from types import MappingProxyType
+from src.utils import constants
+
+logger = logging.getLogger('bee_shooter.definitions')
+
+DEFINITIONS_PATH = os.path.join('assets', 'data', 'definitions.json')
+
+# Movement patterns implemented by Bee and Boss
+BEE_MOVEMENT_PATTERNS = ('straight', 'zigzag', 'circle')
+BOSS_ATTACK_PATTERNS = ('circle', 'zigzag', 'swarm')
+
+BeeRecord = namedtuple('BeeRecord', ['level', 'name', 'health', 'speed_factor', 'points', 'color', 'size',
+                                     'drop_chance', 'drop_weights', 'movement_pattern', 'wing_delay'])
+BossRecord = namedtuple('BossRecord', ['level', 'name', 'health', 'speed', 'points', 'color', 'size',
+                                       'attack_pattern', 'attack_cooldown'])
+LevelRecord = namedtuple('LevelRecord', ['level', 'boss_threshold', 'bee_weights'])
+Definitions = namedtuple('Definitions', ['bees', 'bosses', 'levels', 'random_bee_weights',
+                                         'random_powerup_weights'])
+
+
+def _color(value):
+    """Resolve a constant name or [r, g, b] list to a color tuple"""
+    if isinstance(value, str):
+        color = getattr(constants, value, None)
+        if not isinstance(color, tuple):
+            raise ValueError("unknown color '%s'" % value)
+        return color
+    return tuple(value)
+
+
+def _level_weights(weights):
+    """Weights keyed by bee level; JSON object keys are strings"""
+    return MappingProxyType({int(level): weight for level, weight in weights.items()})
+
+
+def parse_definitions(data):
+    """Build the records from parsed JSON data
+
+    Raises:
+        ValueError: If a field is missing or has an invalid value
+    """
+    try:
+        default_drops = MappingProxyType(dict(data['drop_weights']))
+        bees = {}
+        for entry in data['bees']:
+            drops = entry.get('drop_weights')
+            bees[entry['level']] = BeeRecord(
+                level=entry['level'], name=entry['name'], health=entry['health'],
+                speed_factor=float(entry['speed_factor']), points=entry['points'],
+                color=_color(entry['color']), size=float(entry['size']),
+                drop_chance=float(entry['drop_chance']),
+                drop_weights=default_drops if drops is None else MappingProxyType(dict(drops)),
+                movement_pattern=entry.get('movement_pattern', 'straight'),
+                wing_delay=entry.get('wing_delay', 5))
+
+        bosses = {}
+        for entry in data['bosses']:
+            bosses[entry['level']] = BossRecord(
+                level=entry['level'], name=entry['name'], health=entry['health'], speed=entry['speed'],
+                points=entry['points'], color=_color(entry['color']), size=entry['size'],
+                attack_pattern=entry['attack_pattern'], attack_cooldown=entry['attack_cooldown'])
+
+        levels = tuple(LevelRecord(level=entry['level'], boss_threshold=entry['boss_threshold'],
+                                   bee_weights=_level_weights(entry['bee_weights']))
+                       for entry in sorted(data['levels'], key=lambda entry: entry['level']))
+
+        definitions = Definitions(
+            bees=MappingProxyType(bees),
+            bosses=MappingProxyType(bosses),
+            levels=levels,
+            random_bee_weights=_level_weights(data['random_bee_weights']),
+            random_powerup_weights=MappingProxyType(dict(data['random_powerup_weights'])))
+    except KeyError as e:
+        raise ValueError("missing field %s" % e)
+    except (TypeError, AttributeError) as e:
+        raise ValueError(str(e))
+
+    for bee in definitions.bees.values():
+        if bee.movement_pattern not in BEE_MOVEMENT_PATTERNS:
+            raise ValueError("bee level %d has unknown movement pattern '%s'" % (bee.level, bee.movement_pattern))
+    for boss in definitions.bosses.values():
+        if boss.attack_pattern not in BOSS_ATTACK_PATTERNS:
+            raise ValueError("boss level %d has unknown attack pattern '%s'" % (boss.level, boss.attack_pattern))
+
+    # Every level needs a boss, and every bee mix may only name defined bees
+    for level in definitions.levels:
+        if level.level not in definitions.bosses:
+            raise ValueError("level %d has no boss" % level.level)
+        for bee_level in level.bee_weights:
+            if bee_level not in definitions.bees:
+                raise ValueError("level %d spawns undefined bee level %d" % (level.level, bee_level))
+    for bee_level in definitions.random_bee_weights:
+        if bee_level not in definitions.bees:
+            raise ValueError("random bee weights name undefined bee level %d" % bee_level)
+    return definitions
+
+
+def load_definitions(path=DEFINITIONS_PATH):
+    """Read and parse the definitions file
+
+    Raises:
+        ValueError: If the file is missing or invalid
+    """
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        definitions = parse_definitions(data)
+    except (OSError, ValueError) as e:
+        raise ValueError("Invalid game definitions in %s: %s" % (path, e))
+    logger.debug("Loaded %d bee, %d boss and %d level definitions from %s",
+                 len(definitions.bees), len(definitions.bosses), len(definitions.levels), path)
+    return definitions
+
+
+# Parsed once, at first import
+DEFINITIONS = load_definitions()
+
+# Score at which each level's boss appears, by level order
+LEVEL_THRESHOLDS = [level.boss_threshold for level in DEFINITIONS.levels]
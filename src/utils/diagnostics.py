@@ -0,0 +1,168 @@
+"""
+Runtime diagnostics
+
+Counts Surface allocations per subsystem, tracks garbage collector runs and
+pause times through gc.callbacks and samples tracemalloc's top allocators on
+demand. The counters are cheap enough to stay on in normal play.
+"""
+import gc
+import json
+import time
+import logging
+import tracemalloc
+from collections import Counter
+
+logger = logging.getLogger('bee_shooter.diagnostics')
+
+# Surfaces allocated since the last reset, per subsystem
+surface_counts = Counter()
+
+# Surfaces allocated during the frame in progress and the last finished frame
+frame_surface_counts = Counter()
+last_frame_surface_counts = Counter()
+
+# Highest per-frame count seen for each subsystem
+peak_frame_surface_counts = Counter()
+
+# Number of finished frames since the last reset
+frames = 0
+
+# Garbage collector statistics gathered by the gc callback
+gc_stats = {
+    'collections': [0, 0, 0],
+    'collected': 0,
+    'total_pause_ms': 0.0,
+    'max_pause_ms': 0.0,
+    'last_pause_ms': 0.0,
+}
+_gc_start = None
+
+# Number of allocators reported by sample_allocations()
+TOP_ALLOCATORS = 15
+
+
+def count_surface(subsystem, count=1):
+    """Record Surface allocations made by a subsystem
+
+    Args:
+        subsystem: Short name such as 'bee_image' or 'bullet'
+        count: Number of Surfaces allocated
+    """
+    surface_counts[subsystem] += count
+    frame_surface_counts[subsystem] += count
+
+
+def end_frame():
+    """Close the per-frame allocation window, called once per game loop iteration"""
+    global frames, frame_surface_counts, last_frame_surface_counts
+
+    frames += 1
+    for subsystem, count in frame_surface_counts.items():
+        if count > peak_frame_surface_counts[subsystem]:
+            peak_frame_surface_counts[subsystem] = count
+
+    # Swap the counters instead of copying them every frame
+    last_frame_surface_counts, frame_surface_counts = frame_surface_counts, last_frame_surface_counts
+    frame_surface_counts.clear()
+
+
+def _gc_callback(phase, info):
+    """Time each collection and count it by generation"""
+    global _gc_start
+
+    if phase == 'start':
+        _gc_start = time.perf_counter()
+    elif _gc_start is not None:
+        pause = (time.perf_counter() - _gc_start) * 1000.0
+        _gc_start = None
+        gc_stats['collections'][info['generation']] += 1
+        gc_stats['collected'] += info['collected']
+        gc_stats['total_pause_ms'] += pause
+        gc_stats['last_pause_ms'] = pause
+        if pause > gc_stats['max_pause_ms']:
+            gc_stats['max_pause_ms'] = pause
+
+
+def install():
+    """Start tracking garbage collector pauses (safe to call more than once)"""
+    if _gc_callback not in gc.callbacks:
+        gc.callbacks.append(_gc_callback)
+
+
+def uninstall():
+    """Stop tracking garbage collector pauses"""
+    if _gc_callback in gc.callbacks:
+        gc.callbacks.remove(_gc_callback)
+
+
+def reset():
+    """Clear all counters, e.g. at the start of a measured run"""
+    global frames
+
+    surface_counts.clear()
+    frame_surface_counts.clear()
+    last_frame_surface_counts.clear()
+    peak_frame_surface_counts.clear()
+    frames = 0
+    gc_stats['collections'] = [0, 0, 0]
+    gc_stats['collected'] = 0
+    gc_stats['total_pause_ms'] = 0.0
+    gc_stats['max_pause_ms'] = 0.0
+    gc_stats['last_pause_ms'] = 0.0
+
+
+def sample_allocations(limit=TOP_ALLOCATORS):
+    """Return the top allocators by live size, grouped by source line
+
+    Tracing is started on the first call, which therefore returns an empty list;
+    later calls report everything allocated and still alive since then.
+    """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        logger.info("tracemalloc started, sample again to see top allocators")
+        return []
+
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+
+    allocators = []
+    for stat in snapshot.statistics('lineno')[:limit]:
+        frame = stat.traceback[0]
+        allocators.append({
+            'location': "%s:%d" % (frame.filename, frame.lineno),
+            'size_kb': stat.size / 1024.0,
+            'count': stat.count,
+        })
+    return allocators
+
+
+def snapshot():
+    """Return the current counters as a JSON-serializable dict"""
+    return {
+        'frames': frames,
+        'surfaces_total': dict(surface_counts),
+        'surfaces_per_frame': {subsystem: count / frames for subsystem, count in surface_counts.items()}
+                              if frames else {},
+        'surfaces_peak_frame': dict(peak_frame_surface_counts),
+        'surfaces_last_frame': dict(last_frame_surface_counts),
+        'gc': {
+            'collections': list(gc_stats['collections']),
+            'collected': gc_stats['collected'],
+            'total_pause_ms': gc_stats['total_pause_ms'],
+            'max_pause_ms': gc_stats['max_pause_ms'],
+        },
+    }
+
+
+def export(path, allocators=None):
+    """Write a snapshot, plus sampled allocators if given, to a JSON file"""
+    report = snapshot()
+    if allocators is not None:
+        report['top_allocators'] = allocators
+
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    logger.info("Diagnostics written to %s", path)
+    return report
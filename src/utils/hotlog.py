@@ -0,0 +1,131 @@
+"""
+Hot-path logging
+
+Logging for code that runs every frame for every entity. Messages are kept
+unformatted in a shared ring buffer and only formatted when the underlying
+logger is enabled for their level, at most a few times per second per call
+site. The ring buffer is written out when the game crashes, so recent context
+is available without synchronous console writes during play.
+"""
+import time
+import logging
+from collections import deque
+
+# Number of recent messages kept for crash dumps
+RING_CAPACITY = 2048
+
+# Messages forwarded to the real logger per call site per second (None: no limit)
+DEFAULT_RATE_LIMIT = 5
+
+# Record one in this many calls per call site (1 records every call)
+DEFAULT_SAMPLE_EVERY = 1
+
+# Shared ring buffer of (timestamp, logger name, level, message, args)
+_ring = deque(maxlen=RING_CAPACITY)
+
+_loggers = {}
+_settings = {
+    'rate_limit': DEFAULT_RATE_LIMIT,
+    'sample_every': DEFAULT_SAMPLE_EVERY,
+}
+
+
+class HotPathLogger:
+    """Rate-limited, sampled, lazily formatted logger for per-frame code
+
+    The message format string identifies the call site, so each distinct
+    message is rate limited and sampled on its own.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.logger = logging.getLogger(name)
+        self.sites = {}  # Message -> [calls, window start, forwarded, suppressed]
+
+    def log(self, level, msg, *args):
+        """Record a message and forward it if enabled and under the rate limit"""
+        site = self.sites.get(msg)
+        if site is None:
+            site = self.sites[msg] = [0, 0.0, 0, 0]
+
+        site[0] += 1
+        sample_every = _settings['sample_every']
+        if sample_every > 1 and site[0] % sample_every:
+            return
+
+        now = time.monotonic()
+        _ring.append((now, self.name, level, msg, args))
+
+        if not self.logger.isEnabledFor(level):
+            return
+
+        rate_limit = _settings['rate_limit']
+        if rate_limit is not None:
+            if now - site[1] >= 1.0:
+                if site[3]:
+                    self.logger.log(level, "(%d similar messages suppressed) %s", site[3], msg)
+                site[1] = now
+                site[2] = 0
+                site[3] = 0
+            if site[2] >= rate_limit:
+                site[3] += 1
+                return
+            site[2] += 1
+
+        self.logger.log(level, msg, *args)
+
+    def debug(self, msg, *args):
+        self.log(logging.DEBUG, msg, *args)
+
+    def info(self, msg, *args):
+        self.log(logging.INFO, msg, *args)
+
+    def warning(self, msg, *args):
+        self.log(logging.WARNING, msg, *args)
+
+
+def get_logger(name):
+    """Return the shared HotPathLogger for a logger name"""
+    hot_logger = _loggers.get(name)
+    if hot_logger is None:
+        hot_logger = _loggers[name] = HotPathLogger(name)
+    return hot_logger
+
+
+def configure(rate_limit=DEFAULT_RATE_LIMIT, sample_every=DEFAULT_SAMPLE_EVERY, capacity=None):
+    """Change the rate limit, sampling and ring buffer size for all hot-path loggers
+
+    Args:
+        rate_limit: Messages forwarded per call site per second (None: no limit)
+        sample_every: Record one in this many calls per call site
+        capacity: Number of messages kept in the ring buffer
+    """
+    global _ring
+
+    _settings['rate_limit'] = rate_limit
+    _settings['sample_every'] = max(1, sample_every)
+    if capacity is not None and capacity != _ring.maxlen:
+        _ring = deque(_ring, maxlen=capacity)
+
+
+def recent(limit=None):
+    """Return recent messages as formatted strings, oldest first"""
+    entries = list(_ring)
+    if limit is not None:
+        entries = entries[-limit:]
+
+    lines = []
+    for timestamp, name, level, msg, args in entries:
+        try:
+            text = msg % args if args else msg
+        except (TypeError, ValueError):
+            text = "%s %r" % (msg, args)
+        lines.append("%.3f %s %s %s" % (timestamp, logging.getLevelName(level), name, text))
+    return lines
+
+
+def dump(logger, limit=None):
+    """Write the ring buffer to a logger, e.g. after a crash"""
+    lines = recent(limit)
+    if lines:
+        logger.error("Last %d hot-path log messages:\n%s", len(lines), "\n".join(lines))
+    return len(lines)
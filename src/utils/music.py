@@ -0,0 +1,105 @@
+"""
+Music player
+
+Streams background music from disk through pygame.mixer.music instead of
+decoding whole tracks into Sounds. Tracks play as a looping playlist, each
+one fading in when it starts. The mixer has a single music stream and the
+track lengths are not known without decoding them, so tracks are not
+crossfaded: the next one fades in once the current one has ended.
+"""
+import os
+import logging
+import pygame
+
+logger = logging.getLogger('bee_shooter.music')
+
+# Directory scanned for playlist tracks, and the single track used when it is missing
+MUSIC_DIR = os.path.join('assets', 'music')
+FALLBACK_TRACK = os.path.join('assets', 'sounds', 'background_music.wav')
+MUSIC_EXTENSIONS = ('.ogg', '.mp3', '.wav', '.flac')
+
+# Fade-in time of each track (milliseconds)
+DEFAULT_FADE_MS = 2000
+
+# How often update() checks whether the current track has finished (milliseconds)
+CHECK_INTERVAL = 250
+
+
+def find_tracks(directory=MUSIC_DIR, fallback=FALLBACK_TRACK):
+    """Return the playlist: every music file in directory, sorted, or the fallback track"""
+    tracks = []
+    if os.path.isdir(directory):
+        for filename in sorted(os.listdir(directory)):
+            if filename.lower().endswith(MUSIC_EXTENSIONS):
+                tracks.append(os.path.join(directory, filename))
+    if not tracks and fallback and os.path.exists(fallback):
+        tracks.append(fallback)
+    return tracks
+
+
+class MusicPlayer:
+    """Looping playlist streamed through pygame.mixer.music
+
+    Args:
+        tracks: List of track paths
+        volume: Music volume (0.0 to 1.0)
+        fade_ms: Fade-in time of each track, and fade-out time when stopping
+    """
+    def __init__(self, tracks, volume=0.3, fade_ms=DEFAULT_FADE_MS):
+        self.tracks = list(tracks)
+        self.volume = volume
+        self.fade_ms = fade_ms
+        self.index = -1
+        self.playing = False
+        self.next_check = 0
+
+    def play(self, index=0):
+        """Start streaming a track from the playlist
+
+        A track that fails to load is dropped and the next one is tried, until
+        one plays or the playlist is empty.
+        """
+        while self.tracks:
+            self.index = index % len(self.tracks)
+            track = self.tracks[self.index]
+            try:
+                pygame.mixer.music.load(track)
+                pygame.mixer.music.set_volume(self.volume)
+                pygame.mixer.music.play(fade_ms=self.fade_ms)
+            except pygame.error as e:
+                logger.warning("Failed to play music track %s: %s", track, e)
+                # The following track moves up to this index
+                del self.tracks[self.index]
+                index = self.index
+                continue
+
+            logger.info("Playing music track %s", track)
+            self.playing = True
+            return True
+
+        logger.info("No playable music tracks found, playing without music")
+        self.playing = False
+        return False
+
+    def stop(self):
+        """Fade out and stop the playlist"""
+        if self.playing:
+            pygame.mixer.music.fadeout(self.fade_ms)
+        self.playing = False
+
+    def set_volume(self, volume):
+        self.volume = volume
+        pygame.mixer.music.set_volume(volume)
+
+    def update(self, now):
+        """Start the next track, fading in, once the current one has ended
+
+        Args:
+            now: Current time in milliseconds
+        """
+        if not self.playing or now < self.next_check:
+            return
+        self.next_check = now + CHECK_INTERVAL
+
+        if not pygame.mixer.music.get_busy():
+            self.play(self.index + 1)
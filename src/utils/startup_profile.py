@@ -0,0 +1,82 @@
+"""
+Startup profiler
+
+Records how long each startup phase takes (imports, pygame and audio init,
+asset build steps) and checks the totals against the startup budgets. Phases
+are always recorded since they only cost a perf_counter call each; the report
+is printed with --profile-startup. Import this module before anything heavy so
+its start time is close to process start.
+"""
+import time
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger('bee_shooter.startup')
+
+# Time from process start to the first frame on screen (the splash)
+FIRST_FRAME_BUDGET_MS = 750
+
+# Time from process start until every asset is loaded and the game is playable
+READY_BUDGET_MS = 4000
+
+# Reference point for all milestones
+started = time.perf_counter()
+
+# Recorded (name, seconds, thread) phases in completion order
+phases = []
+
+# Milestone name -> seconds since start
+milestones = {}
+
+
+@contextmanager
+def phase(name, thread='main'):
+    """Time the enclosed block as a startup phase"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start, thread)
+
+
+def record(name, seconds, thread='main'):
+    """Record a phase timed elsewhere, e.g. by the asset loader"""
+    phases.append((name, seconds, thread))
+
+
+def mark(name):
+    """Record a milestone such as 'first_frame' or 'ready'"""
+    if name not in milestones:
+        milestones[name] = time.perf_counter() - started
+
+
+def over_budget():
+    """Return a list of budget violation messages (empty when within budget)"""
+    violations = []
+    for name, budget in (('first_frame', FIRST_FRAME_BUDGET_MS), ('ready', READY_BUDGET_MS)):
+        if name in milestones and milestones[name] * 1000.0 > budget:
+            violations.append("%s took %.0fms (budget %dms)" % (name, milestones[name] * 1000.0, budget))
+    return violations
+
+
+def report():
+    """Return the recorded phases and milestones as a JSON-serializable dict"""
+    return {
+        'phases': [{'name': name, 'ms': seconds * 1000.0, 'thread': thread}
+                   for name, seconds, thread in phases],
+        'milestones_ms': {name: seconds * 1000.0 for name, seconds in milestones.items()},
+        'budgets_ms': {'first_frame': FIRST_FRAME_BUDGET_MS, 'ready': READY_BUDGET_MS},
+        'over_budget': over_budget(),
+    }
+
+
+def format_report():
+    """Return the report as printable lines"""
+    lines = ["Startup profile:"]
+    for name, seconds, thread in phases:
+        lines.append("  %-28s %8.1fms  %s" % (name, seconds * 1000.0, thread))
+    for name, seconds in sorted(milestones.items(), key=lambda item: item[1]):
+        lines.append("  %-28s %8.1fms  since start" % ("-> " + name, seconds * 1000.0))
+    for violation in over_budget():
+        lines.append("  OVER BUDGET: " + violation)
+    return lines
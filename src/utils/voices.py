@@ -0,0 +1,148 @@
+"""
+Voice manager
+
+Plays sound effects on a fixed set of mixer channels ("voices"). Requests made
+during a frame are collected and played together by flush(): duplicate
+triggers of the same sound are coalesced into one louder voice, higher
+priority sounds are placed first, and when no voice is free the least
+important one (lowest priority, then quietest, then oldest) is stolen.
+"""
+import math
+import logging
+
+logger = logging.getLogger('bee_shooter.voices')
+
+# Number of mixer channels used for sound effects
+MAX_VOICES = 16
+
+# Higher priority sounds take voices from lower priority ones
+SOUND_PRIORITIES = {
+    'game_over': 100,
+    'bomb': 80,
+    'powerup': 60,
+    'explosion': 50,
+    'missile': 40,
+    'shoot': 10,
+}
+DEFAULT_PRIORITY = 50
+
+# Most voices a single sound may use at once; further triggers restart its oldest voice
+SOUND_MAX_VOICES = {
+    'shoot': 6,
+    'explosion': 6,
+    'missile': 4,
+    'powerup': 3,
+    'bomb': 2,
+    'game_over': 1,
+}
+DEFAULT_MAX_VOICES = 4
+
+# Extra loudness per doubling of coalesced triggers (ten triggers are about 2.7x louder)
+COALESCE_GAIN = 0.5
+
+
+class Voice:
+    """A mixer channel and what it was last asked to play"""
+    def __init__(self, channel):
+        self.channel = channel
+        self.name = None
+        self.priority = 0
+        self.volume = None  # Volume last set on the channel
+        self.started = 0
+
+
+class VoiceManager:
+    """Allocate effect voices by priority, with per-frame coalescing
+
+    Args:
+        channels: pygame.mixer.Channel objects reserved for effects
+        priorities: Dict of sound name -> priority
+        max_voices: Dict of sound name -> most concurrent voices
+    """
+    def __init__(self, channels, priorities=None, max_voices=None):
+        self.voices = [Voice(channel) for channel in channels]
+        self.priorities = dict(SOUND_PRIORITIES if priorities is None else priorities)
+        self.max_voices = dict(SOUND_MAX_VOICES if max_voices is None else max_voices)
+        self.pending = {}  # Sound name -> [sound, loudest requested volume, trigger count, fade-in ms]
+        self.stats = {'requested': 0, 'coalesced': 0, 'played': 0, 'stolen': 0, 'dropped': 0}
+
+    def request(self, name, sound, volume, fade_ms=0):
+        """Ask for a sound to be played at the next flush()"""
+        self.stats['requested'] += 1
+        entry = self.pending.get(name)
+        if entry is None:
+            self.pending[name] = [sound, volume, 1, fade_ms]
+        else:
+            self.stats['coalesced'] += 1
+            if volume > entry[1]:
+                entry[1] = volume
+            entry[2] += 1
+
+    def flush(self, now):
+        """Play this frame's requests, highest priority first
+
+        Args:
+            now: Current time in milliseconds
+        """
+        if not self.pending:
+            return
+
+        requests = sorted(self.pending.items(),
+                          key=lambda item: self.priorities.get(item[0], DEFAULT_PRIORITY), reverse=True)
+        self.pending.clear()
+
+        for name, (sound, volume, count, fade_ms) in requests:
+            if count > 1:
+                volume = min(1.0, volume * (1.0 + COALESCE_GAIN * math.log2(count)))
+
+            priority = self.priorities.get(name, DEFAULT_PRIORITY)
+            voice = self.allocate(name, priority)
+            if voice is None:
+                self.stats['dropped'] += 1
+                continue
+
+            if voice.volume != volume:
+                voice.channel.set_volume(volume)
+                voice.volume = volume
+            voice.channel.play(sound, fade_ms=fade_ms)
+            voice.name = name
+            voice.priority = priority
+            voice.started = now
+            self.stats['played'] += 1
+
+    def allocate(self, name, priority):
+        """Find a voice for a sound, or None if everything playing matters more"""
+        free = None
+        own_count = 0
+        own_oldest = None
+        victim = None
+
+        for voice in self.voices:
+            if not voice.channel.get_busy():
+                if free is None:
+                    free = voice
+                continue
+            if voice.name == name:
+                own_count += 1
+                if own_oldest is None or voice.started < own_oldest.started:
+                    own_oldest = voice
+            if victim is None or (voice.priority, voice.volume, voice.started) < \
+                    (victim.priority, victim.volume, victim.started):
+                victim = voice
+
+        if own_count >= self.max_voices.get(name, DEFAULT_MAX_VOICES):
+            # Restart this sound's oldest voice rather than taking another one
+            return own_oldest
+        if free is not None:
+            return free
+        if victim is not None and victim.priority <= priority:
+            self.stats['stolen'] += 1
+            logger.debug("Voice playing %s stolen for %s", victim.name, name)
+            return victim
+        return None
+
+    def stop_all(self):
+        """Stop every effect voice and forget pending requests"""
+        self.pending.clear()
+        for voice in self.voices:
+            voice.channel.stop()